@@ -0,0 +1,57 @@
+"""Замер памяти на один товар (tracemalloc).
+
+Запуск:
+    python bench_week2.py            # 1M и 10M товаров
+    python bench_week2.py 100000     # произвольные размеры
+
+10M прежних товаров занимают около 3 ГБ, и столько же требуют трассы
+tracemalloc; при меньшем объеме памяти размеры задаются явно.
+"""
+import sys
+import tracemalloc
+from typing import Union
+
+from week2 import Product
+
+# Хранятся в байтах: decode() создает новую строку, как при чтении из файла
+STORES = [s.encode() for s in ("Озон", "Эльдорадо", "Литрес", "Wildberries", "М.Видео")]
+NAMES = [s.encode() for s in ("Книга", "Мышь", "Клавиатура", "Монитор", "Наушники")]
+
+
+class LegacyProduct:
+    """Прежнее представление товара (обычный объект с __dict__) для сравнения"""
+
+    def __init__(self, name: str, store: str, price: Union[int, float]) -> None:
+        self.__name = name
+        self.__store = store
+        self.__price = price
+
+
+def bytes_per_product(cls: type, count: int) -> float:
+    """
+    Назначение:
+        Подсчет памяти, занимаемой одним товаром
+
+    Параметры:
+        cls: Класс товара
+        count: Количество создаваемых товаров
+
+    Результат:
+        Среднее количество байт на товар
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [cls(NAMES[i % 5].decode(), STORES[i % 5].decode(), 100 + i % 1000)
+             for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000]
+    for size in sizes:
+        for cls in (LegacyProduct, Product):
+            print(f"{cls.__name__:>14} x {size:>10,}: "
+                  f"{bytes_per_product(cls, size):.1f} байт/товар")
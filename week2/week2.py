@@ -1,14 +1,21 @@
-from typing import List, Literal, Union
+import sys
+from typing import Any, List, Literal, Union
 
 
 class Product:
     """Класс для представления товара.
+
+    Объект неизменяемый и хешируемый, хранится в __slots__ без __dict__.
+    Названия товаров и магазинов интернируются, поэтому повторяющиеся
+    строки ("Озон", "Эльдорадо") хранятся в памяти в одном экземпляре.
     
     Attributes:
         __name: Название товара
         __store: Название магазина
         __price: Цена товара в рублях
     """
+
+    __slots__ = ('__name', '__store', '__price')
     
     def __init__(self, name: str, store: str, price: Union[int, float]) -> None:
         """
@@ -20,9 +27,31 @@ class Product:
             store: Название магазина
             price: Стоимость товара (целое или дробное число)
         """
-        self.__name = name
-        self.__store = store
-        self.__price = price
+        set_attr = object.__setattr__
+        set_attr(self, '_Product__name', sys.intern(name))
+        set_attr(self, '_Product__store', sys.intern(store))
+        set_attr(self, '_Product__price', price)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """
+        Назначение:
+            Запрет изменения атрибутов (товар неизменяемый)
+        """
+        raise AttributeError("Товар неизменяемый")
+
+    def __delattr__(self, key: str) -> None:
+        """
+        Назначение:
+            Запрет удаления атрибутов (товар неизменяемый)
+        """
+        raise AttributeError("Товар неизменяемый")
+
+    def __reduce__(self) -> tuple:
+        """
+        Назначение:
+            Поддержка pickle/copy для неизменяемого объекта
+        """
+        return (Product, (self.__name, self.__store, self.__price))
 
     @property
     def name(self) -> str:
@@ -87,6 +116,27 @@ class Product:
         """
         return self.__add__(other)
 
+    def __eq__(self, other: object) -> bool:
+        """
+        Назначение:
+            Сравнение товаров по названию, магазину и цене
+            
+        Результат:
+            True если все поля совпадают
+        """
+        if not isinstance(other, Product):
+            return NotImplemented
+        return (self.__name == other.__name
+                and self.__store == other.__store
+                and self.__price == other.__price)
+
+    def __hash__(self) -> int:
+        """
+        Назначение:
+            Хеш товара (позволяет использовать товар в set и как ключ dict)
+        """
+        return hash((self.__name, self.__store, self.__price))
+
     def __str__(self) -> str:
         """
         Назначение:
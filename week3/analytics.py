@@ -0,0 +1,350 @@
+"""Потоковая аналитика продаж пиццерии.
+
+Компонент получает события "заказ выполнен" и поддерживает агрегаты
+в ограниченной памяти, не обращаясь к истории заказов:
+
+- скользящее окно (например, выручка за последний час) - кольцо из
+  корзин фиксированной ширины с текущими суммами;
+- фиксированные (tumbling) окна - итоги по часам за последние сутки;
+- самые продаваемые пиццы за день - алгоритм Space-Saving
+  (приближенный подсчет частых элементов в k счетчиках);
+- квантили стоимости заказа - логарифмическая гистограмма
+  с заданной относительной точностью (в духе DDSketch).
+
+Время задается в секундах (по умолчанию time.time()); окна
+выравниваются по началу эпохи, сутки - по UTC.
+"""
+import heapq
+import math
+import threading
+import time
+from collections import deque
+
+
+class SlidingWindow:
+    """Количество и сумма значений за последние window секунд
+
+    Окно разбито на buckets корзин; устаревшие корзины вычитаются из
+    текущих сумм при сдвиге времени, поэтому запрос выполняется за O(1)
+    (амортизированно), а точность границы окна - ширина корзины.
+    """
+
+    def __init__(self, window: float = 3600, buckets: int = 60):
+        if window <= 0 or buckets < 1:
+            raise ValueError("Неверные параметры окна")
+        self.window = window
+        self.width = window / buckets
+        self._ids = [None] * buckets
+        self._counts = [0] * buckets
+        self._sums = [0] * buckets
+        self._head = None  # номер последней корзины
+        self.count = 0
+        self.total = 0
+
+    def add(self, timestamp: float, value=0):
+        """Учет значения в момент timestamp (запоздавшие события вне окна отбрасываются)"""
+        index = int(timestamp // self.width)
+        self.advance(timestamp)
+        if index <= self._head - len(self._ids):
+            return
+        slot = index % len(self._ids)
+        if self._ids[slot] != index:
+            self._ids[slot] = index
+            self._counts[slot] = 0
+            self._sums[slot] = 0
+        self._counts[slot] += 1
+        self._sums[slot] += value
+        self.count += 1
+        self.total += value
+
+    def advance(self, now: float):
+        """Сдвиг окна к моменту now: вычитание устаревших корзин"""
+        index = int(now // self.width)
+        head = self._head
+        if head is not None and index <= head:
+            return
+        size = len(self._ids)
+        if head is None or index - head >= size:
+            self._ids = [None] * size
+            self._counts = [0] * size
+            self._sums = [0] * size
+            self.count = 0
+            self.total = 0
+        else:
+            for expired in range(head + 1, index + 1):
+                slot = expired % size
+                if self._ids[slot] is not None:
+                    self.count -= self._counts[slot]
+                    self.total -= self._sums[slot]
+                    self._ids[slot] = None
+                    self._counts[slot] = 0
+                    self._sums[slot] = 0
+        self._head = index
+
+
+class TumblingWindows:
+    """Итоги по непересекающимся окнам длиной size секунд (последние keep окон)"""
+
+    def __init__(self, size: float = 3600, keep: int = 24):
+        self.size = size
+        self._windows = deque(maxlen=keep)  # [начало окна, количество, сумма]
+
+    def add(self, timestamp: float, value=0):
+        """Учет значения в окне, содержащем timestamp"""
+        start = timestamp // self.size * self.size
+        windows = self._windows
+        if windows and windows[-1][0] == start:
+            window = windows[-1]
+        elif not windows or windows[-1][0] < start:
+            window = [start, 0, 0]
+            windows.append(window)
+        else:
+            # Запоздавшее событие: ищем его окно среди хранимых
+            for window in reversed(windows):
+                if window[0] == start:
+                    break
+            else:
+                return
+        window[1] += 1
+        window[2] += value
+
+    def windows(self) -> list:
+        """Список (начало окна, количество, сумма) от старых к новым"""
+        return [tuple(window) for window in self._windows]
+
+
+class SpaceSaving:
+    """Приближенный подсчет самых частых элементов (Space-Saving)
+
+    Хранится не более capacity счетчиков. Новый элемент при заполнении
+    вытесняет элемент с наименьшим счетчиком и наследует его значение,
+    поэтому оценка завышена не более чем на error. Любой элемент
+    с частотой больше total / capacity гарантированно присутствует.
+    """
+
+    def __init__(self, capacity: int = 64):
+        if capacity < 1:
+            raise ValueError("Число счетчиков должно быть положительным")
+        self.capacity = capacity
+        self.total = 0
+        self._counts = {}
+        self._errors = {}
+
+    def add(self, item, weight: int = 1):
+        """Учет элемента с весом weight"""
+        counts = self._counts
+        self.total += weight
+        if item in counts:
+            counts[item] += weight
+            return
+        if len(counts) < self.capacity:
+            counts[item] = weight
+            self._errors[item] = 0
+            return
+        victim = min(counts, key=counts.get)
+        floor = counts.pop(victim)
+        del self._errors[victim]
+        counts[item] = floor + weight
+        self._errors[item] = floor
+
+    def top(self, k: int) -> list:
+        """k элементов с наибольшими оценками: (элемент, оценка, погрешность)"""
+        items = heapq.nlargest(k, self._counts.items(), key=lambda pair: pair[1])
+        return [(item, count, self._errors[item]) for item, count in items]
+
+    def clear(self):
+        self.total = 0
+        self._counts.clear()
+        self._errors.clear()
+
+
+class QuantileSketch:
+    """Квантили положительных значений с относительной погрешностью
+
+    Значение x попадает в корзину ceil(log_gamma(x)), где
+    gamma = (1 + accuracy) / (1 - accuracy); оценка квантиля отличается
+    от истинного значения не более чем на accuracy (относительно).
+    При превышении max_buckets самые младшие корзины объединяются
+    пачкой (остается около 7/8 от max_buckets), и дальше младшие
+    значения попадают в общую нижнюю корзину, поэтому сортировка
+    ключей выполняется редко, а не при каждом добавлении.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_buckets: int = 2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Точность должна быть в интервале (0, 1)")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets = {}
+        self._floor = None  # нижняя корзина после объединения младших
+        self._zeros = 0
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float):
+        """Учет значения (отрицательные значения не допускаются)"""
+        if value < 0:
+            raise ValueError("Значение не может быть отрицательным")
+        self.count += 1
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value == 0:
+            self._zeros += 1
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        if self._floor is not None and key < self._floor:
+            key = self._floor
+        buckets = self._buckets
+        buckets[key] = buckets.get(key, 0) + 1
+        if len(buckets) > self.max_buckets:
+            self._collapse()
+
+    def _collapse(self):
+        """Объединение младших корзин в одну нижнюю"""
+        buckets = self._buckets
+        keys = sorted(buckets)
+        keep = max(1, self.max_buckets - self.max_buckets // 8)
+        floor = keys[len(keys) - keep]
+        buckets[floor] += sum(buckets.pop(key) for key in keys[:len(keys) - keep])
+        self._floor = floor
+
+    def quantile(self, q: float) -> float:
+        """Оценка квантиля q (0 <= q <= 1); 0.0 при отсутствии данных"""
+        if not 0 <= q <= 1:
+            raise ValueError("Квантиль должен быть в интервале [0, 1]")
+        if self.count == 0:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self._zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if seen > rank:
+                estimate = 2 * self._gamma ** key / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+
+class SalesAnalytics:
+    """Текущие показатели продаж по потоку выполненных заказов
+
+    Все запросы выполняются за O(1) или O(k) и не зависят от числа
+    обработанных заказов. Методы потокобезопасны: события могут
+    поступать из потока кухни.
+    """
+
+    DAY = 24 * 60 * 60
+
+    def __init__(self, window: float = 3600, buckets: int = 60,
+                 tumbling: float = 3600, keep: int = 24, top_capacity: int = 64,
+                 relative_accuracy: float = 0.01, clock=time.time):
+        """
+        window/buckets - длина скользящего окна (с) и число корзин в нем,
+        tumbling/keep - длина фиксированного окна и сколько окон хранить,
+        top_capacity - число счетчиков Space-Saving, relative_accuracy -
+        точность квантилей стоимости заказа, clock - источник времени.
+        """
+        self.clock = clock
+        self.recent = SlidingWindow(window, buckets)
+        self.periods = TumblingWindows(tumbling, keep)
+        self.pizzas_today = SpaceSaving(top_capacity)
+        self.order_values = QuantileSketch(relative_accuracy)
+        self.orders = 0
+        self.revenue_total = 0
+        self.orders_today = 0
+        self.revenue_today = 0
+        self._day = None
+        self._lock = threading.Lock()
+
+    def record(self, order, timestamp: float = None):
+        """Учет выполненного заказа (Order или объект с lines и calculate_total)"""
+        self.record_sale(order.calculate_total(),
+                         ((line.pizza.name, line.quantity) for line in order.lines),
+                         timestamp)
+
+    def record_sale(self, total, items, timestamp: float = None):
+        """Учет продажи: сумма и пары (название пиццы, количество)"""
+        if timestamp is None:
+            timestamp = self.clock()
+        with self._lock:
+            self._roll_day(timestamp)
+            self.recent.add(timestamp, total)
+            self.periods.add(timestamp, total)
+            self.order_values.add(total)
+            self.orders += 1
+            self.revenue_total += total
+            self.orders_today += 1
+            self.revenue_today += total
+            for name, quantity in items:
+                self.pizzas_today.add(name, quantity)
+
+    def revenue(self, now: float = None):
+        """Выручка за последнее скользящее окно (по умолчанию - час)"""
+        with self._lock:
+            self.recent.advance(self.clock() if now is None else now)
+            return self.recent.total
+
+    def orders_in_window(self, now: float = None) -> int:
+        """Количество заказов за последнее скользящее окно"""
+        with self._lock:
+            self.recent.advance(self.clock() if now is None else now)
+            return self.recent.count
+
+    def average_order_value(self, now: float = None, today: bool = False) -> float:
+        """Средняя стоимость заказа за скользящее окно (или за день)"""
+        with self._lock:
+            if today:
+                self._roll_day(self.clock() if now is None else now)
+                count, total = self.orders_today, self.revenue_today
+            else:
+                self.recent.advance(self.clock() if now is None else now)
+                count, total = self.recent.count, self.recent.total
+        return total / count if count else 0.0
+
+    def top_pizzas(self, k: int = 3, now: float = None) -> list:
+        """k самых продаваемых пицц за день: (название, количество, погрешность)"""
+        with self._lock:
+            self._roll_day(self.clock() if now is None else now)
+            return self.pizzas_today.top(k)
+
+    def order_value_quantile(self, q: float) -> float:
+        """Квантиль стоимости заказа за все время, например 0.5 или 0.95"""
+        with self._lock:
+            return self.order_values.quantile(q)
+
+    def hourly(self) -> list:
+        """Итоги фиксированных окон: (начало окна, заказов, выручка)"""
+        with self._lock:
+            return self.periods.windows()
+
+    def snapshot(self, now: float = None) -> dict:
+        """Основные показатели одним словарем (согласованные на момент now)"""
+        now = self.clock() if now is None else now
+        with self._lock:
+            self.recent.advance(now)
+            self._roll_day(now)
+            count, total = self.recent.count, self.recent.total
+            return {
+                'revenue_window': total,
+                'orders_window': count,
+                'average_order_value': total / count if count else 0.0,
+                'top_pizzas': self.pizzas_today.top(3),
+                'revenue_today': self.revenue_today,
+                'order_value_p50': self.order_values.quantile(0.5),
+                'order_value_p95': self.order_values.quantile(0.95),
+            }
+
+    def _roll_day(self, now: float):
+        """Сброс дневных показателей при наступлении новых суток (под блокировкой)"""
+        day = int(now // self.DAY)
+        if self._day is None or day > self._day:
+            self._day = day
+            self.orders_today = 0
+            self.revenue_today = 0
+            self.pizzas_today.clear()
@@ -0,0 +1,67 @@
+"""Генератор нагрузки для пакетного приема заказов.
+
+Формирует заказы в формате JSON Lines, прогоняет их через
+ingest_orders и через Terminal.place_order по одному, выводит
+пропускную способность (заказов/с) и процентили задержки.
+
+Запуск:
+    python bench_orders.py            # 200 000 заказов
+    python bench_orders.py 1000000
+"""
+import importlib.util
+import io
+import json
+import os
+import random
+import sys
+import time
+
+from kitchen import percentile
+
+_spec = importlib.util.spec_from_file_location(
+    "pizzeria", os.path.join(os.path.dirname(os.path.abspath(__file__)), "week3.1.2.py"))
+pizzeria = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(pizzeria)
+
+
+def generate_orders(count: int, invalid_share: float = 0.01, seed: int = 0) -> list:
+    """Список строк JSON Lines со случайными заказами (часть - с ошибками)"""
+    rng = random.Random(seed)
+    keys = ["1", "2", "3", "пепперони", "барбекю", "дары моря"]
+    lines = []
+    for _ in range(count):
+        items = [rng.choice(keys) if rng.random() < 0.7
+                 else {"pizza": rng.choice(keys), "qty": rng.randint(1, 5)}
+                 for _ in range(rng.randint(1, 4))]
+        payment = 10000
+        if rng.random() < invalid_share:
+            payment = 1  # недостаточно средств
+        lines.append(json.dumps({"items": items, "payment": payment}, ensure_ascii=False) + "\n")
+    return lines
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    lines = generate_orders(count)
+    terminal = pizzeria.Terminal()
+
+    output = io.StringIO()
+    start = time.perf_counter()
+    accepted, rejected = pizzeria.ingest_orders(lines, output, terminal)
+    elapsed = time.perf_counter() - start
+    print(f"ingest_orders: {count} заказов за {elapsed:.2f} с, "
+          f"{count / elapsed:,.0f} заказов/с (принято {accepted}, отклонено {rejected})")
+
+    requests = [json.loads(line) for line in lines]
+    latencies = []
+    clock = time.perf_counter
+    for request in requests:
+        begin = clock()
+        try:
+            terminal.place_order(request["items"], request["payment"])
+        except ValueError:
+            pass
+        latencies.append(clock() - begin)
+    latencies.sort()
+    print("place_order, мкс: " + ", ".join(
+        f"p{p} {percentile(latencies, p) * 1e6:.1f}" for p in (50, 95, 99, 99.9)))
@@ -0,0 +1,134 @@
+"""Сравнение стоимости операций класса Roman с прежней реализацией.
+
+Запуск:
+    python bench_roman.py
+"""
+import importlib.util
+import os
+import random
+import re
+import tempfile
+import time
+import timeit
+import tracemalloc
+
+_spec = importlib.util.spec_from_file_location(
+    "roman", os.path.join(os.path.dirname(os.path.abspath(__file__)), "week3.1.1.py"))
+roman = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(roman)
+Roman = roman.Roman
+
+ROMAN_VALUES = {'I': 1, 'V': 5, 'X': 10, 'L': 50, 'C': 100, 'D': 500, 'M': 1000}
+INT_VALUES = [
+    (1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'),
+    (100, 'C'), (90, 'XC'), (50, 'L'), (40, 'XL'),
+    (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'), (1, 'I')
+]
+
+
+def legacy_roman_to_int(value: str) -> int:
+    """Прежний алгоритм: проверка регулярным выражением и проход по символам"""
+    pattern = r'^M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})$'
+    if re.fullmatch(pattern, value) is None:
+        raise ValueError(f"Некорректное римское число: {value}")
+    total = 0
+    prev_value = 0
+    for char in reversed(value):
+        current = ROMAN_VALUES[char]
+        total += current if current >= prev_value else -current
+        prev_value = current
+    return total
+
+
+def legacy_int_to_roman(number: int) -> str:
+    """Прежний алгоритм: жадный цикл по таблице значений"""
+    if not 1 <= number <= 3999:
+        raise ValueError("Допустимый диапазон: 1-3999")
+    result = []
+    for val, sym in INT_VALUES:
+        while number >= val:
+            result.append(sym)
+            number -= val
+    return ''.join(result)
+
+
+def per_call(func, args: list, repeat: int = 5) -> float:
+    """Минимальное время одного вызова func в наносекундах"""
+    best = min(timeit.repeat(lambda: [func(a) for a in args], number=1, repeat=repeat))
+    return best / len(args) * 1e9
+
+
+def arithmetic_throughput(pairs: list, operator: str) -> tuple[float, float]:
+    """Операций в секунду: через публичный конструктор и через оператор"""
+    public = eval(f"lambda a, b: Roman(a.value {operator} b.value)")
+    direct = eval(f"lambda a, b: a {operator} b")
+    results = []
+    for func in (public, direct):
+        best = min(timeit.repeat(lambda: [func(a, b) for a, b in pairs],
+                                 number=1, repeat=5))
+        results.append(len(pairs) / best)
+    return results[0], results[1]
+
+
+def arithmetic_peak_memory(steps: int) -> int:
+    """Пиковый прирост памяти (байт) за steps сложений и вычитаний"""
+    for number in range(1, 4000):
+        Roman(number)  # заполнение кэша экземпляров до замера
+    one = Roman(1)
+    value = one
+    tracemalloc.start()
+    for _ in range(steps):
+        value = value + one if value < 3999 else value - 3998
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def scan_throughput(megabytes: int) -> tuple[float, int]:
+    """Скорость поиска римских чисел в файле (МБ/с) и количество найденных"""
+    words = ("глава", "the", "of", "and", "часть", "reigned", "in", "war",
+             "году", "Louis", "Moscow", "Volume", "Index")
+    random.seed(0)
+    # Примерно одно римское число на тысячу слов
+    line = " ".join(random.choice(words) if random.random() > 0.001
+                    else random.choice(("XIV", "MCMXC", "IV"))
+                    for _ in range(100_000)).encode() + b"\n"
+    with tempfile.NamedTemporaryFile(suffix=".txt") as file:
+        size = 0
+        while size < megabytes * 1_000_000:
+            file.write(line)
+            size += len(line)
+        file.flush()
+        start = time.perf_counter()
+        found = sum(1 for _ in Roman.find_in_file(file.name))
+        elapsed = time.perf_counter() - start
+    return size / elapsed / 1e6, found
+
+
+def report(title: str, before: float, after: float) -> None:
+    """Вывод строки сравнения"""
+    print(f"{title:<22} до: {before:8.1f} нс  после: {after:8.1f} нс  "
+          f"ускорение: x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    numbers = list(range(1, 4000))
+    romans = [legacy_int_to_roman(n) for n in numbers]
+
+    report("int_to_roman", per_call(legacy_int_to_roman, numbers),
+           per_call(Roman.int_to_roman, numbers))
+    report("roman_to_int", per_call(legacy_roman_to_int, romans),
+           per_call(Roman.roman_to_int, romans))
+
+    pairs = [(Roman(a), Roman(b)) for a in range(63, 125) for b in range(1, 33)]
+    for operator, title in (('+', 'сложение'), ('*', 'умножение'), ('//', 'деление')):
+        before, after = arithmetic_throughput(pairs, operator)
+        print(f"{title:<22} Roman(a.value {operator} b.value): {before / 1e6:5.2f} млн оп/с  "
+              f"a {operator} b: {after / 1e6:5.2f} млн оп/с")
+    expression = "MCM + XLV * II - (X / III)"
+    parse_each_time = lambda: roman._ExpressionCompiler(expression).compile()({})
+    report("evaluate (кэш AST)", per_call(lambda _: parse_each_time(), range(20000)),
+           per_call(lambda _: Roman.evaluate(expression), range(20000)))
+    speed, found = scan_throughput(100)
+    print(f"Поиск в тексте 100 МБ: {speed:.0f} МБ/с, найдено {found}")
+    print(f"Пик памяти за 1M операций +/-: {arithmetic_peak_memory(1_000_000)} байт")
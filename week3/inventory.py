@@ -0,0 +1,227 @@
+"""Учет ингредиентов пиццерии.
+
+Рецепт каждого вида пиццы (тесто, соус, начинка) один раз переводится
+в вектор количеств ингредиентов - спецификацию (bill of materials).
+Остатки на складе хранятся вектором той же длины, поэтому резервирование
+ингредиентов под заказ - вычитание вектора потребности под блокировкой,
+а проверка доступности всего меню - одно сравнение матрицы спецификаций
+с вектором остатков.
+
+Если NumPy не установлен, используются списки и те же операции
+выполняются поэлементно.
+"""
+import numbers
+import threading
+
+try:
+    import numpy
+except ImportError:  # NumPy необязателен
+    numpy = None
+
+
+def recipe(pizza) -> dict:
+    """Ингредиенты одной пиццы: {ингредиент: количество порций}"""
+    counts = {}
+    for ingredient in (f"тесто {pizza.dough}", f"соус {pizza.sauce}", *pizza.toppings):
+        counts[ingredient] = counts.get(ingredient, 0) + 1
+    return counts
+
+
+class BillOfMaterials:
+    """Спецификации пицц меню: матрица "пицца x ингредиент"
+
+    Строится один раз для каталога; строка матрицы - вектор порций
+    ингредиентов одной пиццы.
+    """
+
+    def __init__(self, pizzas: list):
+        self.pizzas = list(pizzas)
+        recipes = [recipe(pizza) for pizza in self.pizzas]
+        ingredients = {}
+        for counts in recipes:
+            for ingredient in counts:
+                ingredients.setdefault(ingredient, len(ingredients))
+        self.ingredients = tuple(ingredients)
+        self.index = ingredients
+        # Пиццы - общие неизменяемые объекты, поэтому строку ищем по объекту
+        self._rows = {pizza: row for row, pizza in enumerate(self.pizzas)}
+        rows = [[counts.get(ingredient, 0) for ingredient in self.ingredients]
+                for counts in recipes]
+        if numpy is not None:
+            self.matrix = numpy.array(rows, dtype=numpy.int64).reshape(
+                len(rows), len(self.ingredients))
+        else:
+            self.matrix = rows
+
+    def zeros(self):
+        """Нулевой вектор ингредиентов"""
+        if numpy is not None:
+            return numpy.zeros(len(self.ingredients), dtype=numpy.int64)
+        return [0] * len(self.ingredients)
+
+    def vector(self, amounts: dict):
+        """Вектор ингредиентов по словарю {ингредиент: количество}
+
+        Ингредиенты, не входящие ни в один рецепт, пропускаются.
+        Количества - целые числа порций, иначе ValueError.
+        """
+        vector = self.zeros()
+        for ingredient, amount in amounts.items():
+            if isinstance(amount, bool) or not isinstance(amount, numbers.Integral):
+                raise ValueError(f"Количество должно быть целым: {ingredient}")
+            column = self.index.get(ingredient)
+            if column is not None:
+                vector[column] = amount
+        return vector
+
+    def demand(self, items):
+        """Потребность в ингредиентах для заказа
+
+        items - заказ (Order) или пары (пицца, количество).
+        """
+        lines = getattr(items, 'lines', None)
+        if lines is not None:
+            items = ((line.pizza, line.quantity) for line in lines)
+        counts = [0] * len(self.pizzas)
+        for pizza, quantity in items:
+            row = self._rows.get(pizza)
+            if row is None:
+                raise ValueError(f"Нет спецификации для пиццы: {pizza.name}")
+            counts[row] += quantity
+        if numpy is not None:
+            return numpy.array(counts, dtype=numpy.int64) @ self.matrix
+        vector = self.zeros()
+        for row, count in enumerate(counts):
+            if count:
+                for column, amount in enumerate(self.matrix[row]):
+                    vector[column] += amount * count
+        return vector
+
+    def row(self, pizza):
+        """Вектор ингредиентов одной пиццы"""
+        row = self._rows.get(pizza)
+        if row is None:
+            raise ValueError(f"Нет спецификации для пиццы: {pizza.name}")
+        return self.matrix[row]
+
+
+class Reservation:
+    """Ингредиенты, зарезервированные под заказ"""
+
+    __slots__ = ('demand', 'released')
+
+    def __init__(self, demand):
+        self.demand = demand
+        self.released = False
+
+
+class Inventory:
+    """Склад ингредиентов с атомарным резервированием под заказы"""
+
+    def __init__(self, bill_of_materials: BillOfMaterials, stock: dict = None):
+        """
+        bill_of_materials - спецификации пицц меню, stock - начальные
+        остатки {ингредиент: количество порций}.
+        """
+        self.bill_of_materials = bill_of_materials
+        self._stock = bill_of_materials.zeros()
+        self._lock = threading.Lock()
+        if stock:
+            self.restock(stock)
+
+    @property
+    def stock(self) -> dict:
+        """Текущие остатки {ингредиент: количество порций}"""
+        with self._lock:
+            return {ingredient: int(amount) for ingredient, amount
+                    in zip(self.bill_of_materials.ingredients, self._stock)}
+
+    def restock(self, amounts: dict):
+        """Поступление ингредиентов на склад"""
+        delivery = self.bill_of_materials.vector(amounts)
+        if any(amount < 0 for amount in amounts.values()):
+            raise ValueError("Количество не может быть отрицательным")
+        with self._lock:
+            self._add(delivery)
+
+    def reserve(self, items) -> Reservation:
+        """Резервирование ингредиентов под заказ целиком
+
+        items - заказ (Order) или пары (пицца, количество). Либо
+        списываются все ингредиенты заказа, либо (при нехватке хотя бы
+        одного) ничего; в этом случае исключение ValueError.
+        """
+        demand = self.bill_of_materials.demand(items)
+        with self._lock:
+            missing = self._missing(demand)
+            if not missing:
+                self._add(demand, -1)
+                return Reservation(demand)
+        raise ValueError(f"Недостаточно ингредиентов: {', '.join(missing)}")
+
+    def release(self, reservation: Reservation):
+        """Возврат зарезервированных ингредиентов (например, при отмене заказа)"""
+        with self._lock:
+            if reservation.released:
+                return
+            reservation.released = True
+            self._add(reservation.demand)
+
+    def can_make(self, pizza, quantity: int = 1) -> bool:
+        """Хватает ли остатков на quantity пицц"""
+        row = self.bill_of_materials.row(pizza)
+        with self._lock:
+            if numpy is not None:
+                return bool((row * quantity <= self._stock).all())
+            return all(amount * quantity <= stock
+                       for amount, stock in zip(row, self._stock))
+
+    def availability(self) -> list:
+        """Можно ли приготовить каждую пиццу меню (в порядке меню)"""
+        matrix = self.bill_of_materials.matrix
+        with self._lock:
+            if numpy is not None:
+                return (matrix <= self._stock).all(axis=1).tolist()
+            stock = list(self._stock)
+        return [all(amount <= left for amount, left in zip(row, stock)) for row in matrix]
+
+    def available(self) -> list:
+        """Пиццы меню, которые можно приготовить из текущих остатков"""
+        return [pizza for pizza, ok in zip(self.bill_of_materials.pizzas, self.availability())
+                if ok]
+
+    def portions(self) -> dict:
+        """Сколько пицц каждого вида можно приготовить из текущих остатков"""
+        bom = self.bill_of_materials
+        with self._lock:
+            stock = self._stock.copy()
+        if numpy is not None:
+            matrix = bom.matrix
+            # Ингредиенты, которых нет в рецепте, количество не ограничивают
+            limits = numpy.where(matrix > 0, stock // numpy.maximum(matrix, 1),
+                                 numpy.iinfo(numpy.int64).max)
+            counts = limits.min(axis=1).tolist() if len(bom.ingredients) else []
+        else:
+            counts = [min((left // amount for amount, left in zip(row, stock) if amount),
+                          default=0) for row in bom.matrix]
+        return {pizza.name: count for pizza, count in zip(bom.pizzas, counts)}
+
+    def _missing(self, demand) -> list:
+        """Ингредиенты, которых не хватает (под блокировкой)"""
+        ingredients = self.bill_of_materials.ingredients
+        if numpy is not None:
+            return [ingredients[column]
+                    for column in numpy.flatnonzero(demand > self._stock)]
+        return [ingredients[column] for column, (need, left)
+                in enumerate(zip(demand, self._stock)) if need > left]
+
+    def _add(self, vector, sign: int = 1):
+        """Прибавление вектора к остаткам (под блокировкой)"""
+        if numpy is not None:
+            if sign > 0:
+                self._stock += vector
+            else:
+                self._stock -= vector
+            return
+        for column, amount in enumerate(vector):
+            self._stock[column] += sign * amount
@@ -0,0 +1,242 @@
+"""Асинхронная кухня пиццерии.
+
+Каждый этап приготовления (подготовка, выпекание, нарезка, упаковка) -
+пул из заданного числа работников (например, 3 печи и 2 упаковщика),
+которые берут пиццы из своей очереди. Пицца, прошедшая этап, попадает
+в очередь следующего этапа, поэтому пиццы разных заказов и разных
+терминалов обрабатываются вперемешку, а большой заказ не задерживает
+остальные. На каждом этапе вызывается одноименный метод пиццы
+(prepare, bake, cut, pack) - хук этапа.
+"""
+import asyncio
+import inspect
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Union
+
+STAGES = ('prepare', 'bake', 'cut', 'pack')
+
+# Время этапа в секундах: число или функция от пиццы
+Duration = Union[float, Callable[[object], float]]
+
+DEFAULT_WORKERS = {'prepare': 2, 'bake': 3, 'cut': 1, 'pack': 2}
+DEFAULT_DURATIONS = {'prepare': 0.2, 'bake': 0.5, 'cut': 0.05, 'pack': 0.1}
+
+# Количество последних замеров, по которым считаются процентили
+LATENCY_WINDOW = 10000
+
+
+def percentile(values, percent: float) -> float:
+    """Процентиль выборки методом ближайшего ранга; 0.0 для пустой выборки
+
+    Значение с номером ceil(percent / 100 * n) в порядке возрастания,
+    например медиана [1, 2, 3, 4, 5] - 3. Выборка может быть
+    не отсортирована (для отсортированного списка sorted работает за O(n)).
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class StageMetrics:
+    """Метрики этапа: обработано, занятые работники, очередь и задержки"""
+
+    def __init__(self, name: str, workers: int):
+        self.name = name
+        self.workers = workers
+        self.processed = 0
+        self.busy = 0
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        # Задержка этапа: от постановки в очередь до завершения этапа
+        self.latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def percentile(self, percent: float) -> float:
+        """Процентиль задержки (в секундах) по последним замерам"""
+        return percentile(self.latencies, percent)
+
+    def snapshot(self) -> dict:
+        """Текущие значения метрик (вызывается в потоке цикла событий кухни)"""
+        return {
+            'workers': self.workers,
+            'processed': self.processed,
+            'busy': self.busy,
+            'queue_depth': self.queue_depth,
+            'max_queue_depth': self.max_queue_depth,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': max(self.latencies, default=0.0),
+        }
+
+
+class _Ticket:
+    """Заказ на кухне: сколько пицц еще не упаковано и кто ждет результат"""
+
+    __slots__ = ('order', 'remaining', 'future', 'submitted')
+
+    def __init__(self, order, future: asyncio.Future):
+        self.order = order
+        self.remaining = len(order.pizzas)
+        self.future = future
+        self.submitted = time.perf_counter()
+
+
+class Kitchen:
+    """Кухня из конвейера этапов с ограниченным числом работников"""
+
+    def __init__(self, workers: dict = None, durations: dict = None,
+                 stages: tuple = STAGES, call_hooks: bool = True,
+                 queue_size: int = 0):
+        """
+        workers - число работников по этапам, durations - время этапов
+        (секунды или функция от пиццы), call_hooks - вызывать ли методы
+        пиццы на этапах, queue_size - предельная длина очереди этапа
+        (0 - без ограничения).
+        """
+        workers = {**DEFAULT_WORKERS, **(workers or {})}
+        durations = {**DEFAULT_DURATIONS, **(durations or {})}
+        self.stages = stages
+        self.call_hooks = call_hooks
+        self.queue_size = queue_size
+        self._durations = {stage: durations.get(stage, 0.0) for stage in stages}
+        self.metrics = {stage: StageMetrics(stage, workers.get(stage, 1)) for stage in stages}
+        self.order_latencies = deque(maxlen=LATENCY_WINDOW)
+        self.orders_done = 0
+        self._queues = {}
+        self._tasks = []
+        self._loop = None
+        self._thread = None
+
+    async def start(self):
+        """Запуск работников всех этапов в текущем цикле событий"""
+        if self._tasks:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queues = {stage: asyncio.Queue(self.queue_size) for stage in self.stages}
+        for index, stage in enumerate(self.stages):
+            next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+            for _ in range(self.metrics[stage].workers):
+                self._tasks.append(asyncio.create_task(self._worker(stage, next_stage)))
+
+    async def stop(self):
+        """Остановка работников (незавершенные пиццы остаются в очередях)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def submit(self, order):
+        """Передача заказа на кухню; завершается, когда упакована последняя пицца"""
+        if not self._tasks:
+            await self.start()
+        future = self._loop.create_future()
+        ticket = _Ticket(order, future)
+        if ticket.remaining == 0:
+            future.set_result(order)
+            return await future
+        first = self.stages[0]
+        for pizza in order.pizzas:
+            await self._put(first, (pizza, ticket, time.perf_counter()))
+        return await future
+
+    def run_in_background(self):
+        """Запуск кухни в отдельном потоке со своим циклом событий"""
+        if self._thread is not None:
+            return
+        started = threading.Event()
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            started.set()
+            loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="kitchen", daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def submit_threadsafe(self, order) -> Future:
+        """Передача заказа из другого потока (например, из терминала)"""
+        if self._loop is None:
+            self.run_in_background()
+        return asyncio.run_coroutine_threadsafe(self.submit(order), self._loop)
+
+    def snapshot(self) -> dict:
+        """Метрики всех этапов и задержки заказов
+
+        Работники пополняют очереди замеров в цикле событий кухни. Если
+        кухня работает в другом потоке (run_in_background), снимок
+        строится в ее цикле событий, чтобы замеры не менялись во время
+        подсчета процентилей.
+        """
+        loop = self._loop
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if loop is not None and running is not loop and loop.is_running():
+            return asyncio.run_coroutine_threadsafe(self._snapshot_async(), loop).result()
+        return self._snapshot()
+
+    async def _snapshot_async(self) -> dict:
+        return self._snapshot()
+
+    def _snapshot(self) -> dict:
+        """Снимок метрик (в потоке цикла событий кухни)"""
+        return {
+            'stages': {stage: metrics.snapshot() for stage, metrics in self.metrics.items()},
+            'orders_done': self.orders_done,
+            'order_p50': percentile(self.order_latencies, 50),
+            'order_p95': percentile(self.order_latencies, 95),
+        }
+
+    async def _put(self, stage: str, item: tuple):
+        metrics = self.metrics[stage]
+        await self._queues[stage].put(item)
+        metrics.queue_depth = self._queues[stage].qsize()
+        if metrics.queue_depth > metrics.max_queue_depth:
+            metrics.max_queue_depth = metrics.queue_depth
+
+    async def _worker(self, stage: str, next_stage: str):
+        """Работник этапа: берет пиццу из очереди, выполняет этап, передает дальше"""
+        queue = self._queues[stage]
+        metrics = self.metrics[stage]
+        duration = self._durations[stage]
+        while True:
+            pizza, ticket, enqueued = await queue.get()
+            metrics.queue_depth = queue.qsize()
+            metrics.busy += 1
+            try:
+                seconds = duration(pizza) if callable(duration) else duration
+                if seconds > 0:
+                    await asyncio.sleep(seconds)
+                if self.call_hooks:
+                    result = getattr(pizza, stage)()
+                    if inspect.isawaitable(result):
+                        await result
+            except asyncio.CancelledError:
+                raise
+            except Exception as error:
+                if not ticket.future.done():
+                    ticket.future.set_exception(error)
+                continue
+            finally:
+                metrics.busy -= 1
+                queue.task_done()
+            now = time.perf_counter()
+            metrics.processed += 1
+            metrics.latencies.append(now - enqueued)
+            if next_stage is not None:
+                await self._put(next_stage, (pizza, ticket, now))
+                continue
+            ticket.remaining -= 1
+            if ticket.remaining == 0 and not ticket.future.done():
+                self.orders_done += 1
+                self.order_latencies.append(now - ticket.submitted)
+                ticket.future.set_result(ticket.order)
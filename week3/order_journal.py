@@ -0,0 +1,366 @@
+"""Журнал заказов с упреждающей записью (write-ahead log).
+
+События жизненного цикла заказа (создан, добавлена/удалена пицца,
+подтвержден, оплачен, выполнен, передан дальше без выполнения, отменен) дописываются в конец файла
+в компактном двоичном формате. Каждая запись - кадр:
+
+    длина данных (uint32) | crc32 (uint32) | тип (uint8) | данные
+
+Записи от всех потоков собираются фоновым потоком и сбрасываются на
+диск одной операцией write + fsync (групповая фиксация), поэтому при
+нагрузке один fsync приходится на много событий. При открытии журнал
+читается целиком, по нему восстанавливаются незавершенные заказы и
+последний номер заказа; оборванный хвост (запись, не дошедшая до диска
+при сбое) отбрасывается. Периодически журнал сжимается: в новый файл
+записывается только состояние незавершенных заказов, и он атомарно
+заменяет старый.
+"""
+import os
+import struct
+import threading
+import time
+import zlib
+
+CREATED = 1
+ITEM_ADDED = 2
+ITEM_REMOVED = 3
+CONFIRMED = 4
+PAID = 5
+EXECUTED = 6
+CANCELLED = 7
+SEQUENCE = 8
+# Оплаченный заказ передан дальше без выполнения в терминале (пакетный
+# прием): как и EXECUTED, завершает заказ, и при восстановлении он
+# повторно не выполняется
+INGESTED = 9
+
+_HEADER = struct.Struct('<IIB')
+_ORDER = struct.Struct('<I')
+_ITEM = struct.Struct('<IIB')
+_REMOVE = struct.Struct('<III')
+_PAYMENT = struct.Struct('<Id')
+_TEXT_LENGTH = struct.Struct('<H')
+
+
+class JournalOrder:
+    """Состояние незавершенного заказа, восстановленное из журнала"""
+
+    __slots__ = ('number', 'lines', 'status', 'paid')
+
+    def __init__(self, number: int):
+        self.number = number
+        # Позиции: [название пиццы, количество, модификаторы]
+        self.lines = []
+        self.status = 'open'
+        self.paid = 0.0
+
+
+class JournalState:
+    """Незавершенные заказы и последний выданный номер заказа"""
+
+    def __init__(self):
+        self.orders = {}
+        self.last_order_number = 0
+
+    def apply(self, kind: int, number: int, *data):
+        """Применение события к состоянию"""
+        if number > self.last_order_number:
+            self.last_order_number = number
+        if kind == CREATED:
+            self.orders[number] = JournalOrder(number)
+            return
+        if kind == SEQUENCE:
+            return
+        order = self.orders.get(number)
+        if order is None:
+            return
+        if kind == ITEM_ADDED:
+            name, quantity, modifiers = data
+            # Объединение одинаковых позиций, как в Order.add_pizza
+            for line in order.lines:
+                if line[0] == name and line[2] == modifiers:
+                    line[1] += quantity
+                    break
+            else:
+                order.lines.append([name, quantity, modifiers])
+        elif kind == ITEM_REMOVED:
+            index, quantity = data
+            if index < len(order.lines):
+                line = order.lines[index]
+                line[1] -= quantity
+                if line[1] <= 0:
+                    del order.lines[index]
+        elif kind == CONFIRMED:
+            order.status = 'confirmed'
+        elif kind == PAID:
+            order.status = 'paid'
+            order.paid = data[0]
+        elif kind in (EXECUTED, INGESTED, CANCELLED):
+            del self.orders[number]
+
+
+class OrderJournal:
+    """Журнал событий заказов с групповой фиксацией и восстановлением"""
+
+    def __init__(self, path: str, commit_delay: float = 0.002,
+                 wait_for_commit: bool = True, compact_every: int = 100000):
+        """
+        commit_delay - время (с), в течение которого события копятся перед
+        fsync; wait_for_commit - ждать ли записи события на диск перед
+        возвратом из метода; compact_every - через сколько записей
+        сжимать журнал (0 - не сжимать автоматически).
+        """
+        self.path = path
+        self.commit_delay = commit_delay
+        self.wait_for_commit = wait_for_commit
+        self.compact_every = compact_every
+        self.state = JournalState()
+        self.records = self._replay()
+        self._file = open(path, 'ab')
+        self._cond = threading.Condition()
+        self._pending = []
+        self._appended = 0
+        self._committed = 0
+        self._since_compaction = self.records
+        self._error = None
+        self._writing = False  # фоновый поток пишет пакет без блокировки
+        self._closed = False
+        self._close_callbacks = []
+        self._thread = threading.Thread(target=self._flush_loop, name="journal", daemon=True)
+        self._thread.start()
+
+    # События жизненного цикла заказа
+
+    def created(self, number: int):
+        self._append(CREATED, number, _ORDER.pack(number))
+
+    def item_added(self, number: int, name: str, quantity: int, modifiers: tuple = ()):
+        payload = [_ITEM.pack(number, quantity, len(modifiers)), _encode_text(name)]
+        payload.extend(_encode_text(modifier) for modifier in modifiers)
+        self._append(ITEM_ADDED, number, b''.join(payload), name, quantity, tuple(modifiers))
+
+    def item_removed(self, number: int, index: int, quantity: int):
+        self._append(ITEM_REMOVED, number, _REMOVE.pack(number, index, quantity), index, quantity)
+
+    def confirmed(self, number: int):
+        self._append(CONFIRMED, number, _ORDER.pack(number))
+
+    def paid(self, number: int, amount: float):
+        self._append(PAID, number, _PAYMENT.pack(number, amount), amount)
+
+    def executed(self, number: int):
+        self._append(EXECUTED, number, _ORDER.pack(number))
+
+    def ingested(self, number: int):
+        self._append(INGESTED, number, _ORDER.pack(number))
+
+    def cancelled(self, number: int):
+        self._append(CANCELLED, number, _ORDER.pack(number))
+
+    # Управление журналом
+
+    def flush(self):
+        """Ожидание записи на диск всех добавленных событий"""
+        with self._cond:
+            self._wait(self._appended)
+
+    def compact(self):
+        """Сжатие журнала: остаются только незавершенные заказы
+
+        Сжатие заменяет файл, поэтому выполняется, только когда фоновый
+        поток не пишет пакет; оставшиеся события дописываются здесь же.
+        """
+        with self._cond:
+            while self._writing and self._error is None:
+                self._cond.wait()
+            self._check_error()
+            self._wait_pending_locked()
+            self._compact_locked()
+            self._cond.notify_all()
+
+    def on_close(self, callback):
+        """Функция без аргументов, вызываемая после закрытия журнала"""
+        self._close_callbacks.append(callback)
+
+    def close(self):
+        """Запись оставшихся событий, закрытие файла и вызов функций on_close"""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        try:
+            self._thread.join()
+            self._file.close()
+        finally:
+            callbacks, self._close_callbacks = self._close_callbacks, []
+            for callback in callbacks:
+                callback()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _append(self, kind: int, number: int, payload: bytes, *data):
+        frame = _frame(kind, payload)
+        with self._cond:
+            if self._closed:
+                raise ValueError("Журнал закрыт")
+            self._check_error()
+            self.state.apply(kind, number, *data)
+            self._pending.append(frame)
+            self._appended += 1
+            ticket = self._appended
+            if len(self._pending) == 1:
+                self._cond.notify_all()
+            if self.wait_for_commit:
+                self._wait(ticket)
+
+    def _wait(self, ticket: int):
+        """Ожидание фиксации записи с номером ticket (под блокировкой)"""
+        while self._committed < ticket:
+            self._check_error()
+            self._cond.wait()
+
+    def _check_error(self):
+        """Исключение, если фоновый поток остановлен ошибкой (под блокировкой)"""
+        if self._error is not None:
+            raise OSError("Ошибка записи журнала") from self._error
+
+    def _flush_loop(self):
+        """Фоновый поток групповой фиксации
+
+        Любая ошибка записи или сжатия фатальна: она сохраняется, и все
+        ожидающие фиксации получают исключение, а не ждут вечно.
+        """
+        try:
+            while self._flush_batch():
+                pass
+        except BaseException as error:
+            with self._cond:
+                self._error = error
+                self._writing = False
+                self._cond.notify_all()
+
+    def _flush_batch(self) -> bool:
+        """Запись одного пакета событий; False - журнал закрыт и пуст"""
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            if not self._pending and self._closed:
+                return False
+        if self.commit_delay and not self._closed:
+            time.sleep(self.commit_delay)  # даем накопиться другим событиям
+        with self._cond:
+            batch, self._pending = self._pending, []
+            ticket = self._appended
+            self._writing = True
+        self._file.write(b''.join(batch))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        with self._cond:
+            self._writing = False
+            self._committed = ticket
+            self.records += len(batch)
+            self._since_compaction += len(batch)
+            if self.compact_every and self._since_compaction >= self.compact_every:
+                self._wait_pending_locked()
+                self._compact_locked()
+            self._cond.notify_all()
+        return True
+
+    def _wait_pending_locked(self):
+        """Запись на диск событий, добавленных во время fsync (перед сжатием)"""
+        if self._pending:
+            self._file.write(b''.join(self._pending))
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.records += len(self._pending)
+            self._pending = []
+            self._committed = self._appended
+
+    def _compact_locked(self):
+        """Запись снимка состояния во временный файл и атомарная замена журнала"""
+        frames = [_frame(SEQUENCE, _ORDER.pack(self.state.last_order_number))]
+        for order in self.state.orders.values():
+            frames.append(_frame(CREATED, _ORDER.pack(order.number)))
+            for name, quantity, modifiers in order.lines:
+                payload = [_ITEM.pack(order.number, quantity, len(modifiers)), _encode_text(name)]
+                payload.extend(_encode_text(modifier) for modifier in modifiers)
+                frames.append(_frame(ITEM_ADDED, b''.join(payload)))
+            if order.status in ('confirmed', 'paid'):
+                frames.append(_frame(CONFIRMED, _ORDER.pack(order.number)))
+            if order.status == 'paid':
+                frames.append(_frame(PAID, _PAYMENT.pack(order.number, order.paid)))
+        temporary = self.path + '.tmp'
+        with open(temporary, 'wb') as file:
+            file.write(b''.join(frames))
+            file.flush()
+            os.fsync(file.fileno())
+        self._file.close()
+        os.replace(temporary, self.path)
+        self._file = open(self.path, 'ab')
+        self.records = len(frames)
+        self._since_compaction = 0
+
+    def _replay(self) -> int:
+        """Чтение журнала и восстановление состояния; возвращает число записей"""
+        try:
+            with open(self.path, 'rb') as file:
+                data = file.read()
+        except FileNotFoundError:
+            return 0
+        position = 0
+        count = 0
+        size = len(data)
+        apply = self.state.apply
+        while position + _HEADER.size <= size:
+            length, checksum, kind = _HEADER.unpack_from(data, position)
+            start = position + _HEADER.size
+            end = start + length
+            if end > size or zlib.crc32(data[start - 1:end]) != checksum:
+                break
+            number, *fields = _decode(kind, data, start)
+            apply(kind, number, *fields)
+            position = end
+            count += 1
+        if position < size:
+            # Оборванная или поврежденная запись в конце: отбрасываем хвост
+            with open(self.path, 'r+b') as file:
+                file.truncate(position)
+        return count
+
+
+def _frame(kind: int, payload: bytes) -> bytes:
+    body = bytes((kind,)) + payload
+    return _HEADER.pack(len(payload), zlib.crc32(body), kind) + payload
+
+
+def _encode_text(text: str) -> bytes:
+    data = text.encode('utf-8')
+    return _TEXT_LENGTH.pack(len(data)) + data
+
+
+def _decode_text(data: bytes, position: int) -> tuple:
+    (length,) = _TEXT_LENGTH.unpack_from(data, position)
+    position += _TEXT_LENGTH.size
+    return data[position:position + length].decode('utf-8'), position + length
+
+
+def _decode(kind: int, data: bytes, position: int) -> tuple:
+    """Разбор данных записи: номер заказа и поля события"""
+    if kind == ITEM_ADDED:
+        number, quantity, count = _ITEM.unpack_from(data, position)
+        name, position = _decode_text(data, position + _ITEM.size)
+        modifiers = []
+        for _ in range(count):
+            modifier, position = _decode_text(data, position)
+            modifiers.append(modifier)
+        return number, name, quantity, tuple(modifiers)
+    if kind == ITEM_REMOVED:
+        return _REMOVE.unpack_from(data, position)
+    if kind == PAID:
+        return _PAYMENT.unpack_from(data, position)
+    return _ORDER.unpack_from(data, position)
@@ -0,0 +1,355 @@
+"""Дискретно-событийная модель пиццерии для планирования мощностей.
+
+Заказы поступают по заданному процессу прихода. Каждый заказ - Order
+из week3.1.2.py с пиццами из каталога Menu, но с собственной нумерацией
+модели и без записи в журнал заказов; каждая пицца заказа
+проходит этапы prepare -> bake -> cut -> pack (Pizza.stages, как
+в Order.execute и Kitchen), на каждом этапе ожидая свободного работника
+(повара, слот печи, упаковщика). По желанию вызываются и хуки этапов
+самих пицц. События хранятся в куче, время модели - в минутах, поэтому
+сутки работы моделируются за доли секунды.
+
+Пример вопроса: сколько печей нужно, чтобы p95 времени заказа было
+меньше 15 минут при 600 заказах в час:
+
+    python simulation.py --rate 600 --ovens 18 20 22 24 26 --days 3
+"""
+import argparse
+import heapq
+import importlib.util
+import math
+import os
+import random
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from kitchen import STAGES, percentile
+
+
+def _load_pizzeria():
+    """Модуль week3.1.2.py (в имени файла точки, поэтому через importlib)"""
+    module = sys.modules.get("pizzeria")
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            "pizzeria", os.path.join(os.path.dirname(os.path.abspath(__file__)), "week3.1.2.py"))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["pizzeria"] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+pizzeria = _load_pizzeria()
+
+# Распределения задаются кортежами, чтобы конфигурацию можно было
+# передавать в другие процессы (pickle):
+#   ('const', value), ('exp', mean), ('uniform', low, high),
+#   ('triangular', low, mode, high), ('lognormal', mean, sigma)
+DEFAULT_SERVICE = {
+    'prepare': ('triangular', 1.0, 1.5, 3.0),
+    'bake': ('triangular', 6.0, 7.0, 9.0),
+    'cut': ('uniform', 0.3, 0.6),
+    'pack': ('uniform', 0.3, 0.8),
+}
+# Около 80% загрузки каждого этапа при 600 заказах в час по 1-2 пиццы
+# (15 пицц в минуту): bake - 22 печи по 6 пицц
+DEFAULT_SERVERS = {'prepare': 36, 'bake': 132, 'cut': 9, 'pack': 11}
+DEFAULT_MENU = ('Пепперони', 'Барбекю', 'Дары Моря')
+
+MINUTES_PER_DAY = 24 * 60
+
+_ARRIVAL, _DONE = 0, 1
+
+
+def make_sampler(spec: tuple, rng: random.Random):
+    """Функция без аргументов, возвращающая случайную длительность по описанию spec"""
+    kind, *params = spec
+    if kind == 'const':
+        value = params[0]
+        return lambda: value
+    if kind == 'exp':
+        rate = 1.0 / params[0]
+        return lambda: rng.expovariate(rate)
+    if kind == 'uniform':
+        low, high = params
+        return lambda: rng.uniform(low, high)
+    if kind == 'triangular':
+        low, mode, high = params
+        return lambda: rng.triangular(low, high, mode)
+    if kind == 'lognormal':
+        mean, sigma = params
+        mu = math.log(mean) - sigma * sigma / 2
+        return lambda: rng.lognormvariate(mu, sigma)
+    raise ValueError(f"Неизвестное распределение: {kind}")
+
+
+class SimulationConfig:
+    """Параметры модели"""
+
+    def __init__(self, rate: float = 600, days: float = 1, servers: dict = None,
+                 service: dict = None, pizzas_per_order: tuple = ('uniform_int', 1, 2),
+                 menu: tuple = DEFAULT_MENU, arrival: str = 'poisson',
+                 hourly_profile: tuple = None, warmup: float = 60, seed: int = 0,
+                 call_hooks: bool = False):
+        """
+        rate - заказов в час (в пиковый час, если задан hourly_profile),
+        days - длительность моделирования в сутках, servers - число
+        работников по этапам, service - распределения длительности этапов
+        (в минутах), pizzas_per_order - ('uniform_int', min, max) или
+        ('const', n), menu - названия пицц из каталога MENU (или сами
+        пиццы), arrival - 'poisson' или 'deterministic', hourly_profile -
+        24 множителя интенсивности по часам суток, warmup - минуты
+        в начале, не учитываемые в статистике задержек, seed - зерно
+        генератора, call_hooks - вызывать ли методы пиццы на этапах
+        (как Kitchen; методы Pizza печатают на экран).
+        """
+        self.rate = rate
+        self.days = days
+        self.servers = {**DEFAULT_SERVERS, **(servers or {})}
+        self.service = {**DEFAULT_SERVICE, **(service or {})}
+        self.pizzas_per_order = pizzas_per_order
+        self.menu = menu
+        self.arrival = arrival
+        self.hourly_profile = hourly_profile
+        self.warmup = warmup
+        self.seed = seed
+        self.call_hooks = call_hooks
+
+    def replace(self, **changes) -> 'SimulationConfig':
+        """Копия конфигурации с измененными параметрами"""
+        params = dict(self.__dict__)
+        for key, value in changes.items():
+            if key in ('servers', 'service'):
+                value = {**params[key], **value}
+            params[key] = value
+        return SimulationConfig(**params)
+
+
+class SimulationResult:
+    """Итоги моделирования"""
+
+    def __init__(self, config: SimulationConfig, horizon: float, latencies: list,
+                 completed: int, pizzas: int, busy_time: dict, max_queue: dict,
+                 revenue: int = 0):
+        latencies.sort()
+        self.config = config
+        self.orders = completed
+        self.pizzas = pizzas
+        self.revenue = revenue  # сумма Order.calculate_total выполненных заказов
+        self.throughput = completed / (horizon / 60)  # заказов в час
+        self.utilization = {stage: busy_time[stage] / (config.servers[stage] * horizon)
+                            for stage in busy_time}
+        self.max_queue = max_queue
+        self.mean = sum(latencies) / len(latencies) if latencies else 0.0
+        self.percentiles = {p: percentile(latencies, p) for p in (50, 90, 95, 99)}
+        self.max = latencies[-1] if latencies else 0.0
+
+    @property
+    def p95(self) -> float:
+        return self.percentiles[95]
+
+    def __str__(self):
+        utilization = ", ".join(f"{stage} {value:.0%}" for stage, value in self.utilization.items())
+        return (f"заказов: {self.orders} ({self.throughput:.0f}/ч), "
+                f"p50 {self.percentiles[50]:.1f} мин, p95 {self.p95:.1f} мин, "
+                f"p99 {self.percentiles[99]:.1f} мин; загрузка: {utilization}")
+
+
+class _Stage:
+    """Состояние этапа: занятые работники и очередь пицц"""
+
+    __slots__ = ('servers', 'busy', 'queue', 'sample', 'busy_time', 'max_queue')
+
+    def __init__(self, servers: int, sample):
+        self.servers = servers
+        self.busy = 0
+        self.queue = deque()
+        self.sample = sample
+        self.busy_time = 0.0
+        self.max_queue = 0
+
+
+class _SimulatedOrder(pizzeria.Order):
+    """Заказ модели: номер из счетчика модели, события в журнал не пишутся
+
+    Создается через restore, поэтому общий счетчик Order.order_counter
+    (возможно, файловый) не расходуется на модельные заказы.
+    """
+
+    def _log(self, event: str, *args):
+        pass
+
+
+class _Job:
+    """Заказ в модели: время поступления, Order и число неупакованных пицц"""
+
+    __slots__ = ('arrival', 'order', 'remaining')
+
+    def __init__(self, arrival: float, order):
+        self.arrival = arrival
+        self.order = order
+        self.remaining = order.pizza_count
+
+
+def _resolve_menu(menu: tuple) -> list:
+    """Пиццы каталога MENU по названиям (пиццы передаются как есть)"""
+    pizzas = []
+    for item in menu:
+        pizza = pizzeria.MENU.find(item) if isinstance(item, str) else item
+        if pizza is None:
+            raise ValueError(f"Пицца не найдена в меню: {item}")
+        pizzas.append(pizza)
+    return pizzas
+
+
+def simulate(config: SimulationConfig) -> SimulationResult:
+    """Моделирование работы пиццерии с заданными параметрами"""
+    rng = random.Random(config.seed)
+    stages = [_Stage(config.servers[name], make_sampler(config.service[name], rng))
+              for name in STAGES]
+    last_stage = len(stages) - 1
+    horizon = config.days * MINUTES_PER_DAY
+    next_arrival = _arrival_process(config, rng)
+    order_size = _order_size(config.pizzas_per_order, rng)
+    menu = _resolve_menu(config.menu)
+    call_hooks = config.call_hooks
+    new_order = _SimulatedOrder.restore
+
+    events = []
+    sequence = 0  # порядок событий с одинаковым временем
+    latencies = []
+    arrivals = 0  # номера заказов модели
+    completed = 0
+    pizzas_total = 0
+    revenue = 0
+
+    def start(now: float, stage_index: int, pizza, job: _Job):
+        nonlocal sequence
+        stage = stages[stage_index]
+        if stage.busy < stage.servers:
+            stage.busy += 1
+            duration = stage.sample()
+            stage.busy_time += duration
+            sequence += 1
+            heapq.heappush(events, (now + duration, sequence, _DONE, (stage_index, pizza, job)))
+        else:
+            stage.queue.append((pizza, job))
+            if len(stage.queue) > stage.max_queue:
+                stage.max_queue = len(stage.queue)
+
+    first = next_arrival(0.0)
+    if first < horizon:
+        heapq.heappush(events, (first, 0, _ARRIVAL, None))
+    while events:
+        now, _, kind, data = heapq.heappop(events)
+        if kind == _ARRIVAL:
+            arrivals += 1
+            order = new_order(arrivals)
+            for _ in range(order_size()):
+                order.add_pizza(rng.choice(menu))
+            job = _Job(now, order)
+            pizzas_total += job.remaining
+            for pizza in order.pizzas:
+                start(now, 0, pizza, job)
+            arrival = next_arrival(now)
+            if arrival < horizon:
+                sequence += 1
+                heapq.heappush(events, (arrival, sequence, _ARRIVAL, None))
+            continue
+        stage_index, pizza, job = data
+        stage = stages[stage_index]
+        stage.busy -= 1
+        if call_hooks:
+            getattr(pizza, STAGES[stage_index])()
+        if stage.queue:
+            start(now, stage_index, *stage.queue.popleft())
+        if stage_index < last_stage:
+            start(now, stage_index + 1, pizza, job)
+            continue
+        job.remaining -= 1
+        if job.remaining == 0:
+            completed += 1
+            revenue += job.order.calculate_total()
+            if job.arrival >= config.warmup:
+                latencies.append(now - job.arrival)
+
+    # Время работы после окончания приема заказов не входит в горизонт,
+    # поэтому загрузка перегруженной системы может превышать 100%
+    return SimulationResult(
+        config, horizon, latencies, completed, pizzas_total,
+        {name: stage.busy_time for name, stage in zip(STAGES, stages)},
+        {name: stage.max_queue for name, stage in zip(STAGES, stages)},
+        revenue)
+
+
+def sweep(base: SimulationConfig, variants: list, processes: int = None) -> list:
+    """Параллельный перебор параметров в пуле процессов
+
+    variants - список словарей изменений конфигурации, например
+    [{'servers': {'bake': 96}}, {'servers': {'bake': 108}}].
+    Возвращает список пар (изменения, SimulationResult).
+    """
+    configs = [base.replace(**variant) for variant in variants]
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        results = list(pool.map(simulate, configs))
+    return list(zip(variants, results))
+
+
+def _arrival_process(config: SimulationConfig, rng: random.Random):
+    """Функция, возвращающая время следующего заказа после момента now"""
+    rate = config.rate / 60  # заказов в минуту
+    if config.arrival == 'deterministic':
+        interval = 1 / rate
+        return lambda now: now + interval
+    if config.arrival != 'poisson':
+        raise ValueError(f"Неизвестный процесс прихода: {config.arrival}")
+    profile = config.hourly_profile
+    if not profile:
+        return lambda now: now + rng.expovariate(rate)
+    if len(profile) != 24:
+        raise ValueError("Профиль должен содержать 24 значения")
+    peak = max(profile)
+
+    def next_arrival(now: float) -> float:
+        # Неоднородный пуассоновский поток методом прореживания
+        while True:
+            now += rng.expovariate(rate * peak)
+            hour = int(now // 60) % 24
+            if rng.random() * peak <= profile[hour]:
+                return now
+    return next_arrival
+
+
+def _order_size(spec: tuple, rng: random.Random):
+    kind, *params = spec
+    if kind == 'const':
+        size = int(params[0])
+        return lambda: size
+    if kind == 'uniform_int':
+        low, high = params
+        return lambda: rng.randint(low, high)
+    raise ValueError(f"Неизвестное распределение размера заказа: {kind}")
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(description="Моделирование пиццерии")
+    parser.add_argument('--rate', type=float, default=600, help="Заказов в час")
+    parser.add_argument('--days', type=float, default=1, help="Длительность в сутках")
+    parser.add_argument('--ovens', type=int, nargs='+', default=[18, 20, 22, 24, 26],
+                        help="Варианты числа печей")
+    parser.add_argument('--oven-capacity', type=int, default=6, help="Пицц в одной печи")
+    parser.add_argument('--target', type=float, default=15, help="Целевое p95, мин")
+    parser.add_argument('--processes', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    base = SimulationConfig(rate=args.rate, days=args.days, seed=args.seed)
+    variants = [{'servers': {'bake': ovens * args.oven_capacity}} for ovens in args.ovens]
+    results = sweep(base, variants, args.processes)
+    for ovens, (_, result) in zip(args.ovens, results):
+        mark = "OK" if result.p95 <= args.target else "  "
+        print(f"{mark} печей: {ovens:3d}  {result}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+BASE_DIR = Path(__file__).resolve(strict=True).parent.parent
+sys.path.append(str(BASE_DIR))
+
+
+def load_module(name: str, filename: str):
+    """Загрузка модуля из файла с точками в имени (week3.1.1.py)"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, BASE_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def roman():
+    return load_module('roman', 'week3.1.1.py')
+
+
+@pytest.fixture(scope='session')
+def pizzeria():
+    return load_module('pizzeria', 'week3.1.2.py')
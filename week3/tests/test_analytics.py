@@ -0,0 +1,50 @@
+import pytest
+
+from analytics import QuantileSketch, SalesAnalytics
+
+
+DAY = SalesAnalytics.DAY
+
+
+def test_snapshot_rolls_day_before_reading_revenue():
+    analytics = SalesAnalytics(clock=lambda: 0)
+    analytics.record_sale(500, [('Пепперони', 1)], timestamp=DAY - 10)
+    assert analytics.snapshot(DAY - 5)['revenue_today'] == 500
+    snapshot = analytics.snapshot(DAY + 10)
+    assert snapshot['revenue_today'] == 0
+    assert snapshot['top_pizzas'] == []
+    assert snapshot['orders_window'] == 1
+
+
+def test_snapshot_window_values_are_consistent():
+    analytics = SalesAnalytics(window=3600, buckets=60)
+    for minute in range(10):
+        analytics.record_sale(100 * (minute + 1), [('Барбекю', 1)], timestamp=60 * minute)
+    snapshot = analytics.snapshot(600)
+    assert snapshot['orders_window'] == 10
+    assert snapshot['revenue_window'] == 5500
+    assert snapshot['average_order_value'] == pytest.approx(550)
+
+
+@pytest.mark.parametrize('q', [0.5, 0.9, 0.99])
+def test_quantile_sketch_relative_accuracy(q):
+    sketch = QuantileSketch(relative_accuracy=0.01)
+    values = list(range(1, 10001))
+    for value in values:
+        sketch.add(value)
+    exact = values[int(q * (len(values) - 1))]
+    assert abs(sketch.quantile(q) - exact) <= 0.01 * exact + 1
+
+
+def test_quantile_sketch_collapses_low_buckets_in_batches():
+    sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=64)
+    for exponent in range(1000):
+        sketch.add(1.05 ** exponent)
+    assert len(sketch._buckets) <= 64
+    assert sketch.count == 1000
+    # Старшие значения сохраняют точность, младшие уходят в нижнюю корзину
+    top = 1.05 ** 999
+    assert abs(sketch.quantile(1.0) - top) <= 0.01 * top
+    before = len(sketch._buckets)
+    sketch.add(1.0)
+    assert len(sketch._buckets) == before
@@ -0,0 +1,54 @@
+import pytest
+
+from inventory import Inventory
+
+
+@pytest.fixture
+def stocked(pizzeria):
+    """Склад, на котором хватает ингредиентов только на две пепперони"""
+    menu = pizzeria.MENU
+    pepperoni = menu.find('пепперони')
+    stock = {ingredient: 2 * amount for ingredient, amount
+             in zip(menu.bill_of_materials.ingredients,
+                    menu.bill_of_materials.row(pepperoni))}
+    return Inventory(menu.bill_of_materials, stock)
+
+
+def test_vector_rejects_fractional_amounts(pizzeria):
+    bill = pizzeria.MENU.bill_of_materials
+    ingredient = bill.ingredients[0]
+    assert list(bill.vector({ingredient: 3}))[0] == 3
+    for amount in (2.5, 2.0, '2', True):
+        with pytest.raises(ValueError):
+            bill.vector({ingredient: amount})
+    with pytest.raises(ValueError):
+        Inventory(bill, {ingredient: 1.5})
+
+
+def test_show_menu_hides_unavailable_pizzas(pizzeria, stocked, capsys):
+    pizzeria.Terminal(inventory=stocked).show_menu()
+    text = capsys.readouterr().out
+    assert 'Пепперони' in text
+    assert 'Барбекю' not in text and 'Дары Моря' not in text
+    assert 'Нет в наличии' not in text
+
+
+def test_place_order_releases_reservation_on_failure(pizzeria, stocked, monkeypatch):
+    terminal = pizzeria.Terminal(inventory=stocked)
+    before = stocked.stock
+
+    def fail(resolved):
+        raise RuntimeError("сбой")
+
+    monkeypatch.setattr(terminal, '_build_order', fail)
+    with pytest.raises(RuntimeError):
+        terminal.place_order(['пепперони'], 1000)
+    assert stocked.stock == before
+
+
+def test_place_order_keeps_reservation_on_success(pizzeria, stocked):
+    terminal = pizzeria.Terminal(inventory=stocked)
+    terminal.place_order([{'pizza': 'пепперони', 'qty': 2}], 1000)
+    assert not any(stocked.stock.values())
+    with pytest.raises(ValueError):
+        terminal.place_order(['пепперони'], 1000)
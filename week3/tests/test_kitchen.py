@@ -0,0 +1,71 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from kitchen import Kitchen, percentile
+
+
+@pytest.mark.parametrize('percent, expected', [(0, 1), (20, 1), (50, 3), (60, 3),
+                                               (90, 5), (95, 5), (100, 5)])
+def test_percentile_nearest_rank(percent, expected):
+    assert percentile([1, 2, 3, 4, 5], percent) == expected
+
+
+def test_percentile_unsorted_and_empty():
+    assert percentile([5, 1, 4, 2, 3], 50) == 3
+    assert percentile([], 95) == 0.0
+
+
+def test_kitchen_runs_every_stage():
+    calls = []
+
+    class Pizza:
+        def __getattr__(self, stage):
+            return lambda: calls.append(stage)
+
+    order = SimpleNamespace(pizzas=[Pizza(), Pizza()])
+    kitchen = Kitchen(durations={stage: 0.0 for stage in ('prepare', 'bake', 'cut', 'pack')})
+
+    async def run():
+        result = await kitchen.submit(order)
+        await kitchen.stop()
+        return result
+
+    assert asyncio.run(run()) is order
+    assert sorted(calls) == sorted(['prepare', 'bake', 'cut', 'pack'] * 2)
+    snapshot = kitchen.snapshot()
+    assert snapshot['orders_done'] == 1
+    assert snapshot['stages']['pack']['processed'] == 2
+
+
+def test_snapshot_from_another_thread_while_kitchen_runs():
+    class Pizza:
+        def __getattr__(self, stage):
+            return lambda: None
+
+    kitchen = Kitchen(workers={stage: 4 for stage in ('prepare', 'bake', 'cut', 'pack')},
+                      durations={stage: 0.0 for stage in ('prepare', 'bake', 'cut', 'pack')})
+    kitchen.run_in_background()
+    threads = set()
+    build = kitchen._snapshot
+
+    def recording_snapshot():
+        threads.add(threading.current_thread().name)
+        return build()
+
+    kitchen._snapshot = recording_snapshot
+    futures = [kitchen.submit_threadsafe(SimpleNamespace(pizzas=[Pizza()] * 20))
+               for _ in range(50)]
+    # Снимки строятся в цикле кухни, пока работники добавляют замеры
+    while not all(future.done() for future in futures):
+        snapshot = kitchen.snapshot()
+        assert snapshot['stages']['pack']['processed'] <= 1000
+    for future in futures:
+        future.result(timeout=10)
+    snapshot = kitchen.snapshot()
+    assert snapshot['orders_done'] == 50
+    assert snapshot['stages']['bake']['processed'] == 1000
+    assert threads == {'kitchen'}
+    asyncio.run_coroutine_threadsafe(kitchen.stop(), kitchen._loop).result(timeout=10)
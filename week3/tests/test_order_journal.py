@@ -0,0 +1,142 @@
+import io
+import json
+import threading
+
+import pytest
+
+from order_journal import OrderJournal
+
+
+def open_orders(path):
+    with OrderJournal(path) as journal:
+        return journal.state.orders, journal.state.last_order_number
+
+
+def test_recovery_keeps_only_unfinished_orders(tmp_path):
+    path = str(tmp_path / 'orders.wal')
+    with OrderJournal(path, commit_delay=0) as journal:
+        for number in (1, 2, 3):
+            journal.created(number)
+            journal.item_added(number, 'Пепперони', 2, ('без лука',))
+        journal.item_removed(1, 0, 1)
+        journal.confirmed(2)
+        journal.paid(2, 1000.0)
+        journal.executed(3)
+    orders, last = open_orders(path)
+    assert last == 3
+    assert sorted(orders) == [1, 2]
+    assert orders[1].lines == [['Пепперони', 1, ('без лука',)]]
+    assert orders[1].status == 'open'
+    assert (orders[2].status, orders[2].paid) == ('paid', 1000.0)
+
+
+def test_torn_tail_is_discarded(tmp_path):
+    path = tmp_path / 'orders.wal'
+    with OrderJournal(str(path), commit_delay=0) as journal:
+        journal.created(1)
+        journal.created(2)
+    path.write_bytes(path.read_bytes()[:-3])
+    orders, _ = open_orders(str(path))
+    assert sorted(orders) == [1]
+
+
+def test_compact_preserves_state(tmp_path):
+    path = str(tmp_path / 'orders.wal')
+    with OrderJournal(path, commit_delay=0, compact_every=0) as journal:
+        for number in range(1, 101):
+            journal.created(number)
+            journal.item_added(number, 'Барбекю', 1)
+            if number % 10:
+                journal.executed(number)
+        journal.paid(50, 450.0)
+        journal.compact()
+        assert journal.records == 1 + 10 * 2 + 2  # оплаченный: CONFIRMED и PAID
+        journal.created(101)
+    orders, last = open_orders(path)
+    assert last == 101
+    assert sorted(orders) == list(range(10, 101, 10)) + [101]
+    assert orders[50].status == 'paid'
+
+
+def test_compaction_during_concurrent_writes(tmp_path):
+    path = str(tmp_path / 'orders.wal')
+    journal = OrderJournal(path, commit_delay=0.0005, wait_for_commit=False, compact_every=50)
+    errors = []
+
+    def writer(offset):
+        try:
+            for number in range(offset, offset + 500):
+                journal.created(number)
+                journal.item_added(number, 'Дары Моря', 1)
+                if number % 5:
+                    journal.executed(number)
+        except Exception as error:  # pragma: no cover - видно в assert ниже
+            errors.append(error)
+
+    def compactor():
+        for _ in range(20):
+            journal.compact()
+
+    threads = [threading.Thread(target=writer, args=(offset,)) for offset in (1, 1001, 2001)]
+    threads.append(threading.Thread(target=compactor))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    journal.flush()
+    journal.close()
+    assert not errors
+    orders, _ = open_orders(path)
+    expected = [n for offset in (1, 1001, 2001) for n in range(offset, offset + 500) if n % 5 == 0]
+    assert sorted(orders) == expected
+    assert all(order.lines == [['Дары Моря', 1, ()]] for order in orders.values())
+
+
+def test_writer_failure_wakes_waiters(tmp_path):
+    journal = OrderJournal(str(tmp_path / 'orders.wal'), commit_delay=0, wait_for_commit=False)
+    journal._file.close()  # запись в закрытый файл - ValueError в фоновом потоке
+    journal.created(1)
+    result = []
+
+    def flush():
+        try:
+            journal.flush()
+        except OSError as error:
+            result.append(error)
+
+    thread = threading.Thread(target=flush)
+    thread.start()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert result and isinstance(result[0].__cause__, ValueError)
+    with pytest.raises(OSError):
+        journal.created(2)
+    journal.close()
+
+
+def test_ingested_orders_are_not_recovered(pizzeria, tmp_path):
+    path = str(tmp_path / 'orders.wal')
+    journal, _ = pizzeria.open_journal(path, wait_for_commit=False)
+    try:
+        lines = [json.dumps({"items": ["1", "2"], "payment": 1000}) + "\n"] * 500
+        accepted, rejected = pizzeria.ingest_orders(lines, io.StringIO(), pizzeria.Terminal())
+    finally:
+        journal.close()
+    assert (accepted, rejected) == (500, 0)
+    journal, orders = pizzeria.open_journal(path)
+    journal.close()
+    assert orders == []
+
+
+def test_close_detaches_journal_from_orders(pizzeria, tmp_path):
+    assert pizzeria.Order.journal is None
+    journal, _ = pizzeria.open_journal(str(tmp_path / 'orders.wal'))
+    assert pizzeria.Order.journal is journal
+    pizzeria.Order().add_pizza(pizzeria.MENU.find('1'))
+    journal.close()
+    assert pizzeria.Order.journal is None
+    pizzeria.Order().cancel()  # без журнала заказы снова создаются
+    journal, orders = pizzeria.open_journal(str(tmp_path / 'orders.wal'))
+    with journal:
+        assert [order.status for order in orders] == ['open']
+    assert pizzeria.Order.journal is None
@@ -0,0 +1,33 @@
+import pytest
+
+
+def test_menu_find_returns_shared_pizzas(pizzeria):
+    menu = pizzeria.MENU
+    assert menu.find('1') is menu.find(' пепперони ') is pizzeria.PepperoniPizza()
+    assert menu.find('гавайская') is None
+    assert not hasattr(menu, 'create')
+
+
+def test_order_merges_lines_and_keeps_total(pizzeria):
+    order = pizzeria.Order()
+    pepperoni = pizzeria.MENU.find('пепперони')
+    order.add_pizza(pepperoni, 2)
+    order.add_pizza(pepperoni)
+    order.add_pizza(pizzeria.MENU.find('барбекю'))
+    assert [line.quantity for line in order.lines] == [3, 1]
+    assert order.calculate_total() == 3 * 350 + 450
+    order.remove_pizza(0, 2)
+    assert order.calculate_total() == 350 + 450
+    assert order.pizza_count == 2
+
+
+def test_place_order_validates_before_numbering(pizzeria):
+    terminal = pizzeria.Terminal()
+    before = pizzeria.Order.order_counter.value
+    with pytest.raises(ValueError):
+        terminal.place_order(['пепперони', 'гавайская'], 10000)
+    with pytest.raises(ValueError):
+        terminal.place_order(['пепперони'], 1)
+    assert pizzeria.Order.order_counter.value == before
+    result = terminal.place_order([{'pizza': '2', 'qty': 2}], 1000)
+    assert result['total'] == 900 and result['change'] == 100
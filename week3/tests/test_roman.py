@@ -0,0 +1,61 @@
+import pytest
+
+
+@pytest.fixture
+def Roman(roman):
+    return roman.Roman
+
+
+def test_conversion_round_trip(Roman):
+    for number in range(1, 4000):
+        assert Roman.roman_to_int(Roman.int_to_roman(number)) == number
+
+
+@pytest.mark.parametrize('value', ['IIII', '', 'ABC', 'IC', 'VV', 0, 4000])
+def test_invalid_values_rejected(Roman, value):
+    with pytest.raises(ValueError):
+        Roman(value)
+
+
+def test_flyweight_and_immutable(Roman):
+    assert Roman(14) is Roman('XIV')
+    with pytest.raises(AttributeError):
+        Roman(5).value = 6
+
+
+def test_arithmetic(Roman):
+    assert str(Roman(10) + 5) == 'XV'
+    assert Roman(3) - Roman(1) == 2
+    assert 7 * Roman(3) == Roman('XXI')
+    assert divmod(Roman(10), 3) == (Roman(3), Roman(1))
+    with pytest.raises(ValueError):
+        Roman(1) - Roman(1)
+
+
+def test_batch_conversion(Roman):
+    assert list(Roman.to_int_many(['X', 'IV', 'MMXXIV'])) == [10, 4, 2024]
+    assert Roman.from_int_many([1, 2024]) == ['I', 'MMXXIV']
+
+
+def test_convert_stream_collects_errors(Roman):
+    chunks = list(Roman.convert_stream(['X\n', 'bad\n', 'IV\n'], False, 2))
+    assert chunks == [(['10', ''], [(2, 'bad')]), (['4'], [])]
+
+
+def test_scanner_across_chunk_boundaries(Roman):
+    text = b"Louis XIV, MMXXIV and V"
+    expected = [(6, 'XIV', 14), (11, 'MMXXIV', 2024), (22, 'V', 5)]
+    for chunk_size in (1, 3, 8, 1 << 20):
+        assert list(Roman.find_all(text, chunk_size)) == expected
+
+
+def test_replace_in_file(Roman, tmp_path):
+    source, target = tmp_path / 'in.txt', tmp_path / 'out.txt'
+    source.write_bytes('Глава XII, том IV\n'.encode('utf-8'))
+    assert Roman.replace_in_file(str(source), str(target), chunk_size=4) == 2
+    assert target.read_bytes().decode('utf-8') == 'Глава 12, том 4\n'
+
+
+def test_evaluate(Roman):
+    assert Roman.evaluate('X + V * II') == 20
+    assert Roman.evaluate('a * (b - I)', a=2, b='V') == 8
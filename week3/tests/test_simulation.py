@@ -0,0 +1,45 @@
+import contextlib
+import io
+
+import pytest
+
+from simulation import SimulationConfig, simulate
+
+
+def test_defaults_reach_steady_state():
+    result = simulate(SimulationConfig(days=1))
+    assert all(value < 0.9 for value in result.utilization.values())
+    assert result.p95 < 15
+    assert result.throughput == pytest.approx(600, rel=0.05)
+
+
+def test_orders_are_built_from_menu():
+    config = SimulationConfig(rate=60, days=0.5, menu=('Пепперони',),
+                              pizzas_per_order=('const', 2), warmup=0)
+    result = simulate(config)
+    assert result.pizzas == 2 * result.orders
+    assert result.revenue == 350 * result.pizzas
+
+
+def test_stage_hooks_are_called():
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = simulate(SimulationConfig(rate=10, days=0.05, call_hooks=True))
+    assert output.getvalue().count("Упаковываем") == result.pizzas
+
+
+def test_unknown_pizza_rejected():
+    with pytest.raises(ValueError):
+        simulate(SimulationConfig(menu=('Гавайская',), days=0.01))
+
+
+def test_simulation_leaves_order_numbers_and_journal_alone(pizzeria, monkeypatch):
+    class FailingJournal:
+        def __getattr__(self, event):
+            raise AssertionError(f"событие модели попало в журнал: {event}")
+
+    monkeypatch.setattr(pizzeria.Order, 'journal', FailingJournal())
+    before = pizzeria.Order.order_counter.value
+    result = simulate(SimulationConfig(rate=60, days=0.05, warmup=0))
+    assert result.orders > 0
+    assert pizzeria.Order.order_counter.value == before
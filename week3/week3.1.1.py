@@ -1,11 +1,64 @@
+import argparse
+import functools
+import mmap
+import operator
+import os
+import re
+import sys
+from array import array
+from itertools import islice
+from typing import BinaryIO, Callable, Iterable, Iterator, TextIO
+
+try:
+    import numpy
+except ImportError:  # NumPy необязателен: без него работают list и array
+    numpy = None
+
+MIN_VALUE = 1
+MAX_VALUE = 3999
+DEFAULT_CHUNK_SIZE = 65536
+SCAN_CHUNK_SIZE = 1 << 24
+EXPRESSION_CACHE_SIZE = 1024
+
+
+def _build_roman_table(int_values: list[tuple[int, str]]) -> tuple[str, ...]:
+    """Строит кортеж римских записей всех чисел от 1 до 3999.
+    
+    Args:
+        int_values (list[tuple[int, str]]): Пары (значение, символ)
+            в порядке убывания значения
+            
+    Returns:
+        tuple[str, ...]: Кортеж, где элемент с индексом n - 1 - запись числа n
+    """
+    table = []
+    for number in range(MIN_VALUE, MAX_VALUE + 1):
+        roman = []
+        for val, sym in int_values:
+            while number >= val:
+                roman.append(sym)
+                number -= val
+        table.append(''.join(roman))
+    return tuple(table)
+
+
 class Roman:
     """Класс для работы с римскими числами в диапазоне от I (1) до MMMCMXCIX (3999).
     
-    Поддерживает основные арифметические операции:
+    Поддерживает основные арифметические операции (с Roman и int,
+    в том числе с числом слева и в составном присваивании):
     - Сложение (+)
     - Вычитание (-)
     - Умножение (*)
-    - Целочисленное деление (/)
+    - Целочисленное деление (/ и //)
+    - Остаток от деления (%) и divmod()
+    
+    Результат любой операции должен лежать в диапазоне 1-3999,
+    иначе возбуждается ValueError.
+    
+    Объекты неизменяемы и канонизированы: для каждого значения 1..3999
+    существует ровно один экземпляр, поэтому Roman(5) is Roman(5), а
+    арифметика возвращает готовые объекты без новых выделений памяти.
     
     Примеры использования:
     >>> a = Roman("X")
@@ -16,16 +69,50 @@ class Roman:
     II
     """
     
-    __ROMAN_VALUES = {'I': 1, 'V': 5, 'X': 10, 'L': 50, 
-                     'C': 100, 'D': 500, 'M': 1000}
     __INT_VALUES = [
         (1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'),
         (100, 'C'), (90, 'XC'), (50, 'L'), (40, 'XL'),
         (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'), (1, 'I')
     ]
+
+    # Таблицы преобразования строятся один раз при загрузке класса:
+    # __TO_ROMAN[n - 1] - римская запись числа n,
+    # __FROM_ROMAN[запись] - арабское значение.
+    # Ключами словаря являются только корректные записи, поэтому
+    # проверка формата сводится к проверке наличия ключа.
+    __TO_ROMAN = _build_roman_table(__INT_VALUES)
+    __FROM_ROMAN = {roman: number for number, roman in enumerate(__TO_ROMAN, 1)}
+    # Для пакетной обработки: запись по самому числу (индекс 0 не используется)
+    # и по его десятичной строке
+    __BY_NUMBER = ('',) + __TO_ROMAN
+    __BY_DECIMAL = {str(number): roman for number, roman in enumerate(__TO_ROMAN, 1)}
+    __NUMPY_TABLE = None
+
+    # Поиск в тексте: регулярное выражение находит серии символов римских
+    # цифр, ограниченные не-словесными байтами (латиница, цифры, "_" и любые
+    # байты >= 0x80, т.е. буквы кириллицы в UTF-8 и cp1251, считаются
+    # частью слова). Выражение начинается с класса символов, поэтому
+    # движок re пропускает остальной текст быстрым поиском. Корректность
+    # найденной серии проверяется по таблице (тот же критерий, что
+    # и в roman_to_int): серия длиннее 15 символов или с неверным
+    # порядком цифр отбрасывается.
+    __TOKEN_PATTERN = re.compile(
+        rb'(?s)[MDCLXVI](?<![A-Za-z0-9_\x80-\xff].)[MDCLXVI]*(?![A-Za-z0-9_\x80-\xff])')
+    __FROM_ROMAN_BYTES = {roman.encode('ascii'): number
+                          for roman, number in __FROM_ROMAN.items()}
+    # Перекрытие порций: самая длинная запись (MMMDCCCLXXXVIII) и байт границы
+    __SCAN_OVERLAP = max(map(len, __TO_ROMAN)) + 1
+
+    # Кэш канонических экземпляров: __INSTANCES[n - 1] - объект числа n
+    __INSTANCES: list['Roman | None'] = [None] * MAX_VALUE
+
+    __slots__ = ('__value', '__str', '__repr')
     
-    def __init__(self, value: str | int) -> None:
-        """Инициализация объекта Roman.
+    def __new__(cls, value: str | int) -> 'Roman':
+        """Получение объекта Roman.
+        
+        Возвращает канонический экземпляр для данного значения,
+        создавая его при первом обращении.
         
         Args:
             value (str | int): Может быть:
@@ -44,14 +131,90 @@ class Roman:
             Roman('XLV')
         """
         if isinstance(value, str):
-            self.__value = self.roman_to_int(value)
+            value = cls.roman_to_int(value)
         elif isinstance(value, int):
-            if not 1 <= value <= 3999:
+            if not MIN_VALUE <= value <= MAX_VALUE:
                 raise ValueError("Допустимый диапазон: 1-3999")
-            self.__value = value
         else:
             raise TypeError("Допустимые типы: str или int")
 
+        return Roman.__from_valid(value)
+
+    @staticmethod
+    def __from_valid(value: int) -> 'Roman':
+        """Внутренний конструктор без проверок.
+        
+        Вызывается только для значений, уже проверенных на диапазон 1-3999.
+        
+        Args:
+            value (int): Арабское число от 1 до 3999
+            
+        Returns:
+            Roman: Канонический экземпляр
+        """
+        instance = Roman.__INSTANCES[value - 1]
+        if instance is None:
+            instance = object.__new__(Roman)
+            roman = Roman.__TO_ROMAN[value - 1]
+            set_attr = object.__setattr__
+            set_attr(instance, '_Roman__value', value)
+            set_attr(instance, '_Roman__str', roman)
+            set_attr(instance, '_Roman__repr', f"Roman('{roman}')")
+            Roman.__INSTANCES[value - 1] = instance
+        return instance
+
+    @staticmethod
+    def __result(value: int) -> 'Roman':
+        """Проверка результата арифметической операции.
+        
+        Args:
+            value (int): Результат операции над арабскими значениями
+            
+        Returns:
+            Roman: Канонический экземпляр результата
+            
+        Raises:
+            ValueError: Если результат вне диапазона 1-3999
+        """
+        if value < MIN_VALUE:
+            raise ValueError("Результат не может быть меньше I (1)")
+        if value > MAX_VALUE:
+            raise ValueError("Допустимый диапазон: 1-3999")
+        return Roman.__INSTANCES[value - 1] or Roman.__from_valid(value)
+
+    @staticmethod
+    def __operand(other: object) -> int | None:
+        """Арабское значение второго операнда.
+        
+        Returns:
+            int | None: Значение для Roman или int, None для остальных типов
+        """
+        if isinstance(other, Roman):
+            return other.__value
+        if isinstance(other, int):
+            return other
+        return None
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """Запрет изменения атрибутов (объект неизменяемый).
+        
+        Raises:
+            AttributeError: Всегда
+        """
+        raise AttributeError("Объект Roman неизменяемый")
+
+    def __delattr__(self, name: str) -> None:
+        """Запрет удаления атрибутов (объект неизменяемый).
+        
+        Raises:
+            AttributeError: Всегда
+        """
+        raise AttributeError("Объект Roman неизменяемый")
+
+    def __reduce__(self) -> tuple:
+        """Поддержка pickle и copy: восстанавливается канонический экземпляр."""
+        return (Roman, (self.__value,))
+
     @property
     def value(self) -> int:
         """int: Арабское представление числа (только для чтения).
@@ -79,16 +242,10 @@ class Roman:
             >>> Roman.roman_to_int("XII")
             12
         """
-        if not Roman.__is_valid_roman(roman):
-            raise ValueError(f"Некорректное римское число: {roman}")
-            
-        total = 0
-        prev_value = 0
-        for char in reversed(roman):
-            value = Roman.__ROMAN_VALUES[char]
-            total += value if value >= prev_value else -value
-            prev_value = value
-        return total
+        try:
+            return Roman.__FROM_ROMAN[roman]
+        except KeyError:
+            raise ValueError(f"Некорректное римское число: {roman}") from None
 
     @staticmethod
     def int_to_roman(number: int) -> str:
@@ -107,32 +264,330 @@ class Roman:
             >>> Roman.int_to_roman(42)
             'XLII'
         """
-        if not 1 <= number <= 3999:
+        if not MIN_VALUE <= number <= MAX_VALUE:
             raise ValueError("Допустимый диапазон: 1-3999")
+        return Roman.__TO_ROMAN[number - 1]
+
+    @staticmethod
+    def to_int_many(romans: 'Iterable[str] | numpy.ndarray') -> 'array | numpy.ndarray':
+        """Пакетное преобразование римских чисел в арабские.
+        
+        Args:
+            romans (Iterable[str] | numpy.ndarray): Последовательность
+                римских записей (список, генератор или массив NumPy строк)
+                
+        Returns:
+            array | numpy.ndarray: array('H') со значениями, а для входного
+                массива NumPy - массив numpy.uint16
+                
+        Raises:
+            ValueError: Если среди записей есть некорректная (с указанием позиции)
             
-        roman = []
-        for val, sym in Roman.__INT_VALUES:
-            while number >= val:
-                roman.append(sym)
-                number -= val
-        return ''.join(roman)
+        Пример:
+            >>> Roman.to_int_many(["X", "XII"])
+            array('H', [10, 12])
+        """
+        is_ndarray = numpy is not None and isinstance(romans, numpy.ndarray)
+        if is_ndarray:
+            romans = romans.tolist()
+        elif not isinstance(romans, list):
+            romans = list(romans)
+        values = list(map(Roman.__FROM_ROMAN.get, romans))
+        if None in values:
+            index = values.index(None)
+            raise ValueError(f"Некорректное римское число в позиции {index}: {romans[index]}")
+        if is_ndarray:
+            return numpy.array(values, dtype=numpy.uint16)
+        return array('H', values)
+
+    @staticmethod
+    def from_int_many(numbers: 'Iterable[int] | numpy.ndarray') -> 'list[str] | numpy.ndarray':
+        """Пакетное преобразование арабских чисел в римские.
+        
+        Args:
+            numbers (Iterable[int] | numpy.ndarray): Числа от 1 до 3999
+                (список, array или целочисленный массив NumPy)
+                
+        Returns:
+            list[str] | numpy.ndarray: Список римских записей, а для входного
+                массива NumPy - массив строк NumPy
+                
+        Raises:
+            ValueError: Если хотя бы одно число вне диапазона 1-3999
+            
+        Пример:
+            >>> Roman.from_int_many(array('H', [10, 12]))
+            ['X', 'XII']
+        """
+        if numpy is not None and isinstance(numbers, numpy.ndarray):
+            if numbers.size and (numbers.min() < MIN_VALUE or numbers.max() > MAX_VALUE):
+                raise ValueError("Допустимый диапазон: 1-3999")
+            return Roman.__numpy_table()[numbers]
+        if not isinstance(numbers, (list, tuple, array)):
+            numbers = list(numbers)
+        if numbers and (min(numbers) < MIN_VALUE or max(numbers) > MAX_VALUE):
+            raise ValueError("Допустимый диапазон: 1-3999")
+        return list(map(Roman.__BY_NUMBER.__getitem__, numbers))
+
+    @staticmethod
+    def __numpy_table() -> 'numpy.ndarray':
+        """Таблица римских записей в виде массива NumPy (строится при первом вызове)."""
+        if Roman.__NUMPY_TABLE is None:
+            Roman.__NUMPY_TABLE = numpy.array(Roman.__BY_NUMBER)
+        return Roman.__NUMPY_TABLE
 
     @staticmethod
-    def __is_valid_roman(roman: str) -> bool:
-        """Приватный метод для валидации римских чисел.
+    def convert_stream(lines: Iterable[str], to_roman: bool,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE
+                       ) -> Iterator[tuple[list[str], list[tuple[int, str]]]]:
+        """Потоковое преобразование строк фиксированными порциями.
         
-        Использует регулярное выражение для проверки формата:
-        - M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})
+        Читает не более chunk_size строк за раз, поэтому расход памяти
+        не зависит от размера входных данных. Некорректные строки не
+        прерывают обработку: на их месте выдается пустая строка, а сами
+        они попадают в список ошибок порции.
         
         Args:
-            roman (str): Строка для проверки
+            lines (Iterable[str]): Строки входных данных (например, файл)
+            to_roman (bool): True - арабские в римские, False - наоборот
+            chunk_size (int): Количество строк в порции
+            
+        Yields:
+            tuple[list[str], list[tuple[int, str]]]: Результаты порции и
+                пары (номер строки с 1, исходный текст) для некорректных строк
+        """
+        if chunk_size <= 0:
+            raise ValueError("Размер порции должен быть положительным")
+        table = Roman.__BY_DECIMAL if to_roman else Roman.__FROM_ROMAN
+        get = table.get
+        iterator = iter(lines)
+        line_number = 0
+        while True:
+            chunk = [line.strip() for line in islice(iterator, chunk_size)]
+            if not chunk:
+                return
+            results = list(map(get, chunk))
+            errors = []
+            if None in results:
+                for index, result in enumerate(results):
+                    if result is None:
+                        text = chunk[index]
+                        if to_roman and text.isdigit() and MIN_VALUE <= int(text) <= MAX_VALUE:
+                            # Запись с ведущими нулями, например "007"
+                            results[index] = Roman.__BY_NUMBER[int(text)]
+                            continue
+                        results[index] = ''
+                        errors.append((line_number + index + 1, text))
+            if not to_roman:
+                results = [str(result) for result in results]
+            line_number += len(chunk)
+            yield results, errors
+
+    @staticmethod
+    def __scan_chunks(buffer: 'bytes | mmap.mmap', chunk_size: int
+                      ) -> Iterator[tuple[int, list[tuple[int, int, bytes, int]]]]:
+        """Поиск римских чисел в буфере порциями.
+        
+        Каждая порция [start, end) просматривается с перекрытием, поэтому
+        запись, начинающаяся в порции и заканчивающаяся в следующей, не
+        теряется и не находится дважды.
+        
+        Args:
+            buffer (bytes | mmap.mmap): Текст в ASCII-совместимой кодировке
+            chunk_size (int): Размер порции в байтах
+            
+        Yields:
+            tuple[int, list[tuple[int, int, bytes, int]]]: Конец порции и
+                найденные записи (начало, конец, запись, значение)
+        """
+        if chunk_size <= 0:
+            raise ValueError("Размер порции должен быть положительным")
+        finditer = Roman.__TOKEN_PATTERN.finditer
+        get = Roman.__FROM_ROMAN_BYTES.get
+        overlap = Roman.__SCAN_OVERLAP
+        size = len(buffer)
+        for start in range(0, size, chunk_size):
+            end = min(start + chunk_size, size)
+            found = []
+            for match in finditer(buffer, start, min(end + overlap, size)):
+                offset = match.start()
+                if offset >= end:
+                    break
+                token = match.group()
+                value = get(token)
+                if value is not None:
+                    found.append((offset, match.end(), token, value))
+            yield end, found
+
+    @staticmethod
+    def find_all(buffer: 'bytes | mmap.mmap', chunk_size: int = SCAN_CHUNK_SIZE
+                 ) -> Iterator[tuple[int, str, int]]:
+        """Поиск всех корректных римских чисел в тексте.
+        
+        Args:
+            buffer (bytes | mmap.mmap): Текст в ASCII-совместимой кодировке
+                (UTF-8, cp1251 и т.п.)
+            chunk_size (int): Размер порции в байтах
+            
+        Yields:
+            tuple[int, str, int]: Смещение в байтах, запись и ее значение
+            
+        Пример:
+            >>> list(Roman.find_all(b"Louis XIV, MMXXIV"))
+            [(6, 'XIV', 14), (11, 'MMXXIV', 2024)]
+        """
+        for _, found in Roman.__scan_chunks(buffer, chunk_size):
+            for offset, _, token, value in found:
+                yield offset, token.decode('ascii'), value
+
+    @staticmethod
+    def find_in_file(path: str, chunk_size: int = SCAN_CHUNK_SIZE
+                     ) -> Iterator[tuple[int, str, int]]:
+        """Поиск римских чисел в файле любого размера.
+        
+        Файл отображается в память (mmap), поэтому он не читается целиком,
+        а расход памяти ограничен размером порции.
+        
+        Args:
+            path (str): Путь к текстовому файлу
+            chunk_size (int): Размер порции в байтах
+            
+        Yields:
+            tuple[int, str, int]: Смещение в байтах, запись и ее значение
+        """
+        with open(path, 'rb') as file:
+            if not Roman.__file_size(file):
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                yield from Roman.find_all(buffer, chunk_size)
+
+    @staticmethod
+    def replace_in_file(source: str, target: str,
+                        chunk_size: int = SCAN_CHUNK_SIZE) -> int:
+        """Копирование текста с заменой римских чисел на арабские.
+        
+        Args:
+            source (str): Путь к исходному файлу
+            target (str): Путь к файлу результата
+            chunk_size (int): Размер порции в байтах
             
         Returns:
-            bool: True если формат корректен, иначе False
+            int: Количество замененных чисел
+            
+        Пример:
+            "Глава XII" -> "Глава 12"
         """
-        import re
-        pattern = r'^M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})$'
-        return re.fullmatch(pattern, roman) is not None
+        count = 0
+        with open(source, 'rb') as file, open(target, 'wb') as out:
+            if not Roman.__file_size(file):
+                return 0
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                last = 0
+                for end, found in Roman.__scan_chunks(buffer, chunk_size):
+                    for offset, token_end, _, value in found:
+                        out.write(buffer[last:offset])
+                        out.write(b'%d' % value)
+                        last = token_end
+                    count += len(found)
+                    if last < end:
+                        out.write(buffer[last:end])
+                        last = end
+        return count
+
+    @staticmethod
+    def __file_size(file: BinaryIO) -> int:
+        """Размер открытого файла (mmap не поддерживает пустые файлы)."""
+        return os.fstat(file.fileno()).st_size
+
+    @staticmethod
+    def evaluate(expression: str, **variables: 'Roman | int | str') -> 'Roman':
+        """Вычисление арифметического выражения с римскими числами.
+        
+        Выражение разбирается один раз и компилируется в замыкание,
+        которое хранится в LRU-кэше по тексту выражения, поэтому
+        повторные вычисления не выполняют разбор.
+        
+        Поддерживаются римские и арабские числа, операторы + - * / // %
+        (деление целочисленное), скобки и переменные - имена, не являющиеся
+        корректной римской записью (например, n или count).
+        
+        Args:
+            expression (str): Текст выражения
+            **variables: Значения переменных (Roman, int или римская запись)
+            
+        Returns:
+            Roman: Результат вычисления
+            
+        Raises:
+            ValueError: При синтаксической ошибке, неизвестной переменной или
+                        выходе результата подвыражения за диапазон 1-3999
+                        (с указанием подвыражения)
+            ZeroDivisionError: При делении на ноль (с указанием подвыражения)
+            
+        Пример:
+            >>> Roman.evaluate("MCM + XLV * II - (X / III)")
+            Roman('MCMLXXXVII')
+            >>> Roman.evaluate("X * n", n=3)
+            Roman('XXX')
+        """
+        return _compile_expression(expression)(variables)
+
+    def __eq__(self, other: object) -> bool:
+        """Проверка равенства (с Roman или int).
+        
+        Пример:
+            >>> Roman("V") == 5
+            True
+        """
+        if isinstance(other, Roman):
+            return self.__value == other.__value
+        if isinstance(other, int):
+            return self.__value == other
+        return NotImplemented
+
+    def __lt__(self, other: 'Roman | int') -> bool:
+        """Сравнение (<) с Roman или int."""
+        if isinstance(other, Roman):
+            return self.__value < other.__value
+        if isinstance(other, int):
+            return self.__value < other
+        return NotImplemented
+
+    def __le__(self, other: 'Roman | int') -> bool:
+        """Сравнение (<=) с Roman или int."""
+        if isinstance(other, Roman):
+            return self.__value <= other.__value
+        if isinstance(other, int):
+            return self.__value <= other
+        return NotImplemented
+
+    def __gt__(self, other: 'Roman | int') -> bool:
+        """Сравнение (>) с Roman или int."""
+        if isinstance(other, Roman):
+            return self.__value > other.__value
+        if isinstance(other, int):
+            return self.__value > other
+        return NotImplemented
+
+    def __ge__(self, other: 'Roman | int') -> bool:
+        """Сравнение (>=) с Roman или int."""
+        if isinstance(other, Roman):
+            return self.__value >= other.__value
+        if isinstance(other, int):
+            return self.__value >= other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Хеш совпадает с хешем арабского значения (согласовано с __eq__)."""
+        return hash(self.__value)
+
+    def __int__(self) -> int:
+        """Преобразование в int."""
+        return self.__value
+
+    def __index__(self) -> int:
+        """Использование в качестве индекса и в range()."""
+        return self.__value
 
     def __add__(self, other: 'Roman | int') -> 'Roman':
         """Перегрузка оператора сложения (+).
@@ -141,20 +596,23 @@ class Roman:
             other (Roman | int): Число для сложения
             
         Returns:
-            Roman: Новый объект Roman с результатом
+            Roman: Канонический объект Roman с результатом
             
         Raises:
-            TypeError: Если other не Roman или int
+            ValueError: Если результат больше MMMCMXCIX (3999)
             
         Пример:
             >>> Roman(10) + Roman(5)
             Roman('XV')
         """
-        if isinstance(other, Roman):
-            return Roman(self.value + other.value)
-        if isinstance(other, int):
-            return Roman(self.value + other)
-        return NotImplemented
+        other_value = Roman.__operand(other)
+        if other_value is None:
+            return NotImplemented
+        return Roman.__result(self.__value + other_value)
+
+    def __radd__(self, other: int) -> 'Roman':
+        """Сложение с числом слева (5 + Roman)."""
+        return self.__add__(other)
 
     def __sub__(self, other: 'Roman | int') -> 'Roman':
         """Перегрузка оператора вычитания (-).
@@ -168,31 +626,139 @@ class Roman:
             >>> Roman(10) - Roman(5)
             Roman('V')
         """
-        result = self.value - (other.value if isinstance(other, Roman) else other)
-        if result < 1:
-            raise ValueError("Результат не может быть меньше I (1)")
-        return Roman(result)
+        other_value = Roman.__operand(other)
+        if other_value is None:
+            return NotImplemented
+        return Roman.__result(self.__value - other_value)
+
+    def __rsub__(self, other: int) -> 'Roman':
+        """Вычитание из числа слева (10 - Roman)."""
+        other_value = Roman.__operand(other)
+        if other_value is None:
+            return NotImplemented
+        return Roman.__result(other_value - self.__value)
 
     def __mul__(self, other: 'Roman | int') -> 'Roman':
         """Перегрузка оператора умножения (*).
         
+        Raises:
+            ValueError: Если результат вне диапазона 1-3999
+            
         Пример:
             >>> Roman(3) * Roman(4)
             Roman('XII')
         """
-        # Реализация аналогична __add__
+        other_value = Roman.__operand(other)
+        if other_value is None:
+            return NotImplemented
+        return Roman.__result(self.__value * other_value)
+
+    def __rmul__(self, other: int) -> 'Roman':
+        """Умножение на число слева (3 * Roman)."""
+        return self.__mul__(other)
+
+    def __floordiv__(self, other: 'Roman | int') -> 'Roman':
+        """Перегрузка оператора целочисленного деления (//).
+        
+        Raises:
+            ZeroDivisionError: При делении на ноль
+            ValueError: Если частное меньше I (1)
+            
+        Пример:
+            >>> Roman(10) // Roman(3)
+            Roman('III')
+        """
+        other_value = Roman.__operand(other)
+        if other_value is None:
+            return NotImplemented
+        if other_value == 0:
+            raise ZeroDivisionError("Деление на ноль")
+        return Roman.__result(self.__value // other_value)
+
+    def __rfloordiv__(self, other: int) -> 'Roman':
+        """Целочисленное деление числа слева (100 // Roman)."""
+        other_value = Roman.__operand(other)
+        if other_value is None:
+            return NotImplemented
+        return Roman.__result(other_value // self.__value)
 
     def __truediv__(self, other: 'Roman | int') -> 'Roman':
         """Перегрузка оператора деления (/). Целочисленное деление.
         
         Raises:
             ZeroDivisionError: При делении на ноль
+            ValueError: Если частное меньше I (1)
             
         Пример:
             >>> Roman(10) / Roman(3)
             Roman('III')
         """
-        # Реализация аналогична __add__ с проверкой на ноль
+        return self.__floordiv__(other)
+
+    def __rtruediv__(self, other: int) -> 'Roman':
+        """Деление числа слева (100 / Roman). Целочисленное деление."""
+        return self.__rfloordiv__(other)
+
+    def __mod__(self, other: 'Roman | int') -> 'Roman':
+        """Перегрузка оператора остатка от деления (%).
+        
+        Raises:
+            ZeroDivisionError: При делении на ноль
+            ValueError: Если остаток равен нулю (в римской записи нуля нет)
+            
+        Пример:
+            >>> Roman(10) % Roman(3)
+            Roman('I')
+        """
+        other_value = Roman.__operand(other)
+        if other_value is None:
+            return NotImplemented
+        if other_value == 0:
+            raise ZeroDivisionError("Деление на ноль")
+        return Roman.__result(self.__value % other_value)
+
+    def __rmod__(self, other: int) -> 'Roman':
+        """Остаток от деления числа слева (100 % Roman)."""
+        other_value = Roman.__operand(other)
+        if other_value is None:
+            return NotImplemented
+        return Roman.__result(other_value % self.__value)
+
+    def __divmod__(self, other: 'Roman | int') -> tuple['Roman', 'Roman']:
+        """Перегрузка divmod(): частное и остаток.
+        
+        Raises:
+            ZeroDivisionError: При делении на ноль
+            ValueError: Если частное или остаток меньше I (1)
+            
+        Пример:
+            >>> divmod(Roman(10), Roman(3))
+            (Roman('III'), Roman('I'))
+        """
+        other_value = Roman.__operand(other)
+        if other_value is None:
+            return NotImplemented
+        if other_value == 0:
+            raise ZeroDivisionError("Деление на ноль")
+        quotient, remainder = divmod(self.__value, other_value)
+        return Roman.__result(quotient), Roman.__result(remainder)
+
+    def __rdivmod__(self, other: int) -> tuple['Roman', 'Roman']:
+        """divmod() для числа слева: divmod(100, Roman)."""
+        other_value = Roman.__operand(other)
+        if other_value is None:
+            return NotImplemented
+        quotient, remainder = divmod(other_value, self.__value)
+        return Roman.__result(quotient), Roman.__result(remainder)
+
+    # Объекты неизменяемы, поэтому составное присваивание (+= и т.д.)
+    # связывает имя с новым каноническим экземпляром
+    __iadd__ = __add__
+    __isub__ = __sub__
+    __imul__ = __mul__
+    __itruediv__ = __truediv__
+    __ifloordiv__ = __floordiv__
+    __imod__ = __mod__
 
     def __str__(self) -> str:
         """Строковое представление в римском формате.
@@ -201,7 +767,7 @@ class Roman:
             >>> str(Roman(42))
             'XLII'
         """
-        return self.int_to_roman(self.value)
+        return self.__str
 
     def __repr__(self) -> str:
         """Официальное строковое представление объекта.
@@ -210,15 +776,210 @@ class Roman:
             >>> Roman(5)
             Roman('V')
         """
-        return f"Roman('{self}')"
+        return self.__repr
+
+
+
+class _ExpressionCompiler:
+    """Разбор выражения методом Пратта и компиляция в замыкания.
+    
+    Каждый узел дерева становится функцией от словаря переменных,
+    возвращающей Roman. Узел операции знает свой фрагмент исходного
+    текста, чтобы сообщить, в каком подвыражении произошла ошибка.
+    """
+
+    _TOKEN = re.compile(r'\s*(?:(\d+)|([A-Za-z_]\w*)|(//|[-+*/%()])|(\S))')
+    # Сила связывания бинарных операторов (все левоассоциативные)
+    _BINDING_POWER = {'+': 10, '-': 10, '*': 20, '/': 20, '//': 20, '%': 20}
+    _OPERATIONS = {
+        '+': operator.add, '-': operator.sub, '*': operator.mul,
+        '/': operator.truediv, '//': operator.floordiv, '%': operator.mod,
+    }
+
+    def __init__(self, text: str) -> None:
+        """Разбиение текста на лексемы.
+        
+        Args:
+            text (str): Текст выражения
+            
+        Raises:
+            ValueError: При недопустимом символе
+        """
+        self._text = text
+        # Лексемы: (вид, значение, начало, конец); вид - number, name, op, end
+        self._tokens: list[tuple[str, str, int, int]] = []
+        for match in self._TOKEN.finditer(text):
+            number, name, op, unknown = match.groups()
+            if unknown is not None:
+                raise ValueError(f"Недопустимый символ '{unknown}' в позиции {match.start(4)}")
+            kind, index = ('number', 1) if number else ('name', 2) if name else ('op', 3)
+            self._tokens.append((kind, match.group(index), match.start(index), match.end(index)))
+        self._tokens.append(('end', '', len(text), len(text)))
+        self._position = 0
+
+    def compile(self) -> Callable[[dict], 'Roman']:
+        """Компиляция всего выражения.
+        
+        Returns:
+            Callable[[dict], Roman]: Функция от словаря переменных
+            
+        Raises:
+            ValueError: При синтаксической ошибке
+        """
+        node, _, _ = self._expression(0)
+        kind, value, start, _ = self._tokens[self._position]
+        if kind != 'end':
+            raise ValueError(f"Лишняя лексема '{value}' в позиции {start}")
+        return node
+
+    def _advance(self) -> tuple[str, str, int, int]:
+        """Получение текущей лексемы и переход к следующей."""
+        token = self._tokens[self._position]
+        self._position += 1
+        return token
+
+    def _expression(self, min_power: int) -> tuple[Callable[[dict], 'Roman'], int, int]:
+        """Разбор выражения с операторами силы больше min_power.
+        
+        Returns:
+            tuple: Скомпилированный узел, начало и конец его текста
+        """
+        node, start, end = self._prefix()
+        while True:
+            kind, value, _, _ = self._tokens[self._position]
+            power = self._BINDING_POWER.get(value) if kind == 'op' else None
+            if power is None or power <= min_power:
+                return node, start, end
+            self._advance()
+            right, _, end = self._expression(power)
+            node = self._binary(self._OPERATIONS[value], node, right,
+                                self._text[start:end])
+
+    def _prefix(self) -> tuple[Callable[[dict], 'Roman'], int, int]:
+        """Разбор операнда: числа, переменной или выражения в скобках."""
+        kind, value, start, end = self._advance()
+        if kind == 'number':
+            try:
+                constant = Roman(int(value))
+            except ValueError as error:
+                raise ValueError(f"Подвыражение '{value}': {error}") from None
+            return (lambda variables: constant), start, end
+        if kind == 'name':
+            try:
+                constant = Roman(value)
+            except ValueError:
+                return self._variable(value), start, end
+            return (lambda variables: constant), start, end
+        if value == '(':
+            node, _, _ = self._expression(0)
+            kind, closing, position, end = self._advance()
+            if closing != ')':
+                raise ValueError(f"Ожидается ')' в позиции {position}")
+            return node, start, end
+        if kind == 'end':
+            raise ValueError("Неожиданный конец выражения")
+        raise ValueError(f"Неожиданная лексема '{value}' в позиции {start}")
+
+    @staticmethod
+    def _variable(name: str) -> Callable[[dict], 'Roman']:
+        """Узел переменной: значение берется из словаря при вычислении."""
+        def node(variables: dict) -> 'Roman':
+            try:
+                value = variables[name]
+            except KeyError:
+                raise ValueError(f"Неизвестная переменная: {name}") from None
+            return value if isinstance(value, Roman) else Roman(value)
+        return node
+
+    @staticmethod
+    def _binary(operation: Callable, left: Callable[[dict], 'Roman'],
+                right: Callable[[dict], 'Roman'], text: str) -> Callable[[dict], 'Roman']:
+        """Узел бинарной операции.
+        
+        Операнды вычисляются вне блока try, поэтому ошибка сообщается
+        для самого внутреннего подвыражения, где она возникла.
+        """
+        text = text.strip()
+
+        def node(variables: dict) -> 'Roman':
+            a = left(variables)
+            b = right(variables)
+            try:
+                return operation(a, b)
+            except (ValueError, ZeroDivisionError) as error:
+                raise type(error)(f"Подвыражение '{text}': {error}") from None
+        return node
+
+
+@functools.lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile_expression(text: str) -> Callable[[dict], 'Roman']:
+    """Компиляция выражения с кэшированием по тексту (см. Roman.evaluate)."""
+    return _ExpressionCompiler(text).compile()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Консольная утилита потокового преобразования файлов.
+    
+    Каждая строка входного файла - одно число. Некорректные строки
+    выводятся в stderr с номером, а в выходной файл пишется пустая строка.
+    
+    Args:
+        argv (list[str] | None): Аргументы командной строки
+        
+    Returns:
+        int: Код возврата (0 - без ошибок, 1 - были некорректные строки)
+        
+    Примеры:
+        python week3.1.1.py to-roman numbers.txt -o romans.txt
+        cat romans.txt | python week3.1.1.py to-int > numbers.txt
+    """
+    parser = argparse.ArgumentParser(description="Преобразование римских чисел")
+    parser.add_argument('direction', choices=['to-roman', 'to-int'],
+                        help="Направление преобразования")
+    parser.add_argument('input', nargs='?', default='-',
+                        help="Входной файл (по умолчанию stdin)")
+    parser.add_argument('-o', '--output', default='-',
+                        help="Выходной файл (по умолчанию stdout)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Количество строк в порции")
+    args = parser.parse_args(argv)
+
+    source: TextIO = (sys.stdin if args.input == '-'
+                      else open(args.input, 'r', encoding='utf-8'))
+    target: TextIO = (sys.stdout if args.output == '-'
+                      else open(args.output, 'w', encoding='utf-8'))
+    error_count = 0
+    try:
+        for results, errors in Roman.convert_stream(
+                source, args.direction == 'to-roman', args.chunk_size):
+            results.append('')
+            target.write('\n'.join(results))
+            if errors:
+                error_count += len(errors)
+                sys.stderr.write(''.join(f"Строка {number}: некорректное значение '{text}'\n"
+                                         for number, text in errors))
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    if error_count:
+        sys.stderr.write(f"Некорректных строк: {error_count}\n")
+    return 1 if error_count else 0
     
     
     # Пример использования
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main())
+
     a = Roman("X")
     b = Roman(5)
     
     print(f"{a} + {b} = {a + b}")  # X + V = XV (15)
     print(f"{a} - {b} = {a - b}")  # X - V = V (5)
     print(f"{a} * {b} = {a * b}")  # X * V = L (50)
-    print(f"{a} / {b} = {a / b}")  # X / V = II (2)
\ No newline at end of file
+    print(f"{a} / {b} = {a / b}")  # X / V = II (2)
+    print(f"{a} % 3 = {a % 3}")  # X % 3 = I (1)
+    print(f"divmod({a}, 3) = {divmod(a, 3)}")  # (III, I)
+    print(f"MCM + XLV * II - (X / III) = {Roman.evaluate('MCM + XLV * II - (X / III)')}")
\ No newline at end of file
@@ -1,14 +1,48 @@
+import argparse
+import json
+import os
+import sys
+import threading
 from abc import ABC, abstractmethod
 
+from analytics import SalesAnalytics
+from inventory import BillOfMaterials, Inventory
+from kitchen import STAGES, Kitchen
+from order_journal import OrderJournal
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 class Pizza(ABC):
-    """Базовый класс для всех видов пицц"""
-    
-    def __init__(self):
-        self.name = ""
-        self.dough = ""
-        self.sauce = ""
-        self.toppings = []
-        self.price = 0
+    """Базовый класс для всех видов пицц
+
+    Рецепт (тесто, соус, начинка, цена) задается атрибутами класса,
+    у экземпляров нет собственных данных (__slots__ пуст), поэтому пицца
+    неизменяема, а PepperoniPizza() всегда возвращает один общий объект.
+
+    Методы prepare, bake, cut и pack - хуки этапов приготовления:
+    их по очереди вызывает Order.execute или, этап за этапом, Kitchen.
+    """
+
+    __slots__ = ()
+
+    stages = STAGES
+    name = ""
+    dough = ""
+    sauce = ""
+    toppings = ()
+    price = 0
+
+    _flyweights = {}
+
+    def __new__(cls):
+        pizza = Pizza._flyweights.get(cls)
+        if pizza is None:
+            pizza = Pizza._flyweights[cls] = super().__new__(cls)
+        return pizza
 
     def prepare(self):
         """Процесс подготовки пиццы"""
@@ -29,91 +63,337 @@ class Pizza(ABC):
         """Процесс упаковки"""
         print("Упаковываем в фирменную коробку.")
 
+    def __reduce__(self):
+        return (type(self), ())
+
     def __str__(self):
         return f"{self.name} ({self.price} руб.)"
 
 class PepperoniPizza(Pizza):
     """Пицца Пепперони"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Пепперони"
-        self.dough = "тонкое"
-        self.sauce = "томатный"
-        self.toppings = ["пепперони", "сыр моцарелла"]
-        self.price = 350
+
+    __slots__ = ()
+    name = "Пепперони"
+    dough = "тонкое"
+    sauce = "томатный"
+    toppings = ("пепперони", "сыр моцарелла")
+    price = 350
 
 class BBQPizza(Pizza):
     """Пицца Барбекю"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Барбекю"
-        self.dough = "толстое"
-        self.sauce = "барбекю"
-        self.toppings = ["курица", "лук", "сыр моцарелла"]
-        self.price = 450
+
+    __slots__ = ()
+    name = "Барбекю"
+    dough = "толстое"
+    sauce = "барбекю"
+    toppings = ("курица", "лук", "сыр моцарелла")
+    price = 450
 
 class SeafoodPizza(Pizza):
     """Пицца Дары Моря"""
-    
-    def __init__(self):
-        super().__init__()
-        self.name = "Дары Моря"
-        self.dough = "тонкое"
-        self.sauce = "чесночный"
-        self.toppings = ["креветки", "мидии", "сыр моцарелла"]
-        self.price = 550
+
+    __slots__ = ()
+    name = "Дары Моря"
+    dough = "тонкое"
+    sauce = "чесночный"
+    toppings = ("креветки", "мидии", "сыр моцарелла")
+    price = 550
+
+class OrderLine:
+    """Позиция заказа: общий объект пиццы, количество и модификаторы"""
+
+    __slots__ = ('pizza', 'quantity', 'modifiers')
+
+    def __init__(self, pizza: Pizza, quantity: int = 1, modifiers: tuple = ()):
+        self.pizza = pizza
+        self.quantity = quantity
+        self.modifiers = modifiers
+
+    @property
+    def total(self) -> int:
+        """Стоимость позиции"""
+        return self.pizza.price * self.quantity
+
+    def __str__(self):
+        text = self.pizza.name
+        if self.modifiers:
+            text += f" [{', '.join(self.modifiers)}]"
+        if self.quantity > 1:
+            text += f" × {self.quantity}"
+        return f"{text} ({self.total} руб.)"
+
+class OrderSequence:
+    """Атомарный генератор номеров заказов.
+
+    Внутри процесса номера выдаются под блокировкой, поэтому потоки
+    не получают одинаковых номеров. Если указан файл, последний выданный
+    номер хранится в нем и изменяется под файловой блокировкой, что
+    исключает повторы между процессами и после перезапуска. Чтобы не
+    обращаться к файлу за каждым номером, процесс может резервировать
+    сразу block_size номеров (номера останутся уникальными, но разные
+    процессы будут получать их не подряд).
+    """
+
+    def __init__(self, path: str = None, block_size: int = 1, start: int = 0):
+        if block_size < 1:
+            raise ValueError("Размер блока должен быть положительным")
+        self.path = path
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._next = start + 1
+        self._limit = start + 1 if path else None
+
+    @property
+    def value(self) -> int:
+        """Последний выданный номер (0, если номеров еще не было)"""
+        return self._next - 1
+
+    def next(self) -> int:
+        """Получение следующего номера"""
+        with self._lock:
+            if self._limit is not None and self._next >= self._limit:
+                self._next, self._limit = self._reserve()
+            number = self._next
+            self._next += 1
+            return number
+
+    def reset(self, value: int):
+        """Продолжение нумерации после номера value (например, при восстановлении)"""
+        with self._lock:
+            if self.path:
+                with self._locked_file() as file:
+                    self._write(file, max(value, self._read(file)))
+                self._limit = self._next = value + 1
+            else:
+                self._next = value + 1
+
+    def _reserve(self) -> tuple:
+        """Резервирование блока номеров в файле"""
+        with self._locked_file() as file:
+            first = self._read(file) + 1
+            self._write(file, first + self.block_size - 1)
+        return first, first + self.block_size
+
+    def _locked_file(self):
+        """Открытие файла последовательности с эксклюзивной блокировкой"""
+        return _LockedFile(self.path)
+
+    @staticmethod
+    def _read(file) -> int:
+        file.seek(0)
+        data = file.read().strip()
+        return int(data) if data else 0
+
+    @staticmethod
+    def _write(file, value: int):
+        file.seek(0)
+        file.truncate()
+        file.write(str(value).encode())
+        file.flush()
+        os.fsync(file.fileno())
+
+
+class _LockedFile:
+    """Файл, открытый на чтение и запись под межпроцессной блокировкой"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.file = None
+
+    def __enter__(self):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        self.file = os.fdopen(fd, 'r+b')
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+        return self.file
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        self.file.close()
+
 
 class Order:
     """Класс для управления заказом"""
     
-    order_counter = 0
+    # Общая последовательность номеров; для сохранения нумерации между
+    # запусками можно заменить на OrderSequence("orders.seq")
+    order_counter = OrderSequence()
+    # Журнал событий заказов (см. open_journal); None - заказы только в памяти
+    journal = None
     
     def __init__(self):
-        Order.order_counter += 1
-        self.order_number = Order.order_counter
-        self.pizzas = []
+        self.order_number = Order.order_counter.next()
+        self.lines = []
+        self._total = 0
+        self._log('created')
+
+    @classmethod
+    def restore(cls, order_number: int) -> 'Order':
+        """Пустой заказ с известным номером (при восстановлении из журнала)"""
+        order = cls.__new__(cls)
+        order.order_number = order_number
+        order.lines = []
+        order._total = 0
+        return order
+
+    def add_pizza(self, pizza: Pizza, quantity: int = 1, modifiers: tuple = ()) -> OrderLine:
+        """Добавление пиццы в заказ
+
+        Одинаковые пиццы с одинаковыми модификаторами объединяются в одну
+        позицию с количеством, например "Пепперони × 50".
+        """
+        if not isinstance(quantity, int) or quantity < 1:
+            raise ValueError(f"Неверное количество: {quantity}")
+        modifiers = tuple(modifiers)
+        for line in self.lines:
+            if line.pizza is pizza and line.modifiers == modifiers:
+                line.quantity += quantity
+                break
+        else:
+            line = OrderLine(pizza, quantity, modifiers)
+            self.lines.append(line)
+        self._total += pizza.price * quantity
+        self._log('item_added', pizza.name, quantity, modifiers)
+        return line
+
+    def remove_pizza(self, index: int, quantity: int = 1) -> Pizza:
+        """Удаление пиццы (quantity штук) из позиции заказа по индексу"""
+        line = self.lines[index]
+        if not 1 <= quantity <= line.quantity:
+            raise ValueError(f"Неверное количество: {quantity}")
+        line.quantity -= quantity
+        if line.quantity == 0:
+            del self.lines[index]
+        self._total -= line.pizza.price * quantity
+        self._log('item_removed', index, quantity)
+        return line.pizza
+
+    def confirm(self):
+        """Подтверждение заказа клиентом"""
+        self._log('confirmed')
+
+    def mark_paid(self, amount: float):
+        """Отметка об оплате заказа"""
+        self._log('paid', amount)
+
+    def mark_executed(self):
+        """Отметка о выполнении заказа"""
+        self._log('executed')
+
+    def mark_ingested(self):
+        """Отметка о передаче оплаченного заказа дальше без выполнения
 
-    def add_pizza(self, pizza: Pizza):
-        """Добавление пиццы в заказ"""
-        self.pizzas.append(pizza)
+        Заказ завершен для терминала: после сбоя он не восстанавливается
+        и повторно не выполняется.
+        """
+        self._log('ingested')
+
+    def cancel(self):
+        """Отмена заказа"""
+        self._log('cancelled')
+
+    def _log(self, event: str, *args):
+        """Запись события заказа в журнал, если он подключен"""
+        journal = Order.journal
+        if journal is not None:
+            getattr(journal, event)(self.order_number, *args)
+
+    @property
+    def pizzas(self) -> list:
+        """Все пиццы заказа поштучно (ссылки на общие объекты пицц)"""
+        return [line.pizza for line in self.lines for _ in range(line.quantity)]
+
+    @property
+    def pizza_count(self) -> int:
+        """Количество пицц в заказе"""
+        return sum(line.quantity for line in self.lines)
 
     def calculate_total(self) -> int:
-        """Расчет общей суммы заказа"""
-        return sum(pizza.price for pizza in self.pizzas)
+        """Общая сумма заказа (поддерживается при добавлении и удалении)"""
+        return self._total
 
     def execute(self):
         """Выполнение заказа"""
         print("\nПриготовление заказа:")
-        for pizza in self.pizzas:
-            pizza.prepare()
-            pizza.bake()
-            pizza.cut()
-            pizza.pack()
+        for line in self.lines:
+            pizza = line.pizza
+            for _ in range(line.quantity):
+                for stage in pizza.stages:
+                    getattr(pizza, stage)()
         print("Заказ готов! Приятного аппетита!")
 
     def __str__(self):
-        pizzas = "\n".join(f"- {pizza}" for pizza in self.pizzas)
+        lines = "\n".join(f"- {line}" for line in self.lines)
         return (f"Заказ №{self.order_number}\n"
-                f"Состав:\n{pizzas}\n"
+                f"Состав:\n{lines}\n"
                 f"Итого: {self.calculate_total()} руб.\n")
 
+class Menu:
+    """Каталог меню.
+
+    Текст меню и спецификации ингредиентов формируются при создании
+    каталога, а поиск по номеру или названию выполняется по словарю.
+    Пиццы неизменяемы, поэтому все заказы ссылаются на одни и те же
+    объекты из каталога.
+    """
+
+    def __init__(self, pizza_classes: list):
+        self.items = [pizza_class() for pizza_class in pizza_classes]
+        self._by_key = {}
+        for i, pizza in enumerate(self.items, 1):
+            self._by_key[str(i)] = pizza
+            self._by_key[pizza.name.lower()] = pizza
+        # Описание каждой позиции, чтобы можно было скрыть недоступные
+        self.entries = [
+            f"{i}. {pizza.name} - {pizza.price} руб.\n"
+            f"   Тесто: {pizza.dough}, Соус: {pizza.sauce}\n"
+            f"   Начинка: {', '.join(pizza.toppings)}"
+            for i, pizza in enumerate(self.items, 1)]
+        self.text = "\n".join(["\nМеню:", *self.entries])
+        self.bill_of_materials = BillOfMaterials(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def find(self, key: str):
+        """Пицца по номеру в меню или названию (None, если не найдена)
+
+        Пиццы неизменяемы, поэтому найденный объект добавляется в заказ
+        как есть, без копирования.
+        """
+        return self._by_key.get(key.strip().lower())
+
+
+# Каталог строится один раз при загрузке модуля и общий для всех терминалов
+MENU = Menu([PepperoniPizza, BBQPizza, SeafoodPizza])
+
 class Terminal:
     """Класс для взаимодействия с пользователем"""
     
-    def __init__(self):
-        self.menu = [PepperoniPizza, BBQPizza, SeafoodPizza]
+    def __init__(self, menu: Menu = MENU, kitchen: Kitchen = None,
+                 inventory: Inventory = None, analytics: SalesAnalytics = None):
+        self.menu = menu
+        self.kitchen = kitchen
+        # Склад ингредиентов; None - остатки не учитываются
+        self.inventory = inventory
+        # Показатели продаж по выполненным заказам; None - не собираются
+        self.analytics = analytics
         self.current_order = None
 
     def show_menu(self):
-        """Отображение меню"""
-        print("\nМеню:")
-        for i, pizza_class in enumerate(self.menu, 1):
-            pizza = pizza_class()
-            print(f"{i}. {pizza.name} - {pizza.price} руб.")
-            print(f"   Тесто: {pizza.dough}, Соус: {pizza.sauce}")
-            print(f"   Начинка: {', '.join(pizza.toppings)}")
+        """Отображение меню (пиццы, для которых не хватает ингредиентов, скрыты)"""
+        if self.inventory is None:
+            print(self.menu.text)
+            return
+        entries = [entry for entry, ok in
+                   zip(self.menu.entries, self.inventory.availability()) if ok]
+        print("\n".join(["\nМеню:", *entries]) if entries else "\nВсе пиццы закончились")
 
     def process_order(self):
         """Обработка заказа"""
@@ -121,33 +401,66 @@ class Terminal:
         
         while True:
             self.show_menu()
-            print("\nКоманды: добавить [номер], подтвердить, отменить, выход")
+            print("\nКоманды: добавить [номер или название] [количество], "
+                  "удалить [позиция в заказе], подтвердить, отменить, выход")
             command = input("Введите команду: ").strip().lower()
             
             if command == "подтвердить":
-                if not self.current_order.pizzas:
+                if not self.current_order.lines:
                     print("Добавьте пиццы в заказ!")
                     continue
                 print("\nТекущий заказ:")
                 print(self.current_order)
                 if input("Подтвердить заказ? (да/нет): ").lower() == "да":
-                    self.process_payment()
+                    try:
+                        reservation = self.reserve(self.current_order)
+                    except ValueError as error:
+                        print(error)
+                        continue
+                    try:
+                        self.current_order.confirm()
+                        self.process_payment()
+                    except BaseException:
+                        self.release(reservation)
+                        raise
                     return
             elif command == "отменить":
+                self.current_order.cancel()
                 self.current_order = None
                 print("Заказ отменен")
                 return
             elif command == "выход":
+                self.current_order.cancel()
                 exit()
             elif command.startswith("добавить"):
+                parts = command.split(maxsplit=1)
+                if len(parts) < 2:
+                    print("Неверная команда")
+                    continue
+                key, quantity = parts[1], 1
+                pizza = self.menu.find(key)
+                if pizza is None:
+                    # Последнее слово может быть количеством: "добавить 1 50"
+                    words = key.rsplit(maxsplit=1)
+                    if len(words) == 2 and words[1].isdigit() and int(words[1]) > 0:
+                        pizza = self.menu.find(words[0])
+                        quantity = int(words[1])
+                if pizza is not None and self.inventory is not None \
+                        and not self.inventory.can_make(pizza, quantity):
+                    print(f"{pizza.name}: недостаточно ингредиентов")
+                elif pizza is not None:
+                    self.current_order.add_pizza(pizza, quantity)
+                    print(f"Добавлена {pizza.name}" + (f" × {quantity}" if quantity > 1 else ""))
+                else:
+                    print("Неверный номер пиццы")
+            elif command.startswith("удалить"):
                 try:
-                    pizza_num = int(command.split()[1])
-                    if 1 <= pizza_num <= len(self.menu):
-                        pizza = self.menu[pizza_num-1]()
-                        self.current_order.add_pizza(pizza)
-                        print(f"Добавлена {pizza.name}")
+                    position = int(command.split()[1])
+                    if 1 <= position <= len(self.current_order.lines):
+                        pizza = self.current_order.remove_pizza(position-1)
+                        print(f"Удалена {pizza.name}")
                     else:
-                        print("Неверный номер пиццы")
+                        print("Неверная позиция в заказе")
                 except (IndexError, ValueError):
                     print("Неверная команда")
             else:
@@ -161,16 +474,152 @@ class Terminal:
         while True:
             try:
                 amount = float(input("Введите сумму оплаты: "))
-                if amount >= total:
-                    if amount > total:
-                        print(f"Сдача: {amount - total:.2f} руб.")
-                    print("Оплата принята!")
-                    self.current_order.execute()
-                    break
-                else:
-                    print("Недостаточно средств!")
             except ValueError:
                 print("Неверная сумма!")
+                continue
+            try:
+                change = self.pay(self.current_order, amount)
+            except ValueError:
+                print("Недостаточно средств!")
+                continue
+            self.current_order.mark_paid(amount)
+            if change:
+                print(f"Сдача: {change:.2f} руб.")
+            print("Оплата принята!")
+            self.send_to_kitchen(self.current_order)
+            break
+
+    def create_order(self, items: list) -> Order:
+        """Создание заказа без диалога с пользователем
+
+        Позиция - номер или название пиццы из меню либо словарь
+        {"pizza": номер или название, "qty": количество}. Все позиции
+        проверяются до создания заказа, поэтому при ошибке номер заказа
+        не расходуется.
+        """
+        return self._build_order(self._resolve(items))
+
+    @staticmethod
+    def pay(order: Order, amount: float) -> float:
+        """Прием оплаты заказа; возвращает сдачу
+
+        Исключение ValueError - если суммы недостаточно.
+        """
+        return Terminal._change(order.calculate_total(), amount)
+
+    def place_order(self, items: list, payment: float, execute: bool = False) -> dict:
+        """Создание и оплата заказа одним вызовом
+
+        Позиции и сумма оплаты проверяются до создания заказа. Возвращает
+        словарь с номером заказа, суммой и сдачей. При execute=True
+        оплаченный заказ передается на выполнение, иначе он считается
+        переданным дальше (например, в файл результатов ingest_orders)
+        и в журнале отмечается как завершенный. Если заказ не удалось
+        создать или оплатить, резерв ингредиентов возвращается на склад.
+        """
+        resolved = self._resolve(items)
+        total = sum(pizza.price * quantity for pizza, quantity in resolved)
+        change = self._change(total, payment)
+        reservation = self.reserve(resolved)
+        try:
+            order = self._build_order(resolved)
+            order.confirm()
+            order.mark_paid(payment)
+        except BaseException:
+            self.release(reservation)
+            raise
+        if execute:
+            self.send_to_kitchen(order)
+        else:
+            order.mark_ingested()
+        return {"order": order.order_number, "total": total, "change": change}
+
+    def reserve(self, items):
+        """Резервирование ингредиентов под заказ (если ведется учет остатков)
+
+        items - заказ или пары (пицца, количество). Исключение
+        ValueError - если ингредиентов не хватает.
+        """
+        if self.inventory is None:
+            return None
+        return self.inventory.reserve(items)
+
+    def release(self, reservation):
+        """Возврат резерва ингредиентов на склад (None - резерва не было)"""
+        if reservation is not None:
+            self.inventory.release(reservation)
+
+    def _resolve(self, items: list) -> list:
+        """Проверка позиций заказа: список пар (пицца, количество)"""
+        if not items:
+            raise ValueError("Заказ пуст")
+        resolved = []
+        for item in items:
+            quantity = 1
+            if isinstance(item, dict):
+                quantity = item.get("qty", 1)
+                item = item.get("pizza")
+            pizza = self.menu.find(str(item)) if item is not None else None
+            if pizza is None:
+                raise ValueError(f"Нет в меню: {item}")
+            if not isinstance(quantity, int) or quantity < 1:
+                raise ValueError(f"Неверное количество: {quantity}")
+            resolved.append((pizza, quantity))
+        return resolved
+
+    @staticmethod
+    def _build_order(resolved: list) -> Order:
+        order = Order()
+        for pizza, quantity in resolved:
+            order.add_pizza(pizza, quantity)
+        return order
+
+    @staticmethod
+    def _change(total: float, amount: float) -> float:
+        if not amount >= total:
+            raise ValueError("Недостаточно средств")
+        return amount - total
+
+    def send_to_kitchen(self, order: Order):
+        """Передача заказа на выполнение
+
+        Без кухни заказ выполняется сразу. С кухней терминал не ждет
+        приготовления и может принимать следующий заказ.
+        """
+        if self.kitchen is None:
+            order.execute()
+            self._completed(order)
+            return
+
+        def done(future):
+            if future.exception() is None:
+                self._completed(order)
+                print(f"\nЗаказ №{order.order_number} готов! Приятного аппетита!")
+            else:
+                print(f"\nОшибка при приготовлении заказа №{order.order_number}: "
+                      f"{future.exception()}")
+
+        self.kitchen.submit_threadsafe(order).add_done_callback(done)
+        print(f"Заказ №{order.order_number} передан на кухню")
+
+    def _completed(self, order: Order):
+        """Учет выполненного заказа"""
+        order.mark_executed()
+        if self.analytics is not None:
+            self.analytics.record(order)
+
+    def recover(self, orders: list):
+        """Обработка заказов, восстановленных из журнала после сбоя
+
+        Оплаченные заказы передаются на выполнение, неоплаченные
+        (диалог с клиентом прерван) отменяются.
+        """
+        for order in orders:
+            if order.status == 'paid':
+                print(f"Восстановлен оплаченный заказ №{order.order_number}")
+                self.send_to_kitchen(order)
+            else:
+                order.cancel()
 
     def start(self):
         """Запуск терминала"""
@@ -181,6 +630,127 @@ class Terminal:
                 print("До свидания!")
                 break
 
+
+def open_journal(path: str, menu: Menu = MENU, **options) -> tuple:
+    """Открытие журнала заказов и восстановление состояния после сбоя
+
+    Нумерация заказов продолжается с последнего номера в журнале,
+    журнал подключается к Order до закрытия (journal.close() или выход
+    из with возвращают прежний Order.journal). Возвращает журнал и список
+    незавершенных заказов (у каждого атрибут status: 'open',
+    'confirmed' или 'paid').
+    """
+    journal = OrderJournal(path, **options)
+    previous = Order.journal
+
+    def detach():
+        if Order.journal is journal:
+            Order.journal = previous
+
+    Order.journal = None
+    journal.on_close(detach)
+    try:
+        orders = []
+        for record in journal.state.orders.values():
+            order = Order.restore(record.number)
+            for name, quantity, modifiers in record.lines:
+                pizza = menu.find(name)
+                if pizza is not None:
+                    order.add_pizza(pizza, quantity, modifiers)
+            order.status = record.status
+            orders.append(order)
+        if journal.state.last_order_number > Order.order_counter.value:
+            Order.order_counter.reset(journal.state.last_order_number)
+    except BaseException:
+        Order.journal = previous
+        journal.close()
+        raise
+    Order.journal = journal
+    return journal, orders
+
+
+def ingest_orders(source, target, terminal: Terminal = None,
+                  batch_size: int = 1000, execute: bool = False) -> tuple:
+    """Пакетная обработка заказов в формате JSON Lines
+
+    Каждая строка source - объект {"items": [...], "payment": сумма}
+    (позиции как в Terminal.create_order). Для каждой строки в target
+    пишется результат {"line": N, "order": ..., "total": ..., "change": ...}
+    или {"line": N, "error": "..."}; ошибки не прерывают обработку.
+    Результаты накапливаются и записываются пакетами по batch_size строк.
+    Возвращает количество принятых и отклоненных заказов.
+    """
+    terminal = terminal or Terminal()
+    dumps = json.dumps
+    accepted = rejected = 0
+    batch = []
+    for number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+            result = terminal.place_order(request["items"], request["payment"], execute)
+            accepted += 1
+        except (ValueError, KeyError, TypeError) as error:
+            result = {"error": str(error) if not isinstance(error, KeyError)
+                      else f"Нет поля {error}"}
+            rejected += 1
+        result["line"] = number
+        batch.append(dumps(result, ensure_ascii=False))
+        if len(batch) >= batch_size:
+            if Order.journal is not None:
+                Order.journal.flush()  # результаты выдаются после записи в журнал
+            batch.append("")
+            target.write("\n".join(batch))
+            batch = []
+    if batch:
+        if Order.journal is not None:
+            Order.journal.flush()
+        batch.append("")
+        target.write("\n".join(batch))
+    return accepted, rejected
+
+
+def main(argv: list = None):
+    """Запуск терминала или пакетной обработки заказов (--ingest)"""
+    parser = argparse.ArgumentParser(description="Терминал пиццерии")
+    parser.add_argument("--ingest", metavar="FILE",
+                        help="Обработать заказы из файла JSON Lines ('-' - stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="Файл для результатов (по умолчанию stdout)")
+    parser.add_argument("--journal", metavar="FILE",
+                        help="Журнал заказов для восстановления после сбоя")
+    parser.add_argument("--stock", metavar="FILE",
+                        help="Остатки ингредиентов, JSON {ингредиент: порций}")
+    args = parser.parse_args(argv)
+
+    inventory = None
+    if args.stock:
+        with open(args.stock, encoding="utf-8") as file:
+            inventory = Inventory(MENU.bill_of_materials, json.load(file))
+    terminal = Terminal(inventory=inventory)
+    journal = None
+    if args.journal:
+        # При пакетной обработке события фиксируются пакетами (см. ingest_orders)
+        journal, orders = open_journal(args.journal, wait_for_commit=args.ingest is None)
+        terminal.recover(orders)
+    try:
+        if args.ingest is None:
+            terminal.start()
+            return
+        source = sys.stdin if args.ingest == "-" else open(args.ingest, encoding="utf-8")
+        target = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+        try:
+            accepted, rejected = ingest_orders(source, target, terminal)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if target is not sys.stdout:
+                target.close()
+        print(f"Принято заказов: {accepted}, отклонено: {rejected}", file=sys.stderr)
+    finally:
+        if journal is not None:
+            journal.close()
+
 if __name__ == "__main__":
-    terminal = Terminal()
-    terminal.start()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -11,8 +11,7 @@ def test_money_operations():
     
     # Сохранение/загрузка
     total.save("total.json")
-    loaded_money = Money(0, "USD")
-    loaded_money.load("total.json")
+    loaded_money = Money.load("total.json")
     
     print("Тестирование класса Money:")
     print(f"Зарплата: {salary}")
@@ -1,5 +1,7 @@
 import json
 from money import Money
+from money_bag import MoneyBag
+from money_binary import load_binary, save_binary
 
 class MoneyCollection:
     """
@@ -106,6 +108,46 @@ class MoneyCollection:
                 raise ValueError("Некорректный формат данных")
             self._data.append(Money(item["amount"], item["currency"]))
 
+    def save_binary(self, filename):
+        """
+        Назначение:
+            Сохранение коллекции в компактный двоичный файл (см. money_binary)
+
+        Параметры:
+            filename (str): Имя файла для сохранения
+        """
+        save_binary(filename, self._data)
+
+    def load_binary(self, filename):
+        """
+        Назначение:
+            Загрузка коллекции из двоичного файла
+
+            Записи проверяются контрольной суммой файла, а суммы и коды
+            валют - один раз для всего массива, поэтому элементы
+            создаются без повторной проверки каждой суммы.
+
+        Параметры:
+            filename (str): Имя файла для загрузки
+
+        Исключения:
+            ValueError: При неверном формате или повреждении файла
+        """
+        self._data = load_binary(filename).to_money()
+
+    def totals(self):
+        """
+        Назначение:
+            Итоги коллекции по валютам
+
+            Элементы в разных валютах суммируются за один проход,
+            пересчет в одну валюту - MoneyBag.total.
+
+        Результат:
+            MoneyBag: Накопитель с итогом по каждой валюте
+        """
+        return MoneyBag(self._data)
+
     @property
     def count(self):
         """
@@ -0,0 +1,214 @@
+import numbers
+import operator
+from itertools import islice
+from typing import Iterable, Iterator, Sequence, Union
+
+import numpy
+
+from money import Money
+from money_array import MoneyArray, currency_index
+
+# Порция потокового распределения в долях
+DEFAULT_CHUNK_SIZE = 65536
+
+# Произведения весов в целочисленном пути должны оставаться в пределах int64
+_INT64_LIMIT = 2 ** 63
+
+
+def _result(shares: numpy.ndarray, currency: str) -> MoneyArray:
+    """
+    Назначение:
+        MoneyArray долей в валюте исходной суммы
+    """
+    return MoneyArray._from_valid(shares, numpy.full(shares.size, currency_index(currency),
+                                                     dtype=numpy.uint16))
+
+
+def _distribute(shares: numpy.ndarray, remainders: numpy.ndarray, leftover: int) -> None:
+    """
+    Назначение:
+        Добавление по одной минорной единице leftover долям с наибольшими
+        остатками (при равных остатках - долям с меньшим номером)
+
+        Порог находится частичной сортировкой, поэтому время O(n).
+    """
+    if not leftover:
+        return
+    threshold = numpy.partition(remainders, remainders.size - leftover)[remainders.size - leftover]
+    above = remainders > threshold
+    shares[above] += 1
+    tied = numpy.flatnonzero(remainders == threshold)[:leftover - int(numpy.count_nonzero(above))]
+    shares[tied] += 1
+
+
+def _weights(weights: Union[Sequence[float], numpy.ndarray]) -> numpy.ndarray:
+    """
+    Назначение:
+        Проверка весов и приведение к int64 (если все веса целые) или float64
+
+    Исключения:
+        ValueError: При пустых, отрицательных или нулевых в сумме весах
+    """
+    values = numpy.asarray(weights)
+    if values.ndim != 1 or not values.size:
+        raise ValueError("Нужен хотя бы один вес")
+    if values.dtype.kind not in 'biuf':
+        raise ValueError("Веса должны быть числами")
+    if values.dtype.kind == 'f':
+        if not numpy.isfinite(values).all():
+            raise ValueError("Веса должны быть числами")
+        if (values == numpy.floor(values)).all() and values.max() < 2 ** 53:
+            values = values.astype(numpy.int64)
+    elif values.dtype != numpy.int64:
+        values = values.astype(numpy.int64)
+    if (values < 0).any():
+        raise ValueError("Веса не могут быть отрицательными")
+    if not values.any():
+        raise ValueError("Сумма весов должна быть положительной")
+    return values
+
+
+def allocate(total: Money, weights: Union[int, Sequence[float], numpy.ndarray]) -> MoneyArray:
+    """
+    Назначение:
+        Точное распределение суммы по весам методом наибольших остатков
+
+        Каждая доля получает целую часть своей квоты total * w / sum(w)
+        в минорных единицах, а оставшиеся единицы достаются долям
+        с наибольшими дробными остатками. Сумма долей всегда равна
+        исходной, каждая доля отличается от квоты меньше чем на одну
+        минорную единицу. Для целых весов вычисления целочисленные,
+        для дробных - во float64.
+
+    Параметры:
+        total (Money): Распределяемая сумма
+        weights (int | Sequence[float] | numpy.ndarray): Количество равных
+            долей или вес каждой доли (например, [3, 2, 1] или [0.5, 0.3, 0.2])
+
+    Результат:
+        MoneyArray: Доли в валюте исходной суммы
+
+    Исключения:
+        ValueError: При некорректных весах
+    """
+    minor_units = total.minor_units
+    if isinstance(weights, numbers.Integral):
+        # Количество частей может быть и целым NumPy (numpy.int64)
+        weights = operator.index(weights)
+        if weights <= 0:
+            raise ValueError("Количество частей должно быть положительным")
+        part, remainder = divmod(minor_units, weights)
+        shares = numpy.full(weights, part, dtype=numpy.int64)
+        shares[:remainder] += 1
+        return _result(shares, total.currency)
+    values = _weights(weights)
+    if values.dtype.kind == 'i':
+        if float(values.sum(dtype=numpy.float64)) * float(values.max()) >= _INT64_LIMIT:
+            raise ValueError("Сумма весов слишком велика")
+        total_weight = int(values.sum())
+        # total * w = (q * W + r) * w, где r < W: произведение r * w помещается в int64
+        whole, rest = divmod(minor_units, total_weight)
+        products = rest * values
+        shares = whole * values + products // total_weight
+        remainders = products % total_weight
+    else:
+        quotas = minor_units * (values / values.sum())
+        floors = numpy.floor(quotas)
+        shares = floors.astype(numpy.int64)
+        remainders = quotas - floors
+    leftover = minor_units - int(shares.sum())
+    if not 0 <= leftover <= shares.size:
+        raise ValueError("Недостаточная точность дробных весов для такой суммы")
+    _distribute(shares, remainders, leftover)
+    return _result(shares, total.currency)
+
+
+def iter_split(total: Money, parts: int,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[MoneyArray]:
+    """
+    Назначение:
+        Потоковое разделение суммы на parts равных долей порциями
+
+        Доли те же, что у allocate(total, parts): первые остаток
+        долей больше на одну минорную единицу.
+
+    Параметры:
+        total (Money): Распределяемая сумма
+        parts (int): Количество долей
+        chunk_size (int): Количество долей в порции
+
+    Результат:
+        Iterator[MoneyArray]: Последовательные порции долей
+    """
+    parts = operator.index(parts)
+    if parts <= 0:
+        raise ValueError("Количество частей должно быть положительным")
+    part, remainder = divmod(total.minor_units, parts)
+    for start in range(0, parts, chunk_size):
+        shares = numpy.full(min(chunk_size, parts - start), part, dtype=numpy.int64)
+        shares[:max(0, remainder - start)] += 1
+        yield _result(shares, total.currency)
+
+
+def iter_allocate(total: Money, weights: Iterable[int], total_weight: int,
+                  chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[MoneyArray]:
+    """
+    Назначение:
+        Потоковое распределение суммы по целым весам
+
+        Веса читаются порциями, в памяти находится только одна порция.
+        Доля i - разность округленных вниз накопленных квот
+        floor(total * C_i / W) - floor(total * C_(i-1) / W), где C_i -
+        сумма весов первых i долей. Сумма долей точно равна исходной,
+        и каждая доля отличается от своей квоты меньше чем на одну
+        минорную единицу, но лишние единицы могут достаться не тем
+        долям, что в allocate (для этого нужны все остатки сразу).
+        Вычисления целочисленные; если произведения остатка суммы на
+        накопленный вес не помещаются в int64 (W**2 >= 2**63), они
+        выполняются с целыми Python (медленнее, но точно).
+
+    Параметры:
+        total (Money): Распределяемая сумма
+        weights (Iterable[int]): Неотрицательные целые веса
+        total_weight (int): Сумма всех весов
+        chunk_size (int): Количество долей в порции
+
+    Результат:
+        Iterator[MoneyArray]: Последовательные порции долей
+
+    Исключения:
+        ValueError: При нецелых или отрицательных весах или если сумма
+            весов не совпадает с total_weight
+    """
+    total_weight = operator.index(total_weight)
+    if total_weight <= 0:
+        raise ValueError("Сумма весов должна быть положительной")
+    if total_weight >= _INT64_LIMIT:
+        raise ValueError("Сумма весов слишком велика")
+    whole, rest = divmod(total.minor_units, total_weight)
+    # rest * C_i < W**2: при большой сумме весов - произведения целых Python
+    exact = rest * total_weight >= _INT64_LIMIT
+    consumed = allocated = 0
+    source = iter(weights)
+    while True:
+        # Без dtype, чтобы дробные веса не усекались до целых молча
+        chunk = numpy.array(list(islice(source, chunk_size)))
+        if not chunk.size:
+            break
+        if chunk.ndim != 1 or chunk.dtype.kind not in 'iu':
+            raise ValueError("Веса должны быть целыми числами")
+        chunk = chunk.astype(numpy.int64, copy=False)
+        if (chunk < 0).any():
+            raise ValueError("Веса не могут быть отрицательными")
+        cumulative = consumed + numpy.cumsum(chunk)
+        if cumulative[-1] > total_weight:
+            raise ValueError("Сумма весов превышает total_weight")
+        if exact:
+            quotas = (rest * cumulative.astype(object) // total_weight).astype(numpy.int64)
+        else:
+            quotas = rest * cumulative // total_weight
+        floors = whole * cumulative + quotas
+        yield _result(numpy.diff(floors, prepend=allocated), total.currency)
+        consumed, allocated = int(cumulative[-1]), int(floors[-1])
+    if consumed != total_weight:
+        raise ValueError("Сумма весов не совпадает с total_weight")
@@ -0,0 +1,274 @@
+"""Сравнение Money на целых минорных единицах с прежней реализацией на float,
+пакетных операций MoneyArray с циклом по объектам Money и пакетного
+разбора строк с Money.from_string, двоичного формата MNY1 с JSON,
+графиков процентов с цепочкой Money.apply_interest, распределения
+суммы по весам с циклом по объектам Money, итогов по валютам MoneyBag
+с группировкой в цикле.
+
+Запуск:
+    python bench_money.py              # суммы из 10M слагаемых
+    python bench_money.py 1000000
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy
+
+from allocation import allocate, iter_allocate
+from interest import compound, schedule
+from money import Money
+from MoneyCollection import MoneyCollection
+from money_array import MoneyArray
+from money_bag import MoneyBag
+from money_binary import MoneyFile, load_binary, save_binary
+from money_parser import parse_many
+from rates import RateTable
+
+
+class LegacyMoney:
+    """Прежнее представление суммы (float с round в каждом конструкторе) для сравнения"""
+
+    def __init__(self, amount: float, currency: str = "USD") -> None:
+        if amount < 0:
+            raise ValueError("Сумма не может быть отрицательной")
+        if len(currency) != 3:
+            raise ValueError("Неверный формат валюты")
+        self.amount = round(amount, 2)
+        self.currency = currency.upper()
+
+    def __add__(self, other: 'LegacyMoney') -> 'LegacyMoney':
+        if self.currency != other.currency:
+            raise ValueError("Разные валюты")
+        return LegacyMoney(self.amount + other.amount, self.currency)
+
+
+def running_sum(cls: type, terms: int, amount: float) -> tuple:
+    """
+    Назначение:
+        Сложение terms одинаковых сумм оператором +
+
+    Результат:
+        tuple: (итоговая сумма, операций в секунду)
+    """
+    step = cls(amount, "USD")
+    total = cls(0, "USD")
+    start = time.perf_counter()
+    for _ in range(terms):
+        total = total + step
+    elapsed = time.perf_counter() - start
+    return total, terms / elapsed
+
+
+def ledger_total(items: list, attribute: str):
+    """Итог по списку сумм накоплением значений атрибута (amount или minor_units)"""
+    total = 0
+    for item in items:
+        total += getattr(item, attribute)
+    return total
+
+
+def best_time(func, repeat: int = 3) -> float:
+    """Минимальное время выполнения func в секундах"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def array_speedup(count: int) -> None:
+    """Ускорение MoneyArray относительно цикла по объектам Money"""
+    rng = numpy.random.default_rng(0)
+    minor_units = rng.integers(0, 1_000_000, count)
+    currencies = rng.choice(["USD", "EUR", "GBP"], count)
+    mixed = MoneyArray.from_minor(minor_units, currencies)
+    usd = MoneyArray.from_minor(minor_units, "USD")
+    mixed_items, usd_items = mixed.to_money(), usd.to_money()
+
+    def loop_sum():
+        totals = {}
+        for item in mixed_items:
+            previous = totals.get(item.currency)
+            totals[item.currency] = item if previous is None else previous + item
+
+    table = RateTable({("EUR", "USD"): 1.08, ("GBP", "USD"): 1.27})
+    cases = (
+        ("сложение", lambda: [a + b for a, b in zip(usd_items, usd_items)], lambda: usd + usd),
+        ("итог по валютам", loop_sum, mixed.sum),
+        ("проценты", lambda: [item.apply_interest(5) for item in usd_items],
+         lambda: usd.apply_interest(5)),
+        ("конвертация", lambda: [item.convert_to("EUR", 0.92) for item in usd_items],
+         lambda: usd.convert_to("EUR", 0.92)),
+        ("кросс-курсы", lambda: [table.convert(item, "GBP") for item in mixed_items],
+         lambda: table.convert_many(mixed, "GBP")),
+    )
+    print(f"MoneyArray и цикл по Money, {count:,} сумм:")
+    for title, loop, vectorized in cases:
+        before, after = best_time(loop, 1), best_time(vectorized)
+        print(f"  {title:<16} цикл: {before * 1e3:8.1f} мс  MoneyArray: {after * 1e3:7.2f} мс  "
+              f"ускорение: x{before / after:.0f}")
+
+
+def parse_speedup(count: int) -> None:
+    """Скорость parse_many и цикла Money.from_string при разной доле ошибок"""
+    rng = numpy.random.default_rng(0)
+    wholes = rng.integers(0, 100_000, count).tolist()
+    cents = rng.integers(0, 100, count).tolist()
+    currencies = rng.choice(["USD", "EUR", "GBP"], count).tolist()
+    print(f"Разбор {count:,} строк '100.00 USD':")
+    for bad_share in (0.0, 0.05, 0.5):
+        bad = (rng.random(count) < bad_share).tolist()
+        lines = ["сумма не указана\n" if is_bad else f"{whole}.{cent:02d} {currency}\n"
+                 for whole, cent, currency, is_bad in zip(wholes, cents, currencies, bad)]
+
+        def from_string_loop():
+            parsed, errors = [], []
+            for number, line in enumerate(lines, 1):
+                try:
+                    parsed.append(Money.from_string(line))
+                except ValueError as error:
+                    errors.append((number, line, str(error)))
+
+        before, after = best_time(from_string_loop, 1), best_time(lambda: parse_many(lines))
+        print(f"  ошибок {bad_share:4.0%}: from_string {count / before / 1e3:6.0f} тыс. строк/с  "
+              f"parse_many {count / after / 1e3:6.0f} тыс. строк/с  ускорение: x{before / after:.1f}")
+
+
+def serialization_speed(count: int) -> None:
+    """Сохранение и загрузка count сумм: JSON MoneyCollection и двоичный формат"""
+    rng = numpy.random.default_rng(0)
+    array = MoneyArray.from_minor(rng.integers(0, 10**9, count),
+                                  rng.choice(["USD", "EUR", "GBP"], count))
+    collection = MoneyCollection()
+    collection._data = array.to_money()
+    print(f"Сериализация {count:,} сумм:")
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "money.json")
+        binary_path = os.path.join(directory, "money.mny")
+        results = [
+            ("JSON", best_time(lambda: collection.save(json_path), 1),
+             best_time(lambda: MoneyCollection().load(json_path), 1), json_path),
+            ("MNY1", best_time(lambda: save_binary(binary_path, array), 1),
+             best_time(lambda: load_binary(binary_path), 1), binary_path),
+        ]
+        for title, save_time, load_time, path in results:
+            print(f"  {title}: запись {save_time:6.2f} с, чтение {load_time:6.2f} с, "
+                  f"{os.path.getsize(path) / 1e6:7.1f} МБ")
+        with MoneyFile(binary_path, verify=False) as money_file:
+            indexes = rng.integers(0, count, 100_000).tolist()
+            elapsed = best_time(lambda: [money_file[i] for i in indexes])
+        print(f"  MNY1, произвольный доступ через mmap: {elapsed / len(indexes) * 1e9:.0f} нс на запись")
+
+
+def interest_speedup(count: int, periods: int = 360) -> None:
+    """Ежемесячные проценты за 30 лет: цикл apply_interest и графики interest"""
+    rng = numpy.random.default_rng(0)
+    principals = MoneyArray.from_minor(rng.integers(0, 10**8, count))
+    items = principals.to_money()
+
+    def loop():
+        for item in items:
+            for _ in range(periods):
+                item = item.apply_interest(0.4)
+
+    print(f"Проценты, {count:,} сумм x {periods} периодов:")
+    before = best_time(loop, 1)
+    cases = (
+        ("compound", lambda: compound(principals, 0.4, periods)),
+        ("schedule", lambda: schedule(principals, 0.4, periods)),
+        ("final", lambda: compound(principals, 0.4, periods, "final")),
+    )
+    print(f"  цикл apply_interest: {before * 1e3:8.1f} мс")
+    for title, func in cases:
+        after = best_time(func)
+        print(f"  {title:<19} {after * 1e3:8.2f} мс  ускорение: x{before / after:.0f}")
+
+
+def allocation_speed(count: int) -> None:
+    """Распределение суммы по count весам: цикл по Money и allocate"""
+    rng = numpy.random.default_rng(0)
+    weights = rng.integers(1, 1000, count)
+    weight_list, total_weight = weights.tolist(), int(weights.sum())
+    total = Money(1_000_000.07)
+
+    def loop():
+        # Наибольшие остатки на int Python с объектом Money на долю
+        minor_units = total.minor_units
+        shares = [divmod(minor_units * weight, total_weight) for weight in weight_list]
+        leftover = minor_units - sum(share for share, _ in shares)
+        order = sorted(range(count), key=lambda i: -shares[i][1])[:leftover]
+        bonus = set(order)
+        return [Money.from_minor(share + (i in bonus), total.currency)
+                for i, (share, _) in enumerate(shares)]
+
+    def stream():
+        for _ in iter_allocate(total, weight_list, total_weight):
+            pass
+
+    print(f"Распределение суммы по {count:,} весам:")
+    before = best_time(loop, 1)
+    print(f"  цикл по Money: {before * 1e3:8.1f} мс")
+    for title, func in (("allocate", lambda: allocate(total, weights)),
+                        ("iter_allocate", stream),
+                        ("равные доли", lambda: allocate(total, count))):
+        after = best_time(func)
+        print(f"  {title:<14} {after * 1e3:8.2f} мс  ускорение: x{before / after:.0f}")
+
+
+def bag_speed(count: int) -> None:
+    """Итог проводок в разных валютах: группировка в цикле и MoneyBag"""
+    rng = numpy.random.default_rng(0)
+    items = MoneyArray.from_minor(rng.integers(0, 1_000_000, count),
+                                  rng.choice(["USD", "EUR", "GBP", "JPY"], count)).to_money()
+    table = RateTable({("EUR", "USD"): 1.08, ("GBP", "USD"): 1.27, ("USD", "JPY"): 150})
+
+    def loop():
+        # Группировка по валютам и конвертация каждой проводки
+        totals = {}
+        for item in items:
+            converted = item if item.currency == "USD" else table.convert(item, "USD")
+            previous = totals.get(converted.currency)
+            totals[converted.currency] = converted if previous is None else previous + converted
+
+    def merged():
+        # Четыре независимых накопителя (как в разных процессах), объединенных в конце
+        step = count // 4 + 1
+        return MoneyBag.merged(MoneyBag(items[start:start + step])
+                               for start in range(0, count, step)).total("USD", table)
+
+    print(f"Итог {count:,} проводок в 4 валютах в USD:")
+    before = best_time(loop, 1)
+    print(f"  цикл с конвертацией: {before * 1e3:8.1f} мс")
+    for title, func in (("MoneyBag", lambda: MoneyBag(items).total("USD", table)),
+                        ("MoneyBag x4 + merge", merged)):
+        after = best_time(func)
+        print(f"  {title:<20} {after * 1e3:8.2f} мс  ускорение: x{before / after:.1f}")
+
+
+if __name__ == "__main__":
+    terms = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    print(f"Скорость сложения, {terms:,} операций:")
+    for cls in (LegacyMoney, Money):
+        _, speed = running_sum(cls, terms, 19.99)
+        print(f"  {cls.__name__:>11}: {speed / 1e6:.2f} млн сложений/с")
+
+    print(f"Итог по {terms:,} проводкам (сумма значений без промежуточного округления):")
+    amounts = (0.01, 0.1, 19.99)
+    items = [Money(amounts[i % 3], "USD") for i in range(terms)]
+    expected = sum(round(amounts[i % 3] * 100) for i in range(terms))
+    print(f"  ожидается:          {expected // 100}.{expected % 100:02d}")
+    as_float = ledger_total(items, "amount")
+    print(f"  float (amount):     {as_float:.6f}  ошибка {as_float - expected / 100:+.6f}")
+    minor = ledger_total(items, "minor_units")
+    print(f"  int (minor_units):  {minor // 100}.{minor % 100:02d}  "
+          f"{'точно' if minor == expected else 'с ошибкой'}")
+
+    array_speedup(min(terms, 1_000_000))
+    parse_speedup(min(terms, 1_000_000))
+    serialization_speed(terms)
+    interest_speedup(min(terms, 10_000))
+    allocation_speed(min(terms, 1_000_000))
+    bag_speed(min(terms, 1_000_000))
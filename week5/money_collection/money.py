@@ -1,16 +1,147 @@
 import json
-from typing import Union, List
+import numbers
+import sys
+from decimal import Decimal, InvalidOperation
+from typing import Any, Union, List
+
+# Число знаков дробной части (минорных единиц) для валют, где оно
+# отличается от двух: у иены нет копеек, у динаров - тысячные доли
+CURRENCY_EXPONENTS = {
+    "JPY": 0, "KRW": 0, "VND": 0, "CLP": 0, "ISK": 0, "UGX": 0,
+    "BHD": 3, "KWD": 3, "OMR": 3, "JOD": 3, "TND": 3, "LYD": 3, "IQD": 3,
+}
+DEFAULT_EXPONENT = 2
+
+# Проверенные коды валют: исходная строка -> интернированный код в верхнем
+# регистре. Коды всех объектов Money интернированы, поэтому валюты можно
+# сравнивать по ссылке (is), а одинаковые коды хранятся в одном экземпляре
+_CURRENCY_CODES = {}
+
+
+def currency_code(currency: str) -> str:
+    """
+    Назначение:
+        Проверка и нормализация кода валюты
+
+    Параметры:
+        currency (str): Код валюты из 3 латинских букв в любом регистре
+
+    Результат:
+        str: Интернированный код в верхнем регистре
+
+    Исключения:
+        ValueError: При неверном формате валюты
+    """
+    code = _CURRENCY_CODES.get(currency)
+    if code is None:
+        if (not isinstance(currency, str) or len(currency) != 3
+                or not (currency.isascii() and currency.isalpha())):
+            raise ValueError("Неверный формат валюты")
+        code = _CURRENCY_CODES[currency] = sys.intern(currency.upper())
+    return code
+
+
+def currency_exponent(currency: str) -> int:
+    """
+    Назначение:
+        Число знаков дробной части для валюты
+
+    Параметры:
+        currency (str): Код валюты в верхнем регистре
+
+    Результат:
+        int: Количество десятичных знаков минорной единицы
+    """
+    return CURRENCY_EXPONENTS.get(currency, DEFAULT_EXPONENT)
+
+
+def to_minor_units(amount: Union[int, float], exponent: int) -> int:
+    """
+    Назначение:
+        Перевод суммы в целое число минорных единиц (центов, копеек)
+
+    Параметры:
+        amount (int | float): Сумма в основных единицах
+        exponent (int): Число знаков дробной части валюты
+
+    Результат:
+        int: Сумма в минорных единицах с округлением до ближайшего
+    """
+    if isinstance(amount, int):
+        return amount * 10 ** exponent
+    return round(amount * 10 ** exponent)
+
+
+# Наибольший десятичный порядок суммы в записи (как у float)
+_MAX_DECIMAL_EXPONENT = 308
+
+
+def decimal_to_minor_units(text: str, exponent: int) -> int:
+    """
+    Назначение:
+        Перевод десятичной записи суммы в минорные единицы без float
+
+        Запись - число в формате float ('100.50', '.5', '1e3', '1_000').
+        Лишние знаки дробной части округляются по десятичным цифрам
+        записи до ближайшего (половина - к четному), поэтому '0.125'
+        дает 12 центов, а '1.015' - 102.
+
+    Параметры:
+        text (str): Десятичная запись суммы
+        exponent (int): Число знаков дробной части валюты
+
+    Результат:
+        int: Сумма в минорных единицах (со знаком записи)
+
+    Исключения:
+        ValueError: Если запись не конечное число или сумма слишком велика
+    """
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"Некорректная сумма: {text}") from None
+    if not value.is_finite():
+        raise ValueError(f"Некорректная сумма: {text}")
+    if not value:
+        return 0
+    if value.adjusted() > _MAX_DECIMAL_EXPONENT:
+        raise ValueError("Сумма слишком велика")
+    if value.adjusted() + exponent < -1:
+        return 0  # меньше десятой доли минорной единицы
+    sign, digits, power = value.as_tuple()
+    coefficient = int("".join(map(str, digits)))
+    shift = power + exponent
+    if shift >= 0:
+        minor_units = coefficient * 10 ** shift
+    else:
+        unit = 10 ** -shift
+        minor_units, rest = divmod(coefficient, unit)
+        if 2 * rest > unit or (2 * rest == unit and minor_units % 2):
+            minor_units += 1
+    return -minor_units if sign else minor_units
+
 
 class Money:
     """
     Класс для представления денежных сумм с поддержкой основных арифметических операций,
     конвертации, сохранения/загрузки и дополнительных финансовых операций.
 
+    Сумма хранится целым числом минорных единиц (центов, копеек, для иены -
+    целых иен), поэтому арифметика точная и не накапливает ошибку
+    округления. Свойство amount возвращает сумму в основных единицах.
+
+    Объект неизменяемый и хешируемый, хранится в __slots__ без __dict__,
+    поэтому его можно использовать в множествах и ключах словарей.
+    Результаты арифметических операций создаются без повторной проверки
+    операндов (см. _from_valid).
+
     Атрибуты:
-        amount (float): Сумма денег
+        minor_units (int): Сумма в минорных единицах
         currency (str): Валюта (3 символа)
     """
-    
+
+    __slots__ = ('minor_units', 'currency')
+
     def __init__(self, amount: float, currency: str = "USD") -> None:
         """
         Инициализация денежной единицы
@@ -27,11 +158,117 @@ class Money:
         """
         if amount < 0:
             raise ValueError("Сумма не может быть отрицательной")
-        if len(currency) != 3:
-            raise ValueError("Неверный формат валюты")
-            
-        self.amount = round(amount, 2)
-        self.currency = currency.upper()
+        code = currency_code(currency)
+        _set_currency(self, code)
+        _set_minor_units(self, to_minor_units(amount, currency_exponent(code)))
+
+    @classmethod
+    def from_minor(cls, minor_units: int, currency: str = "USD") -> 'Money':
+        """
+        Назначение:
+            Создание объекта из суммы в минорных единицах
+
+        Параметры:
+            minor_units (int): Сумма в минорных единицах (неотрицательная)
+            currency (str): Код валюты из 3 символов
+
+        Результат:
+            Money: Созданный объект
+
+        Исключения:
+            ValueError: Если сумма отрицательная или не целая,
+                или неверный формат валюты
+        """
+        if not isinstance(minor_units, numbers.Integral):
+            raise ValueError("Сумма в минорных единицах должна быть целой")
+        if minor_units < 0:
+            raise ValueError("Сумма не может быть отрицательной")
+        money = _new_money(cls)
+        _set_currency(money, currency_code(currency))
+        _set_minor_units(money, int(minor_units))
+        return money
+
+    @staticmethod
+    def _from_valid(minor_units: int, currency: str) -> 'Money':
+        """
+        Назначение:
+            Создание объекта без проверок (внутренний путь)
+
+        Параметры:
+            minor_units (int): Неотрицательная сумма в минорных единицах
+            currency (str): Код валюты, уже прошедший currency_code
+        """
+        money = _new_money(Money)
+        _set_minor_units(money, minor_units)
+        _set_currency(money, currency)
+        return money
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """
+        Назначение:
+            Запрет изменения атрибутов (сумма неизменяемая)
+        """
+        raise AttributeError("Сумма неизменяемая")
+
+    def __delattr__(self, key: str) -> None:
+        """
+        Назначение:
+            Запрет удаления атрибутов (сумма неизменяемая)
+        """
+        raise AttributeError("Сумма неизменяемая")
+
+    def __reduce__(self) -> tuple:
+        """
+        Назначение:
+            Поддержка pickle/copy для неизменяемого объекта
+        """
+        return (Money.from_minor, (self.minor_units, self.currency))
+
+    def __hash__(self) -> int:
+        """
+        Назначение:
+            Хеш суммы для использования в множествах и ключах словарей
+
+        Результат:
+            int: Хеш пары (минорные единицы, валюта)
+        """
+        return hash((self.minor_units, self.currency))
+
+    @property
+    def amount(self) -> float:
+        """
+        Назначение:
+            Сумма в основных единицах (для совместимости)
+
+        Результат:
+            float: Сумма, например 100.5 для 10050 центов
+        """
+        return self.minor_units / 10 ** currency_exponent(self.currency)
+
+    @property
+    def exponent(self) -> int:
+        """
+        Назначение:
+            Число знаков дробной части валюты
+
+        Результат:
+            int: 2 для USD, 0 для JPY, 3 для KWD
+        """
+        return currency_exponent(self.currency)
+
+    def _split_units(self) -> tuple:
+        """
+        Назначение:
+            Разделение суммы на целую и дробную части без перевода во float
+
+        Результат:
+            tuple: (целая часть, дробная часть строкой с ведущими нулями)
+        """
+        exponent = currency_exponent(self.currency)
+        if exponent == 0:
+            return self.minor_units, ""
+        whole, fraction = divmod(self.minor_units, 10 ** exponent)
+        return whole, f"{fraction:0{exponent}d}"
 
     def __str__(self) -> str:
         """
@@ -41,7 +278,10 @@ class Money:
         Результат:
             str: Строка в формате '100.50 USD'
         """
-        return f"{self.amount:.2f} {self.currency}"
+        whole, fraction = self._split_units()
+        if fraction:
+            return f"{whole}.{fraction} {self.currency}"
+        return f"{whole} {self.currency}"
     
     def __add__(self, other: 'Money') -> 'Money':
         """
@@ -57,9 +297,15 @@ class Money:
         Исключения:
             ValueError: При разных валютах
         """
-        if self.currency != other.currency:
+        if not isinstance(other, Money):
+            return NotImplemented
+        if self.currency is not other.currency:
             raise ValueError("Разные валюты")
-        return Money(self.amount + other.amount, self.currency)
+        # Тело _from_valid встроено: сложение - самая частая операция
+        money = _new_money(Money)
+        _set_minor_units(money, self.minor_units + other.minor_units)
+        _set_currency(money, self.currency)
+        return money
     
     def __sub__(self, other: 'Money') -> 'Money':
         """
@@ -75,9 +321,14 @@ class Money:
         Исключения:
             ValueError: При разных валютах
         """
-        if self.currency != other.currency:
+        if not isinstance(other, Money):
+            return NotImplemented
+        if self.currency is not other.currency:
             raise ValueError("Разные валюты")
-        return Money(self.amount - other.amount, self.currency)
+        minor_units = self.minor_units - other.minor_units
+        if minor_units < 0:
+            raise ValueError("Сумма не может быть отрицательной")
+        return Money._from_valid(minor_units, self.currency)
     
     def __eq__(self, other: 'Money') -> bool:
         """
@@ -90,7 +341,9 @@ class Money:
         Результат:
             bool: True если суммы и валюты совпадают
         """
-        return self.amount == other.amount and self.currency == other.currency
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.minor_units == other.minor_units and self.currency is other.currency
     
     def __lt__(self, other: 'Money') -> bool:
         """
@@ -106,9 +359,53 @@ class Money:
         Исключения:
             ValueError: При разных валютах
         """
-        if self.currency != other.currency:
+        if not isinstance(other, Money):
+            return NotImplemented
+        if self.currency is not other.currency:
+            raise ValueError("Разные валюты")
+        return self.minor_units < other.minor_units
+
+    def __le__(self, other: 'Money') -> bool:
+        """
+        Назначение:
+            Сравнение сумм (меньше или равно)
+
+        Исключения:
+            ValueError: При разных валютах
+        """
+        if not isinstance(other, Money):
+            return NotImplemented
+        if self.currency is not other.currency:
+            raise ValueError("Разные валюты")
+        return self.minor_units <= other.minor_units
+
+    def __gt__(self, other: 'Money') -> bool:
+        """
+        Назначение:
+            Сравнение сумм (больше)
+
+        Исключения:
+            ValueError: При разных валютах
+        """
+        if not isinstance(other, Money):
+            return NotImplemented
+        if self.currency is not other.currency:
+            raise ValueError("Разные валюты")
+        return self.minor_units > other.minor_units
+
+    def __ge__(self, other: 'Money') -> bool:
+        """
+        Назначение:
+            Сравнение сумм (больше или равно)
+
+        Исключения:
+            ValueError: При разных валютах
+        """
+        if not isinstance(other, Money):
+            return NotImplemented
+        if self.currency is not other.currency:
             raise ValueError("Разные валюты")
-        return self.amount < other.amount
+        return self.minor_units >= other.minor_units
 
     @classmethod
     def from_string(cls, str_value: str) -> 'Money':
@@ -116,6 +413,9 @@ class Money:
         Назначение:
             Создание объекта из строки формата '100.00 USD'
 
+            Сумма переводится в минорные единицы по десятичной записи
+            (см. decimal_to_minor_units), без промежуточного float.
+
         Параметры:
             str_value (str): Входная строка
 
@@ -127,7 +427,8 @@ class Money:
         """
         try:
             amount_str, currency = str_value.split()
-            return cls(float(amount_str), currency)
+            code = currency_code(currency)
+            return cls.from_minor(decimal_to_minor_units(amount_str, currency_exponent(code)), code)
         except Exception as e:
             raise ValueError(f"Некорректный формат строки: {str_value}") from e
 
@@ -146,32 +447,44 @@ class Money:
         with open(filename, 'w') as f:
             json.dump(data, f)
 
-    def load(self, filename: str) -> None:
+    @classmethod
+    def load(cls, filename: str) -> 'Money':
         """
         Назначение:
-            Загрузка объекта из JSON-файла
+            Загрузка суммы из JSON-файла
 
         Параметры:
             filename (str): Путь к файлу для загрузки
+
+        Результат:
+            Money: Новый объект (сумма неизменяемая, поэтому
+                существующие объекты не меняются)
+
+        Исключения:
+            ValueError: Если сумма отрицательная или неверный формат валюты
         """
         with open(filename, 'r') as f:
             data = json.load(f)
-        self.amount = data['amount']
-        self.currency = data['currency']
+        return cls(data['amount'], data['currency'])
 
-    def convert_to(self, target_currency: str, rate: float) -> 'Money':
+    def convert_to(self, target_currency: str, rate: Union[float, 'RateTable']) -> 'Money':
         """
         Назначение:
             Конвертация в другую валюту по указанному курсу
 
         Параметры:
             target_currency (str): Целевая валюта
-            rate (float): Курс обмена (1 текущая = rate целевой)
+            rate (float | RateTable): Курс обмена (1 текущая = rate целевой)
+                или таблица курсов, из которой берется курс пары
 
         Результат:
             Money: Новая сумма в целевой валюте
         """
-        return Money(self.amount * rate, target_currency)
+        target = currency_code(target_currency)
+        if not isinstance(rate, (int, float)):
+            rate = rate.rate(self.currency, target)
+        shift = currency_exponent(target) - currency_exponent(self.currency)
+        return Money.from_minor(round(self.minor_units * rate * 10 ** shift), target)
 
     def apply_interest(self, percent: float) -> 'Money':
         """
@@ -184,13 +497,20 @@ class Money:
         Результат:
             Money: Новая сумма с начисленными процентами
         """
-        return Money(self.amount * (1 + percent/100), self.currency)
+        return Money.from_minor(round(self.minor_units * (1 + percent/100)), self.currency)
 
     def split(self, parts: int) -> List['Money']:
         """
         Назначение:
             Разделение суммы на равные части
 
+        Части считаются в минорных единицах, остаток от деления
+        распределяется по одной единице на первые части (как в
+        allocation.allocate), поэтому сумма частей точно равна исходной,
+        а части отличаются не больше чем на одну минорную единицу.
+        Суммы неизменяемые, поэтому равные части - один и тот же объект.
+        Для долей по весам и больших количеств частей - allocation.allocate.
+
         Параметры:
             parts (int): Количество частей (должно быть > 0)
 
@@ -203,9 +523,10 @@ class Money:
         if parts <= 0:
             raise ValueError("Количество частей должно быть положительным")
             
-        part = round(self.amount / parts, 2)
-        remainder = self.amount - part * (parts-1)
-        return [Money(part, self.currency) for _ in range(parts-1)] + [Money(remainder, self.currency)]
+        part, remainder = divmod(self.minor_units, parts)
+        make = Money._from_valid
+        return ([make(part + 1, self.currency)] * remainder
+                + [make(part, self.currency)] * (parts - remainder))
 
     @property
     def formatted(self) -> str:
@@ -216,7 +537,10 @@ class Money:
         Результат:
             str: Строка в формате 'USD 100.50'
         """
-        return f"{self.currency} {self.amount:,.2f}"
+        whole, fraction = self._split_units()
+        if fraction:
+            return f"{self.currency} {whole:,}.{fraction}"
+        return f"{self.currency} {whole:,}"
 
     @property
     def is_positive(self) -> bool:
@@ -227,4 +551,10 @@ class Money:
         Результат:
             bool: True если сумма больше нуля
         """
-        return self.amount > 0
\ No newline at end of file
+        return self.minor_units > 0
+
+
+# Запись слотов в обход __setattr__ (используется только при создании объекта)
+_new_money = object.__new__
+_set_minor_units = Money.minor_units.__set__
+_set_currency = Money.currency.__set__
@@ -0,0 +1,426 @@
+import threading
+from typing import Dict, Iterable, List, Sequence, Union
+
+import numpy
+
+from money import Money, currency_code, currency_exponent
+
+# Реестр валют: номер валюты хранится в массиве вместо строки кода,
+# а показатели степени для всех валют лежат в массиве с тем же номером
+_CODES: List[str] = []
+_CODE_INDEX: Dict[str, int] = {}
+_SCALES = numpy.zeros(0, dtype=numpy.int64)
+_REGISTRY_LOCK = threading.Lock()
+
+# Минорные единицы хранятся в int64: результат округления должен быть
+# меньше 2**63, иначе приведение типа дает неверное число
+_INT64_BOUND = 2.0 ** 63
+
+
+def currency_index(currency: str) -> int:
+    """
+    Назначение:
+        Номер валюты в реестре (валюта регистрируется при первом обращении)
+
+        Номера используются в MoneyArray.codes вместо строковых кодов.
+
+    Параметры:
+        currency (str): Код валюты из 3 символов
+
+    Результат:
+        int: Номер валюты
+    """
+    code = currency_code(currency)
+    index = _CODE_INDEX.get(code)
+    if index is None:
+        global _SCALES
+        with _REGISTRY_LOCK:
+            index = _CODE_INDEX.get(code)
+            if index is None:
+                index = len(_CODES)
+                _CODES.append(code)
+                _SCALES = numpy.append(_SCALES, 10 ** currency_exponent(code))
+                _CODE_INDEX[code] = index
+    return index
+
+
+def _code_array(currencies: Union[str, Sequence[str]], size: int) -> numpy.ndarray:
+    """
+    Назначение:
+        Массив номеров валют длины size
+
+    Параметры:
+        currencies (str | Sequence[str]): Одна валюта для всех элементов
+            или код валюты для каждого элемента
+        size (int): Количество элементов
+
+    Исключения:
+        ValueError: При неверном коде валюты или несовпадении длины
+    """
+    if isinstance(currencies, str):
+        return numpy.full(size, currency_index(currencies), dtype=numpy.uint16)
+    unique, inverse = numpy.unique(numpy.asarray(currencies, dtype=str), return_inverse=True)
+    if inverse.size != size:
+        raise ValueError("Количество валют не совпадает с количеством сумм")
+    lookup = numpy.array([currency_index(code) for code in unique.tolist()], dtype=numpy.uint16)
+    return lookup[inverse.reshape(-1)]
+
+
+def _rounded_minor_units(values: numpy.ndarray) -> numpy.ndarray:
+    """
+    Назначение:
+        Округление сумм в минорных единицах (float64) и приведение к int64
+
+    Исключения:
+        ValueError: Если сумма не помещается в int64
+    """
+    rounded = numpy.rint(values)
+    if not (numpy.abs(rounded) < _INT64_BOUND).all():
+        raise ValueError("Сумма слишком велика")
+    return rounded.astype(numpy.int64)
+
+
+def _checked_rates(rates: numpy.ndarray) -> numpy.ndarray:
+    """
+    Назначение:
+        Проверка курсов: конечные неотрицательные числа
+
+    Исключения:
+        ValueError: При отрицательном, бесконечном или NaN курсе
+    """
+    if not (numpy.isfinite(rates) & (rates >= 0)).all():
+        raise ValueError("Курс должен быть неотрицательным числом")
+    return rates
+
+
+class MoneyArray:
+    """
+    Массив денежных сумм для пакетных вычислений
+
+    Описание:
+        Суммы хранятся массивом int64 в минорных единицах (как Money.minor_units),
+        валюты - массивом номеров валют. Операции выполняются над всем
+        массивом сразу средствами NumPy, без создания объектов Money
+        для каждого элемента. Как и у Money, суммы неотрицательные,
+        а операции над разными валютами вызывают ValueError.
+        Переполнение int64 при сложении, конвертации и начислении
+        процентов также вызывает ValueError.
+    """
+
+    __slots__ = ('minor_units', 'codes')
+
+    def __init__(self, amounts: Iterable[float], currencies: Union[str, Sequence[str]] = "USD"):
+        """
+        Назначение:
+            Создание массива из сумм в основных единицах
+
+        Параметры:
+            amounts (Iterable[float]): Суммы (неотрицательные)
+            currencies (str | Sequence[str]): Валюта всех сумм или код
+                валюты для каждой суммы
+
+        Исключения:
+            ValueError: При отрицательной или слишком большой сумме
+                или неверном коде валюты
+        """
+        values = numpy.asarray(amounts, dtype=numpy.float64).reshape(-1)
+        codes = _code_array(currencies, values.size)
+        if (values < 0).any():
+            raise ValueError("Сумма не может быть отрицательной")
+        self.minor_units = _rounded_minor_units(values * _SCALES[codes])
+        self.codes = codes
+
+    @classmethod
+    def from_minor(cls, minor_units: Iterable[int],
+                   currencies: Union[str, Sequence[str]] = "USD") -> 'MoneyArray':
+        """
+        Назначение:
+            Создание массива из сумм в минорных единицах
+
+        Параметры:
+            minor_units (Iterable[int]): Суммы в минорных единицах
+            currencies (str | Sequence[str]): Валюта всех сумм или по элементам
+
+        Результат:
+            MoneyArray: Новый массив
+        """
+        values = numpy.asarray(minor_units, dtype=numpy.int64).reshape(-1)
+        if (values < 0).any():
+            raise ValueError("Сумма не может быть отрицательной")
+        return cls._from_valid(values, _code_array(currencies, values.size))
+
+    @classmethod
+    def from_money(cls, items: Sequence[Money]) -> 'MoneyArray':
+        """
+        Назначение:
+            Создание массива из последовательности объектов Money
+
+        Параметры:
+            items (Sequence[Money]): Денежные суммы
+
+        Результат:
+            MoneyArray: Массив с теми же суммами и валютами
+        """
+        count = len(items)
+        minor_units = numpy.fromiter((item.minor_units for item in items),
+                                     dtype=numpy.int64, count=count)
+        index = currency_index
+        codes = numpy.fromiter((index(item.currency) for item in items),
+                               dtype=numpy.uint16, count=count)
+        return cls._from_valid(minor_units, codes)
+
+    @classmethod
+    def _from_valid(cls, minor_units: numpy.ndarray, codes: numpy.ndarray) -> 'MoneyArray':
+        """
+        Назначение:
+            Создание массива без проверок (внутренний путь)
+        """
+        array = cls.__new__(cls)
+        array.minor_units = minor_units
+        array.codes = codes
+        return array
+
+    def to_money(self) -> List[Money]:
+        """
+        Назначение:
+            Преобразование в список объектов Money
+
+        Результат:
+            List[Money]: Денежные суммы по элементам
+        """
+        make = Money._from_valid
+        codes = _CODES
+        return [make(minor, codes[code])
+                for minor, code in zip(self.minor_units.tolist(), self.codes.tolist())]
+
+    @property
+    def currencies(self) -> numpy.ndarray:
+        """
+        Назначение:
+            Коды валют по элементам
+
+        Результат:
+            numpy.ndarray: Массив строк, например ['USD', 'EUR']
+        """
+        return numpy.array(_CODES, dtype='<U3')[self.codes]
+
+    def unique_currencies(self) -> List[str]:
+        """
+        Назначение:
+            Валюты, встречающиеся в массиве
+
+        Результат:
+            List[str]: Коды валют без повторов
+        """
+        present = numpy.zeros(len(_CODES), dtype=bool)
+        present[self.codes] = True
+        return [_CODES[code] for code in numpy.flatnonzero(present).tolist()]
+
+    @property
+    def amounts(self) -> numpy.ndarray:
+        """
+        Назначение:
+            Суммы в основных единицах (float64)
+        """
+        return self.minor_units / _SCALES[self.codes]
+
+    def __len__(self) -> int:
+        return self.minor_units.size
+
+    def __getitem__(self, index) -> Union[Money, 'MoneyArray']:
+        """
+        Назначение:
+            Доступ по индексу, срезу или маске
+
+        Результат:
+            Money или MoneyArray: Элемент или новый массив
+        """
+        if isinstance(index, (int, numpy.integer)):
+            return Money._from_valid(int(self.minor_units[index]), _CODES[self.codes[index]])
+        return MoneyArray._from_valid(self.minor_units[index], self.codes[index])
+
+    def __str__(self) -> str:
+        preview = ", ".join(str(item) for item in self[:5].to_money())
+        more = ", ..." if len(self) > 5 else ""
+        return f"[{preview}{more}] ({len(self)} сумм)"
+
+    def _operand(self, other: Union[Money, 'MoneyArray']) -> numpy.ndarray:
+        """
+        Назначение:
+            Минорные единицы второго операнда с проверкой валют
+
+        Результат:
+            numpy.ndarray | int | None: None, если операнд не Money
+                и не MoneyArray (операция возвращает NotImplemented)
+
+        Исключения:
+            ValueError: При разных валютах
+        """
+        if isinstance(other, MoneyArray):
+            if other.codes is not self.codes and not numpy.array_equal(other.codes, self.codes):
+                raise ValueError("Разные валюты")
+            return other.minor_units
+        if isinstance(other, Money):
+            if (self.codes != currency_index(other.currency)).any():
+                raise ValueError("Разные валюты")
+            return other.minor_units
+        return None
+
+    def __add__(self, other: Union[Money, 'MoneyArray']) -> 'MoneyArray':
+        """
+        Назначение:
+            Поэлементное сложение сумм одной валюты
+
+        Исключения:
+            ValueError: При разных валютах или переполнении int64
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        result = self.minor_units + operand
+        # Слагаемые неотрицательные, поэтому переполнение дает отрицательную сумму
+        if (result < 0).any():
+            raise ValueError("Сумма слишком велика")
+        return MoneyArray._from_valid(result, self.codes)
+
+    def __radd__(self, other: Union[int, Money]) -> 'MoneyArray':
+        """
+        Назначение:
+            Сложение справа: Money + MoneyArray и sum() массивов,
+            который начинает с 0
+        """
+        if isinstance(other, int) and not isinstance(other, bool) and other == 0:
+            return self
+        return self.__add__(other)
+
+    def __sub__(self, other: Union[Money, 'MoneyArray']) -> 'MoneyArray':
+        """
+        Назначение:
+            Поэлементное вычитание сумм одной валюты
+
+        Исключения:
+            ValueError: При разных валютах или отрицательном результате
+        """
+        operand = self._operand(other)
+        if operand is None:
+            return NotImplemented
+        result = self.minor_units - operand
+        if (result < 0).any():
+            raise ValueError("Сумма не может быть отрицательной")
+        return MoneyArray._from_valid(result, self.codes)
+
+    def __eq__(self, other: Union[Money, 'MoneyArray']) -> numpy.ndarray:
+        """
+        Назначение:
+            Поэлементное равенство (суммы и валюты совпадают)
+
+        Результат:
+            numpy.ndarray: Массив bool
+        """
+        if isinstance(other, MoneyArray):
+            return (self.minor_units == other.minor_units) & (self.codes == other.codes)
+        if isinstance(other, Money):
+            return ((self.minor_units == other.minor_units)
+                    & (self.codes == currency_index(other.currency)))
+        return NotImplemented
+
+    def __ne__(self, other: Union[Money, 'MoneyArray']) -> numpy.ndarray:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else ~equal
+
+    __hash__ = None
+
+    def __lt__(self, other: Union[Money, 'MoneyArray']) -> numpy.ndarray:
+        """
+        Назначение:
+            Поэлементное сравнение (меньше)
+
+        Исключения:
+            ValueError: При разных валютах
+        """
+        operand = self._operand(other)
+        return NotImplemented if operand is None else self.minor_units < operand
+
+    def __le__(self, other: Union[Money, 'MoneyArray']) -> numpy.ndarray:
+        operand = self._operand(other)
+        return NotImplemented if operand is None else self.minor_units <= operand
+
+    def __gt__(self, other: Union[Money, 'MoneyArray']) -> numpy.ndarray:
+        operand = self._operand(other)
+        return NotImplemented if operand is None else self.minor_units > operand
+
+    def __ge__(self, other: Union[Money, 'MoneyArray']) -> numpy.ndarray:
+        operand = self._operand(other)
+        return NotImplemented if operand is None else self.minor_units >= operand
+
+    def sum(self) -> Dict[str, Money]:
+        """
+        Назначение:
+            Итоги по каждой валюте
+
+        Результат:
+            Dict[str, Money]: Код валюты -> сумма всех элементов этой валюты
+        """
+        totals = numpy.zeros(len(_CODES), dtype=numpy.int64)
+        numpy.add.at(totals, self.codes, self.minor_units)
+        if (totals < 0).any():
+            raise ValueError("Сумма слишком велика")
+        present = numpy.zeros(len(_CODES), dtype=bool)
+        present[self.codes] = True
+        return {_CODES[code]: Money._from_valid(int(totals[code]), _CODES[code])
+                for code in numpy.flatnonzero(present).tolist()}
+
+    def convert_to(self, target_currency: str,
+                   rates: Union[float, Dict[str, float], numpy.ndarray]) -> 'MoneyArray':
+        """
+        Назначение:
+            Конвертация всех сумм в одну валюту
+
+        Параметры:
+            target_currency (str): Целевая валюта
+            rates: Курс (1 единица исходной валюты = rate целевой): одно
+                число, словарь {валюта: курс} или массив курсов по элементам
+
+        Результат:
+            MoneyArray: Суммы в целевой валюте
+
+        Исключения:
+            ValueError: Если для какой-либо валюты нет курса, курс
+                отрицательный или NaN, или результат не помещается в int64
+        """
+        target = currency_index(target_currency)
+        if isinstance(rates, dict):
+            # Сначала регистрируем все валюты словаря, затем строим таблицу:
+            # регистрация новой валюты увеличивает реестр
+            by_index = {currency_index(currency): rate for currency, rate in rates.items()}
+            by_index.setdefault(target, 1.0)
+            table = numpy.full(len(_CODES), numpy.nan)
+            table[list(by_index)] = _checked_rates(
+                numpy.array(list(by_index.values()), dtype=numpy.float64))
+            rate_vector = table[self.codes]
+            if numpy.isnan(rate_vector).any():
+                missing = sorted({_CODES[code] for code in
+                                  self.codes[numpy.isnan(rate_vector)].tolist()})
+                raise ValueError(f"Нет курса для валют: {', '.join(missing)}")
+        else:
+            rate_vector = _checked_rates(numpy.asarray(rates, dtype=numpy.float64))
+        scale = _SCALES[target] / _SCALES[self.codes]
+        minor_units = _rounded_minor_units(self.minor_units * rate_vector * scale)
+        return MoneyArray._from_valid(minor_units, numpy.full_like(self.codes, target))
+
+    def apply_interest(self, percent: Union[float, numpy.ndarray]) -> 'MoneyArray':
+        """
+        Назначение:
+            Начисление процентов на все суммы
+
+        Параметры:
+            percent (float | numpy.ndarray): Ставка для всех сумм или по элементам
+
+        Результат:
+            MoneyArray: Суммы с начисленными процентами
+        """
+        factor = 1 + numpy.asarray(percent, dtype=numpy.float64) / 100
+        minor_units = _rounded_minor_units(self.minor_units * factor)
+        if (minor_units < 0).any():
+            raise ValueError("Сумма не может быть отрицательной")
+        return MoneyArray._from_valid(minor_units, self.codes)
@@ -0,0 +1,231 @@
+from typing import Dict, Iterable, Iterator, List, Mapping, Union
+
+from money import Money, currency_code
+from money_array import MoneyArray
+
+
+class MoneyBag:
+    """
+    Накопитель сумм в разных валютах
+
+    Описание:
+        Хранит итог по каждой валюте целым числом минорных единиц,
+        поэтому суммы в любых валютах добавляются за один проход без
+        промежуточных объектов Money и без ошибки "Разные валюты".
+        Пересчет в валюту отчета выполняется только при чтении итога
+        (total) по курсам на момент чтения: каждый итог по валюте
+        конвертируется один раз. Накопители, собранные в разных
+        процессах или потоках, объединяются через update или +.
+    """
+
+    __slots__ = ('_totals',)
+
+    def __init__(self, items: Iterable[Money] = ()):
+        """
+        Назначение:
+            Создание накопителя и добавление начальных сумм
+
+        Параметры:
+            items (Iterable[Money] | MoneyArray | MoneyBag): Начальные суммы
+        """
+        self._totals: Dict[str, int] = {}
+        if items:
+            self.add_many(items)
+
+    def __reduce__(self) -> tuple:
+        """
+        Назначение:
+            Поддержка pickle (передача накопителя между процессами)
+        """
+        return (MoneyBag._from_totals, (dict(self._totals),))
+
+    @staticmethod
+    def _from_totals(totals: Dict[str, int]) -> 'MoneyBag':
+        """
+        Назначение:
+            Создание накопителя из готовых итогов (внутренний путь)
+        """
+        bag = MoneyBag()
+        bag._totals.update((currency_code(currency), minor_units)
+                           for currency, minor_units in totals.items())
+        return bag
+
+    def add(self, money: Money) -> 'MoneyBag':
+        """
+        Назначение:
+            Добавление суммы в любой валюте
+
+        Параметры:
+            money (Money): Денежная сумма
+
+        Результат:
+            MoneyBag: Этот же накопитель
+        """
+        totals = self._totals
+        totals[money.currency] = totals.get(money.currency, 0) + money.minor_units
+        return self
+
+    def add_many(self, items: Union[Iterable[Money], MoneyArray, 'MoneyBag']) -> 'MoneyBag':
+        """
+        Назначение:
+            Добавление многих сумм за один проход
+
+            Для MoneyArray итоги по валютам считаются векторно,
+            для MoneyBag итоги складываются поштучно по валютам.
+
+        Параметры:
+            items (Iterable[Money] | MoneyArray | MoneyBag): Суммы
+
+        Результат:
+            MoneyBag: Этот же накопитель
+        """
+        if isinstance(items, MoneyBag):
+            return self.update(items)
+        if isinstance(items, MoneyArray):
+            items = items.sum().values()
+        totals = self._totals
+        get = totals.get
+        for item in items:
+            currency = item.currency
+            totals[currency] = get(currency, 0) + item.minor_units
+        return self
+
+    def update(self, *others: 'MoneyBag') -> 'MoneyBag':
+        """
+        Назначение:
+            Объединение с другими накопителями (например, из разных процессов)
+
+        Результат:
+            MoneyBag: Этот же накопитель
+        """
+        totals = self._totals
+        for other in others:
+            for currency, minor_units in other._totals.items():
+                totals[currency] = totals.get(currency, 0) + minor_units
+        return self
+
+    @classmethod
+    def merged(cls, bags: Iterable['MoneyBag']) -> 'MoneyBag':
+        """
+        Назначение:
+            Новый накопитель с итогами всех переданных накопителей
+        """
+        return cls().update(*bags)
+
+    def __iadd__(self, other: Union[Money, 'MoneyBag']) -> 'MoneyBag':
+        if isinstance(other, Money):
+            return self.add(other)
+        if isinstance(other, MoneyBag):
+            return self.update(other)
+        return NotImplemented
+
+    def __add__(self, other: Union[Money, 'MoneyBag']) -> 'MoneyBag':
+        """
+        Назначение:
+            Новый накопитель: этот плюс сумма или другой накопитель
+        """
+        if not isinstance(other, (Money, MoneyBag)):
+            return NotImplemented
+        result = MoneyBag._from_totals(self._totals)
+        result += other
+        return result
+
+    def __getitem__(self, currency: str) -> Money:
+        """
+        Назначение:
+            Итог по одной валюте
+
+        Исключения:
+            KeyError: Если сумм в этой валюте не было
+        """
+        code = currency_code(currency)
+        return Money._from_valid(self._totals[code], code)
+
+    def __contains__(self, currency: str) -> bool:
+        return currency_code(currency) in self._totals
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def __iter__(self) -> Iterator[Money]:
+        make = Money._from_valid
+        return (make(minor_units, currency) for currency, minor_units in self._totals.items())
+
+    def __eq__(self, other: 'MoneyBag') -> bool:
+        if not isinstance(other, MoneyBag):
+            return NotImplemented
+        return ({currency: units for currency, units in self._totals.items() if units}
+                == {currency: units for currency, units in other._totals.items() if units})
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return " + ".join(str(item) for item in self) if self._totals else "0"
+
+    def currencies(self) -> List[str]:
+        """
+        Назначение:
+            Валюты, в которых были суммы
+        """
+        return list(self._totals)
+
+    def to_dict(self) -> Dict[str, Money]:
+        """
+        Назначение:
+            Итоги по валютам
+
+        Результат:
+            Dict[str, Money]: Код валюты -> итог в этой валюте
+        """
+        return {item.currency: item for item in self}
+
+    def total(self, currency: str, rates: Union['RateTable', Mapping[str, float], None] = None) -> Money:
+        """
+        Назначение:
+            Итог всех валют в валюте отчета
+
+            Итог каждой валюты конвертируется один раз (с округлением
+            как в Money.convert_to), затем результаты складываются
+            в минорных единицах. Курсы всех валют проверяются до
+            конвертации, поэтому в ошибке перечислены все валюты без курса.
+
+        Параметры:
+            currency (str): Валюта отчета
+            rates (RateTable | Mapping[str, float]): Таблица курсов или
+                словарь {валюта: курс к валюте отчета}, коды в любом
+                регистре; не нужен, если все суммы уже в валюте отчета
+
+        Результат:
+            Money: Итог в валюте отчета
+
+        Исключения:
+            ValueError: Если для какой-либо валюты нет курса
+        """
+        target = currency_code(currency)
+        if isinstance(rates, Mapping):
+            rates = {currency_code(code): rate for code, rate in rates.items()}
+        pair_rates = {}
+        missing = []
+        for code in self._totals:
+            if code is target:
+                continue
+            if rates is None:
+                rate = None
+            elif isinstance(rates, dict):
+                rate = rates.get(code)
+            else:
+                try:
+                    rate = rates.rate(code, target)
+                except ValueError:
+                    rate = None
+            if rate is None:
+                missing.append(code)
+            else:
+                pair_rates[code] = rate
+        if missing:
+            raise ValueError(f"Нет курса для валют: {', '.join(sorted(missing))}")
+        minor_units = self._totals.get(target, 0)
+        for code, rate in pair_rates.items():
+            converted = Money._from_valid(self._totals[code], code).convert_to(target, rate)
+            minor_units += converted.minor_units
+        return Money._from_valid(minor_units, target)
@@ -0,0 +1,250 @@
+import os
+import struct
+import zlib
+from typing import Sequence, Union
+
+import numpy
+
+from money import Money, currency_code
+from money_array import MoneyArray, currency_index
+
+# Формат файла: заголовок и записи фиксированной длины без выравнивания.
+#   заголовок: сигнатура b'MNY1', версия (uint16), длина записи (uint16),
+#              количество записей (uint64), crc32 всех записей (uint32)
+#   запись:    сумма в минорных единицах (int64) и код валюты (3 байта ASCII)
+# Все числа little-endian.
+MAGIC = b'MNY1'
+VERSION = 1
+RECORD = numpy.dtype([('minor_units', '<i8'), ('currency', 'S3')])
+_HEADER = struct.Struct('<4sHHQI')
+HEADER_SIZE = _HEADER.size
+
+
+def _records(items: Union[MoneyArray, Sequence[Money]]) -> numpy.ndarray:
+    """
+    Назначение:
+        Массив записей файла из MoneyArray или последовательности Money
+    """
+    array = items if isinstance(items, MoneyArray) else MoneyArray.from_money(items)
+    records = numpy.empty(len(array), dtype=RECORD)
+    records['minor_units'] = array.minor_units
+    if len(array):
+        # Таблица "номер валюты -> три байта кода" вместо преобразования строк
+        table = numpy.zeros(int(array.codes.max()) + 1, dtype='S3')
+        for currency in array.unique_currencies():
+            table[currency_index(currency)] = currency.encode('ascii')
+        records['currency'] = table[array.codes]
+    return records
+
+
+def save_binary(filename: str, items: Union[MoneyArray, Sequence[Money]]) -> None:
+    """
+    Назначение:
+        Сохранение сумм в компактный двоичный файл (11 байт на сумму)
+
+        Файл записывается во временный, сбрасывается на диск (fsync)
+        и атомарно заменяет старый.
+
+    Параметры:
+        filename (str): Путь к файлу
+        items (MoneyArray | Sequence[Money]): Сохраняемые суммы
+    """
+    records = _records(items)
+    header = _HEADER.pack(MAGIC, VERSION, RECORD.itemsize, len(records), zlib.crc32(records))
+    temporary = filename + '.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(header)
+        f.write(memoryview(records).cast('B'))
+        # Данные должны быть на диске до замены, иначе после сбоя питания
+        # на месте старого файла может оказаться пустой
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, filename)
+
+
+def _read_header(filename: str, data: Union[bytes, memoryview]) -> tuple:
+    """
+    Назначение:
+        Проверка заголовка: количество записей и контрольная сумма
+
+    Исключения:
+        ValueError: Если файл не в формате MNY1 или обрезан
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError(f"Файл {filename} не в формате MNY1")
+    magic, version, record_size, count, checksum = _HEADER.unpack_from(data)
+    if magic != MAGIC or record_size != RECORD.itemsize:
+        raise ValueError(f"Файл {filename} не в формате MNY1")
+    if version != VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата: {version}")
+    if len(data) < HEADER_SIZE + count * record_size:
+        raise ValueError(f"Файл {filename} обрезан")
+    return count, checksum
+
+
+def _currency(filename: str, raw: bytes) -> str:
+    """
+    Назначение:
+        Код валюты из трех байтов записи
+
+    Исключения:
+        ValueError: Если байты - не три заглавные латинские буквы
+    """
+    if len(raw) != 3 or not (raw.isalpha() and raw.isupper()):
+        raise ValueError(f"Файл {filename} содержит неверный код валюты: {raw!r}")
+    return currency_code(raw.decode('ascii'))
+
+
+def _check_amounts(filename: str, minor_units: numpy.ndarray) -> None:
+    """
+    Назначение:
+        Проверка, что суммы в записях неотрицательные
+
+    Исключения:
+        ValueError: При отрицательной сумме
+    """
+    if (minor_units < 0).any():
+        raise ValueError(f"Файл {filename} содержит отрицательную сумму")
+
+
+def _codes(filename: str, currencies: numpy.ndarray) -> numpy.ndarray:
+    """
+    Назначение:
+        Номера валют MoneyArray по массиву трехбайтовых кодов
+
+    Исключения:
+        ValueError: При неверном коде валюты
+    """
+    # Код валюты как целое число: уникальные значения ищутся сортировкой
+    # чисел, а не строк
+    raw = numpy.ascontiguousarray(currencies).view(numpy.uint8).reshape(-1, 3).astype(numpy.uint32)
+    keys = (raw[:, 0] << 16) | (raw[:, 1] << 8) | raw[:, 2]
+    unique, inverse = numpy.unique(keys, return_inverse=True)
+    lookup = numpy.array([currency_index(_currency(filename, bytes(
+                              ((key >> 16) & 255, (key >> 8) & 255, key & 255))))
+                          for key in unique.tolist()], dtype=numpy.uint16)
+    return lookup[inverse.reshape(-1)]
+
+
+class MoneyFile:
+    """
+    Двоичный файл сумм, отображенный в память
+
+    Описание:
+        Записи не загружаются в память целиком: minor_units и currencies -
+        представления NumPy поверх отображенного файла (без копирования),
+        а обращение по индексу читает одну запись. Суммы и коды валют
+        проверяются при чтении записей: отрицательная сумма или код
+        не из трех заглавных латинских букв вызывают ValueError.
+    """
+
+    def __init__(self, filename: str, verify: bool = True):
+        """
+        Назначение:
+            Открытие файла и проверка заголовка
+
+        Параметры:
+            filename (str): Путь к файлу
+            verify (bool): Проверить контрольную сумму всех записей
+
+        Исключения:
+            ValueError: При неверном формате или несовпадении контрольной суммы
+        """
+        self.filename = filename
+        size = os.path.getsize(filename)
+        raw = numpy.memmap(filename, dtype=numpy.uint8, mode='r') if size else b''
+        count, self.checksum = _read_header(filename, raw)
+        self._raw = raw
+        self.records = numpy.ndarray((count,), dtype=RECORD, buffer=raw, offset=HEADER_SIZE) \
+            if count else numpy.empty(0, dtype=RECORD)
+        self._minor_units = self.records['minor_units']
+        self._currencies = self.records['currency']
+        if verify and not self.verify():
+            raise ValueError(f"Контрольная сумма файла {filename} не совпадает")
+
+    def verify(self) -> bool:
+        """
+        Назначение:
+            Проверка контрольной суммы записей
+
+        Результат:
+            bool: True если записи не повреждены
+        """
+        return zlib.crc32(self.records) == self.checksum
+
+    @property
+    def minor_units(self) -> numpy.ndarray:
+        """
+        Назначение:
+            Суммы в минорных единицах (представление без копирования)
+        """
+        return self._minor_units
+
+    @property
+    def currencies(self) -> numpy.ndarray:
+        """
+        Назначение:
+            Трехбайтовые коды валют (представление без копирования)
+        """
+        return self._currencies
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index) -> Union[Money, MoneyArray]:
+        """
+        Назначение:
+            Чтение суммы по индексу или диапазона сумм по срезу
+
+        Результат:
+            Money или MoneyArray: Одна сумма или массив
+        """
+        if isinstance(index, (int, numpy.integer)):
+            minor_units = int(self._minor_units[index])
+            if minor_units < 0:
+                raise ValueError(f"Файл {self.filename} содержит отрицательную сумму")
+            return Money._from_valid(minor_units,
+                                     _currency(self.filename, bytes(self._currencies[index])))
+        part = self.records[index]
+        minor_units = part['minor_units'].copy()
+        _check_amounts(self.filename, minor_units)
+        return MoneyArray._from_valid(minor_units, _codes(self.filename, part['currency']))
+
+    def to_array(self) -> MoneyArray:
+        """
+        Назначение:
+            Загрузка всех сумм в MoneyArray
+        """
+        return self[:]
+
+    def close(self) -> None:
+        """
+        Назначение:
+            Освобождение отображения файла
+        """
+        self.records = numpy.empty(0, dtype=RECORD)
+        self._minor_units = self.records['minor_units']
+        self._currencies = self.records['currency']
+        self._raw = None
+
+    def __enter__(self) -> 'MoneyFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def load_binary(filename: str, verify: bool = True) -> MoneyArray:
+    """
+    Назначение:
+        Загрузка всех сумм из двоичного файла
+
+    Параметры:
+        filename (str): Путь к файлу
+        verify (bool): Проверить контрольную сумму
+
+    Результат:
+        MoneyArray: Суммы из файла
+    """
+    with MoneyFile(filename, verify) as money_file:
+        return money_file.to_array()
@@ -0,0 +1,196 @@
+from array import array
+from decimal import Decimal, InvalidOperation
+from typing import IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy
+
+from money import currency_exponent, decimal_to_minor_units
+from money_array import MoneyArray, currency_index
+
+# Порция потокового разбора в строках
+DEFAULT_CHUNK_SIZE = 65536
+
+# Наибольшее число цифр целой части (с тремя знаками дробной части сумма
+# остается в пределах int64)
+MAX_WHOLE_DIGITS = 15
+
+# Ошибка разбора: (номер строки с 1, исходная строка, описание)
+ParseError = Tuple[int, str, str]
+
+_BAD_FORMAT = "Некорректный формат строки"
+_TOO_LARGE = "Сумма слишком велика"
+
+# Граница int64 для сумм, разобранных через Decimal
+_INT64_LIMIT = 2 ** 63
+
+
+def _round_fraction(whole: str, fraction: str, exponent: int) -> int:
+    """
+    Назначение:
+        Перевод целой и дробной частей в минорные единицы
+
+        Лишние знаки дробной части округляются по десятичным цифрам
+        до ближайшего (половина - к четному), как в
+        money.decimal_to_minor_units и Money.from_string.
+    """
+    kept = fraction[:exponent]
+    minor_units = int(whole + kept + "0" * (exponent - len(kept)))
+    rest = fraction[exponent:]
+    if rest and (rest[0] > "5" or (rest[0] == "5" and (rest[1:].strip("0") or minor_units % 2))):
+        minor_units += 1
+    return minor_units
+
+
+def _parse_decimal(amount: str, exponent: int) -> Optional[int]:
+    """
+    Назначение:
+        Разбор остальных записей суммы так же, как в Money.from_string:
+        '.5', '5.', '+5', '1e3', '1_000'
+
+    Результат:
+        int | None: Минорные единицы или None, если запись не число
+            или сумма отрицательная
+
+    Исключения:
+        OverflowError: Если сумма не помещается в int64
+    """
+    try:
+        value = Decimal(amount)
+    except InvalidOperation:
+        return None
+    if value.is_nan() or (value.is_signed() and value):
+        return None
+    if value.is_infinite():
+        raise OverflowError(_TOO_LARGE)
+    try:
+        minor_units = decimal_to_minor_units(amount, exponent)
+    except ValueError:
+        raise OverflowError(_TOO_LARGE) from None
+    if minor_units >= _INT64_LIMIT:
+        raise OverflowError(_TOO_LARGE)
+    return minor_units
+
+
+def parse_many(lines: Iterable[str], first_line: int = 1) -> Tuple[MoneyArray, List[ParseError]]:
+    """
+    Назначение:
+        Разбор строк формата '100.00 USD' в массив сумм
+
+        Формат и округление те же, что у Money.from_string:
+        неотрицательное число в записи float и код валюты из трех
+        латинских букв, лишние знаки дробной части округляются по
+        десятичным цифрам (половина - к четному). Обычная запись (цифры
+        с необязательной дробной частью через точку) переводится
+        в минорные единицы напрямую из цифр строки, без исключений
+        и объекта Money на строку; остальные записи ('.5', '1e3' и т. п.)
+        разбираются через Decimal, как в from_string.
+        Ошибочные строки не прерывают разбор, а попадают в список
+        ошибок; пустые строки пропускаются.
+
+    Параметры:
+        lines (Iterable[str]): Строки (например, открытый файл)
+        first_line (int): Номер первой строки для списка ошибок
+
+    Результат:
+        Tuple[MoneyArray, List[ParseError]]: Разобранные суммы и ошибки
+            (номер строки, строка, описание)
+    """
+    minor_units = array('q')
+    codes = array('H')
+    errors: List[ParseError] = []
+    # Кэш по исходной записи валюты: (номер в реестре, множитель, число знаков)
+    currencies = {}
+    append_minor, append_code = minor_units.append, codes.append
+    for number, line in enumerate(lines, first_line):
+        parts = line.split()
+        if len(parts) == 2:
+            amount, currency = parts
+            known = currencies.get(currency)
+            if known is None and len(currency) == 3 and currency.isascii() and currency.isalpha():
+                exponent = currency_exponent(currency.upper())
+                known = currencies[currency] = (currency_index(currency), 10 ** exponent, exponent)
+            whole, _, fraction = amount.partition(".")
+            if (known is not None and whole.isdigit() and whole.isascii()
+                    and (not fraction or (fraction.isdigit() and fraction.isascii()))):
+                if len(whole.lstrip("0")) > MAX_WHOLE_DIGITS:
+                    errors.append((number, line.rstrip("\r\n"), _TOO_LARGE))
+                    continue
+                code, scale, exponent = known
+                if not fraction:
+                    append_minor(int(whole) * scale)
+                elif len(fraction) <= exponent:
+                    append_minor(int(whole) * scale + int(fraction) * 10 ** (exponent - len(fraction)))
+                else:
+                    append_minor(_round_fraction(whole, fraction, exponent))
+                append_code(code)
+                continue
+            if known is not None:
+                code, scale, exponent = known
+                try:
+                    value = _parse_decimal(amount, exponent)
+                except OverflowError:
+                    errors.append((number, line.rstrip("\r\n"), _TOO_LARGE))
+                    continue
+                if value is not None:
+                    append_minor(value)
+                    append_code(code)
+                    continue
+        if parts:
+            errors.append((number, line.rstrip("\r\n"), _BAD_FORMAT))
+    result = MoneyArray._from_valid(numpy.frombuffer(minor_units, dtype=numpy.int64).copy(),
+                                    numpy.frombuffer(codes, dtype=numpy.uint16).copy())
+    return result, errors
+
+
+def iter_parse(source: Union[str, IO[str], Iterable[str]],
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[MoneyArray, List[ParseError]]]:
+    """
+    Назначение:
+        Потоковый разбор файла любого размера порциями по chunk_size строк
+
+        В памяти одновременно находится только одна порция строк,
+        поэтому размер файла не ограничен.
+
+    Параметры:
+        source: Путь к файлу, открытый файл или итерируемые строки
+        chunk_size (int): Количество строк в порции
+
+    Результат:
+        Iterator: Пары (MoneyArray, ошибки) для каждой порции; номера
+            строк в ошибках сквозные
+    """
+    if isinstance(source, str):
+        with open(source, 'r', encoding='utf-8') as f:
+            yield from iter_parse(f, chunk_size)
+        return
+    lines = iter(source)
+    first_line = 1
+    while True:
+        chunk = [line for _, line in zip(range(chunk_size), lines)]
+        if not chunk:
+            return
+        yield parse_many(chunk, first_line)
+        first_line += len(chunk)
+
+
+def parse_file(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Tuple[MoneyArray, List[ParseError]]:
+    """
+    Назначение:
+        Разбор файла целиком: объединение результатов iter_parse
+
+    Параметры:
+        path (str): Путь к файлу
+        chunk_size (int): Количество строк в порции
+
+    Результат:
+        Tuple[MoneyArray, List[ParseError]]: Все суммы файла и ошибки
+    """
+    parts, errors = [], []
+    for values, chunk_errors in iter_parse(path, chunk_size):
+        parts.append(values)
+        errors.extend(chunk_errors)
+    if not parts:
+        return MoneyArray.from_minor([]), errors
+    return (MoneyArray._from_valid(numpy.concatenate([part.minor_units for part in parts]),
+                                   numpy.concatenate([part.codes for part in parts])),
+            errors)
@@ -0,0 +1,178 @@
+import threading
+from collections import deque
+from typing import Dict, Iterable, Optional, Sequence, Tuple, Union
+
+from money import Money, currency_code
+from money_array import MoneyArray
+
+
+class RateTable:
+    """
+    Таблица курсов валют с вычислением кросс-курсов
+
+    Описание:
+        Хранит заданные котировки (1 base = rate quote). Курс для пары без
+        прямой котировки вычисляется по кратчайшей цепочке котировок
+        (например, EUR -> USD -> JPY) и кэшируется. При изменении любой
+        котировки кэш производных курсов сбрасывается.
+    """
+
+    def __init__(self, rates: Union[Dict[Tuple[str, str], float],
+                                    Iterable[Tuple[str, str, float]], None] = None):
+        """
+        Назначение:
+            Создание таблицы и загрузка начальных котировок
+
+        Параметры:
+            rates: Словарь {(base, quote): курс} или тройки (base, quote, курс)
+        """
+        self._direct: Dict[Tuple[str, str], float] = {}
+        self._graph: Dict[str, Dict[str, float]] = {}
+        self._derived: Dict[Tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self.version = 0
+        if rates:
+            self.load(rates)
+
+    def load(self, rates: Union[Dict[Tuple[str, str], float],
+                                Iterable[Tuple[str, str, float]]]) -> None:
+        """
+        Назначение:
+            Загрузка набора котировок
+
+        Параметры:
+            rates: Словарь {(base, quote): курс} или тройки (base, quote, курс)
+        """
+        items = ((base, quote, rate) for (base, quote), rate in rates.items()) \
+            if isinstance(rates, dict) else rates
+        for base, quote, rate in items:
+            self.set_rate(base, quote, rate)
+
+    def set_rate(self, base: str, quote: str, rate: float) -> None:
+        """
+        Назначение:
+            Установка или обновление котировки (1 base = rate quote)
+
+            Обратный курс 1 / rate используется, пока для обратной пары
+            нет своей котировки.
+
+        Исключения:
+            ValueError: При неположительном курсе или одинаковых валютах
+        """
+        base, quote = currency_code(base), currency_code(quote)
+        if base is quote:
+            raise ValueError("Валюты котировки совпадают")
+        if not rate > 0:
+            raise ValueError("Курс должен быть положительным")
+        with self._lock:
+            self._direct[(base, quote)] = rate
+            self._graph.setdefault(base, {})[quote] = rate
+            if (quote, base) not in self._direct:
+                self._graph.setdefault(quote, {})[base] = 1 / rate
+            self._derived.clear()
+            self.version += 1
+
+    def rate(self, base: str, quote: str) -> float:
+        """
+        Назначение:
+            Курс пары с учетом кросс-курсов
+
+        Результат:
+            float: Сколько единиц quote стоит 1 единица base
+
+        Исключения:
+            ValueError: Если валюты не связаны котировками
+        """
+        base, quote = currency_code(base), currency_code(quote)
+        if base is quote:
+            return 1.0
+        key = (base, quote)
+        rate = self._derived.get(key)
+        if rate is not None:
+            return rate
+        with self._lock:
+            rate = self._derived.get(key)
+            if rate is None:
+                rate = self._triangulate(base, quote)
+                if rate is None:
+                    raise ValueError(f"Нет курса {base}/{quote}")
+                self._derived[key] = rate
+        return rate
+
+    def path(self, base: str, quote: str) -> Optional[Sequence[str]]:
+        """
+        Назначение:
+            Цепочка валют, по которой вычисляется курс пары
+
+        Результат:
+            Sequence[str] | None: Например ('EUR', 'USD', 'JPY') или None
+        """
+        base, quote = currency_code(base), currency_code(quote)
+        with self._lock:
+            return self._shortest_path(base, quote)
+
+    def convert(self, money: Money, target_currency: str) -> Money:
+        """
+        Назначение:
+            Конвертация одной суммы по курсу из таблицы
+        """
+        return money.convert_to(target_currency, self.rate(money.currency, target_currency))
+
+    def convert_many(self, items: Union[MoneyArray, Sequence[Money]],
+                     target_currency: str) -> MoneyArray:
+        """
+        Назначение:
+            Пакетная конвертация сумм в одну валюту
+
+            Курс ищется один раз для каждой валюты массива, а сама
+            конвертация выполняется одной векторной операцией.
+
+        Параметры:
+            items (MoneyArray | Sequence[Money]): Суммы в любых валютах
+            target_currency (str): Целевая валюта
+
+        Результат:
+            MoneyArray: Суммы в целевой валюте
+        """
+        array = items if isinstance(items, MoneyArray) else MoneyArray.from_money(items)
+        rates = {currency: self.rate(currency, target_currency)
+                 for currency in array.unique_currencies()}
+        return array.convert_to(target_currency, rates)
+
+    def _triangulate(self, base: str, quote: str) -> Optional[float]:
+        """
+        Назначение:
+            Произведение курсов по кратчайшей цепочке (под блокировкой)
+        """
+        path = self._shortest_path(base, quote)
+        if path is None:
+            return None
+        rate = 1.0
+        for current, following in zip(path, path[1:]):
+            rate *= self._graph[current][following]
+        return rate
+
+    def _shortest_path(self, base: str, quote: str) -> Optional[Sequence[str]]:
+        """
+        Назначение:
+            Поиск в ширину цепочки с наименьшим числом котировок (под блокировкой)
+        """
+        if base is quote:
+            return (base,)
+        if base not in self._graph:
+            return None
+        previous = {base: None}
+        queue = deque((base,))
+        while queue:
+            current = queue.popleft()
+            for neighbour in self._graph.get(current, ()):
+                if neighbour in previous:
+                    continue
+                previous[neighbour] = current
+                if neighbour is quote:
+                    path = [quote]
+                    while previous[path[-1]] is not None:
+                        path.append(previous[path[-1]])
+                    return tuple(reversed(path))
+                queue.append(neighbour)
+        return None
@@ -0,0 +1,77 @@
+import numpy
+import pytest
+
+from allocation import allocate, iter_allocate, iter_split
+from money import Money
+
+
+def _shares(parts):
+    return numpy.concatenate([part.minor_units for part in parts]).tolist()
+
+
+@pytest.mark.parametrize('weights', [
+    [1, 1, 1], [3, 2, 1], [0.5, 0.3, 0.2], [1, 0, 5, 0], [7] * 1000, [2 ** 30, 1, 3 ** 15],
+])
+@pytest.mark.parametrize('minor_units', [0, 1, 100, 99999, 10 ** 15])
+def test_allocate_keeps_total(weights, minor_units):
+    total = Money.from_minor(minor_units, 'EUR')
+    shares = allocate(total, weights)
+    assert int(shares.minor_units.sum()) == minor_units
+    assert shares.unique_currencies() in ([], ['EUR'])
+    quotas = minor_units * numpy.asarray(weights, dtype=float) / sum(weights)
+    assert (numpy.abs(shares.minor_units - quotas) < 1 + 1e-6 * quotas).all()
+
+
+def test_allocate_equal_parts_accepts_numpy_integers():
+    total = Money.from_minor(100)
+    assert allocate(total, numpy.int64(3)).minor_units.tolist() == [34, 33, 33]
+    assert allocate(total, 3).minor_units.tolist() == [34, 33, 33]
+    with pytest.raises(ValueError):
+        allocate(total, numpy.int64(0))
+
+
+def test_allocate_rejects_invalid_weights():
+    total = Money.from_minor(100)
+    for weights in ([], [-1, 2], [0, 0], [float('nan')], ['a']):
+        with pytest.raises(ValueError):
+            allocate(total, weights)
+
+
+def test_iter_split_matches_allocate():
+    total = Money.from_minor(1000003)
+    expected = allocate(total, 7).minor_units.tolist()
+    assert _shares(iter_split(total, numpy.int64(7), chunk_size=3)) == expected
+
+
+@pytest.mark.parametrize('chunk_size', [1, 4, 1000])
+def test_iter_allocate_keeps_total(chunk_size):
+    weights = [(i * 37) % 11 for i in range(100)]
+    total = Money.from_minor(123456789)
+    shares = _shares(iter_allocate(total, iter(weights), sum(weights), chunk_size=chunk_size))
+    assert sum(shares) == 123456789
+    quotas = numpy.array(weights) * 123456789 / sum(weights)
+    assert (numpy.abs(numpy.array(shares) - quotas) < 1).all()
+
+
+def test_iter_allocate_rejects_fractional_weights():
+    total = Money.from_minor(100)
+    with pytest.raises(ValueError, match='целыми'):
+        list(iter_allocate(total, [1.5, 1.5], 3))
+    with pytest.raises(ValueError):
+        list(iter_allocate(total, [1, 2], 4))
+    with pytest.raises(ValueError):
+        list(iter_allocate(total, [1, -1, 3], 3))
+
+
+@pytest.mark.parametrize('total_weight_scale', [10 ** 9, 10 ** 12, 2 ** 52])
+def test_iter_allocate_accepts_large_total_weight(total_weight_scale):
+    rng = numpy.random.default_rng(0)
+    weights = (rng.integers(1, 1000, 2000) * (total_weight_scale // 1000)).tolist()
+    total_weight = sum(weights)
+    minor_units = 10 ** 15 + 987654321
+    shares = _shares(iter_allocate(Money.from_minor(minor_units), iter(weights),
+                                   total_weight, chunk_size=300))
+    assert sum(shares) == minor_units
+    for share, weight in zip(shares, weights):
+        # |доля - квота| < 1, квота = minor_units * weight / total_weight
+        assert abs(share * total_weight - minor_units * weight) < total_weight
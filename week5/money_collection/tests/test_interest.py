@@ -0,0 +1,51 @@
+import numpy
+import pytest
+
+from interest import ROUNDING_FINAL, compound, schedule
+from money import Money
+from money_array import MoneyArray
+
+
+def _chain(money, percent, periods):
+    balances = [money]
+    for _ in range(periods):
+        balances.append(balances[-1].apply_interest(percent))
+    return balances
+
+
+@pytest.mark.parametrize('minor_units', [0, 1, 12345, 10 ** 12, 2 ** 53 + 1, 2 ** 58 + 12345])
+@pytest.mark.parametrize('percent', [0.5, 1.0 / 3, -2.5])
+def test_period_rounding_matches_apply_interest(minor_units, percent):
+    money = Money.from_minor(minor_units, 'USD')
+    expected = _chain(money, percent, 12)
+    result = schedule(money, percent, 12)
+    assert [result.balance(period)[0] for period in range(13)] == expected
+    assert compound(money, percent, 12)[0] == expected[-1]
+    assert compound(money, percent, 0)[0] == money
+
+
+def test_schedule_for_many_amounts():
+    principals = MoneyArray.from_minor([100, 5000, 999999], ['USD', 'EUR', 'JPY'])
+    result = schedule(principals, numpy.array([1.0, 2.0, 3.0]), 24)
+    assert result.periods == 24 and len(result) == 3
+    for index, item in enumerate(principals.to_money()):
+        assert result.row(index).to_money() == _chain(item, [1.0, 2.0, 3.0][index], 24)
+    assert (result.total_interest == result.interest.sum(axis=0)).all()
+
+
+def test_final_rounding_uses_closed_formula():
+    money = Money.from_minor(10 ** 6)
+    assert compound(money, 1.0, 10, ROUNDING_FINAL).minor_units.tolist() == \
+        [round(10 ** 6 * 1.01 ** 10)]
+
+
+def test_invalid_parameters():
+    money = Money.from_minor(100)
+    with pytest.raises(ValueError):
+        compound(money, -101, 1)
+    with pytest.raises(ValueError):
+        compound(money, 1, -1)
+    with pytest.raises(ValueError):
+        compound(money, 1, 1, rounding='daily')
+    with pytest.raises(ValueError):
+        compound(Money.from_minor(2 ** 62), 100, 2)
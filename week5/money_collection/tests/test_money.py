@@ -0,0 +1,65 @@
+import json
+import pickle
+
+import numpy
+import pytest
+
+from money import Money
+
+
+def test_load_returns_new_money(tmp_path):
+    path = tmp_path / 'money.json'
+    Money(12.34, 'eur').save(path)
+    original = Money(1, 'USD')
+    lookup = {original: 'исходная'}
+    loaded = Money.load(path)
+    assert loaded == Money.from_minor(1234, 'EUR')
+    assert original == Money(1, 'USD') and lookup[original] == 'исходная'
+
+
+def test_load_rejects_negative_amount(tmp_path):
+    path = tmp_path / 'money.json'
+    path.write_text(json.dumps({'amount': -1, 'currency': 'USD'}))
+    with pytest.raises(ValueError):
+        Money.load(path)
+
+
+@pytest.mark.parametrize('other', [0, 1.5, 'USD', None])
+def test_operations_with_foreign_types(other):
+    money = Money(1, 'USD')
+    assert money != other
+    for compare in ('__lt__', '__le__', '__gt__', '__ge__', '__add__', '__sub__'):
+        assert getattr(money, compare)(other) is NotImplemented
+    with pytest.raises(TypeError):
+        money < other
+    with pytest.raises(TypeError):
+        money + other
+
+
+def test_comparisons_require_same_currency():
+    assert Money(1, 'USD') < Money(2, 'usd') <= Money(2, 'USD')
+    with pytest.raises(ValueError):
+        Money(1, 'USD') < Money(2, 'EUR')
+
+
+def test_from_minor_requires_integers():
+    assert Money.from_minor(numpy.int64(5), 'JPY') == Money(5, 'JPY')
+    for value in (1.5, 2.0, '3'):
+        with pytest.raises(ValueError):
+            Money.from_minor(value)
+    with pytest.raises(ValueError):
+        Money.from_minor(-1)
+
+
+def test_money_is_immutable_and_hashable():
+    money = Money(10.05, 'USD')
+    with pytest.raises(AttributeError):
+        money.minor_units = 0
+    assert pickle.loads(pickle.dumps(money)) == money
+    assert len({money, Money.from_minor(1005, 'usd')}) == 1
+
+
+def test_split_keeps_total():
+    parts = Money(100, 'USD').split(3)
+    assert [part.minor_units for part in parts] == [3334, 3333, 3333]
+    assert sum(part.minor_units for part in parts) == 10000
@@ -0,0 +1,65 @@
+import numpy
+import pytest
+
+from money import Money
+from money_array import MoneyArray
+
+
+def test_convert_to_registers_new_currencies_first():
+    # Валюта XAD впервые встречается в словаре курсов
+    array = MoneyArray([1, 2], ['XAA', 'XAB'])
+    converted = array.convert_to('XAC', {'XAD': 3.0, 'xab': 2.0, 'XAA': 1.5})
+    assert converted.minor_units.tolist() == [150, 400]
+    assert converted.unique_currencies() == ['XAC']
+
+
+def test_convert_to_after_registering_currencies():
+    array = MoneyArray([10, 20], ['GBP', 'USD'])
+    converted = array.convert_to('USD', {'GBP': 1.3, 'USD': 1.0})
+    assert converted.minor_units.tolist() == [1300, 2000]
+
+
+def test_convert_to_reports_missing_currencies():
+    array = MoneyArray([1, 1, 1], ['EUR', 'GBP', 'USD'])
+    with pytest.raises(ValueError, match='EUR, GBP'):
+        array.convert_to('USD', {})
+
+
+@pytest.mark.parametrize('rate', [-1.0, float('nan'), float('inf')])
+def test_convert_to_rejects_invalid_rates(rate):
+    array = MoneyArray([1, 1], ['EUR', 'USD'])
+    with pytest.raises(ValueError):
+        array.convert_to('USD', {'EUR': rate})
+    with pytest.raises(ValueError):
+        array.convert_to('USD', rate)
+
+
+def test_sum_of_arrays_and_money_on_the_left():
+    array = MoneyArray.from_minor([1, 2, 3])
+    assert sum([array, array]).minor_units.tolist() == [2, 4, 6]
+    assert (Money.from_minor(10) + array).minor_units.tolist() == [11, 12, 13]
+    with pytest.raises(TypeError):
+        array + 1
+    with pytest.raises(TypeError):
+        'x' + array
+
+
+def test_int64_overflow_is_reported():
+    big = MoneyArray.from_minor([2 ** 62])
+    with pytest.raises(ValueError):
+        big + big
+    with pytest.raises(ValueError):
+        big.convert_to('EUR', 4.0)
+    with pytest.raises(ValueError):
+        big.apply_interest(300)
+    with pytest.raises(ValueError):
+        MoneyArray.from_minor([2 ** 62, 2 ** 62]).sum()
+    with pytest.raises(ValueError):
+        MoneyArray([1e18])
+
+
+def test_sum_by_currency():
+    array = MoneyArray.from_minor(numpy.arange(6), ['USD', 'EUR'] * 3)
+    totals = array.sum()
+    assert totals['USD'] == Money.from_minor(6, 'USD')
+    assert totals['EUR'] == Money.from_minor(9, 'EUR')
@@ -0,0 +1,57 @@
+import pickle
+
+import pytest
+
+from money import Money
+from money_array import MoneyArray
+from money_bag import MoneyBag
+from rates import RateTable
+
+
+@pytest.fixture
+def bag():
+    return MoneyBag([Money(10, 'USD'), Money(5, 'EUR'), Money(2.5, 'usd'), Money(300, 'JPY')])
+
+
+def test_add_and_lookup(bag):
+    assert bag['usd'] == Money(12.5, 'USD')
+    assert 'eur' in bag and 'GBP' not in bag
+    assert sorted(bag.currencies()) == ['EUR', 'JPY', 'USD']
+    with pytest.raises(KeyError):
+        bag['GBP']
+
+
+def test_merge_matches_single_bag(bag):
+    first = MoneyBag([Money(1, 'USD'), Money(2, 'GBP')])
+    second = MoneyBag(MoneyArray([3, 4], ['GBP', 'EUR']))
+    merged = MoneyBag.merged([bag, first, second])
+    assert merged == MoneyBag(list(bag) + list(first) + list(second))
+    assert merged['GBP'] == Money(5, 'GBP')
+    assert pickle.loads(pickle.dumps(merged)) == merged
+    combined = MoneyBag()
+    combined += bag
+    combined += Money(1, 'USD')
+    assert combined['USD'] == Money(13.5, 'USD')
+    assert bag['USD'] == Money(12.5, 'USD')
+
+
+def test_total_normalizes_mapping_keys(bag):
+    total = bag.total('usd', {'eur': 1.1, 'Jpy': 0.0067})
+    assert total == Money.from_minor(1250 + 550 + 201, 'USD')
+
+
+def test_total_reports_all_missing_currencies(bag):
+    with pytest.raises(ValueError, match='EUR, JPY'):
+        bag.total('USD', {})
+    with pytest.raises(ValueError, match='EUR, JPY'):
+        bag.total('USD')
+    with pytest.raises(ValueError, match='EUR, JPY'):
+        bag.total('USD', RateTable({('GBP', 'USD'): 1.3}))
+
+
+def test_total_with_rate_table(bag):
+    table = RateTable({('EUR', 'USD'): 1.1, ('USD', 'JPY'): 150})
+    total = bag.total('USD', table)
+    expected = (Money(12.5, 'USD') + Money(5, 'EUR').convert_to('USD', 1.1)
+                + Money(300, 'JPY').convert_to('USD', table.rate('JPY', 'USD')))
+    assert total == expected
@@ -0,0 +1,106 @@
+import os
+import zlib
+
+import numpy
+import pytest
+
+from money import Money
+from MoneyCollection import MoneyCollection
+from money_array import MoneyArray
+from money_binary import HEADER_SIZE, RECORD, MoneyFile, load_binary, save_binary
+
+
+@pytest.fixture
+def amounts():
+    return MoneyArray.from_minor([0, 1, 12345, 2 ** 62], ['USD', 'JPY', 'KWD', 'EUR'])
+
+
+def _rewrite(path, change):
+    """Изменение записей файла с пересчетом контрольной суммы"""
+    data = bytearray(path.read_bytes())
+    records = numpy.frombuffer(data, dtype=RECORD, offset=HEADER_SIZE).copy()
+    change(records)
+    data[HEADER_SIZE:] = records.tobytes()
+    data[HEADER_SIZE - 4:HEADER_SIZE] = zlib.crc32(records).to_bytes(4, 'little')
+    path.write_bytes(bytes(data))
+
+
+def test_round_trip(tmp_path, amounts):
+    path = tmp_path / 'money.mny'
+    save_binary(str(path), amounts)
+    assert os.path.getsize(path) == HEADER_SIZE + 11 * len(amounts)
+    assert not (tmp_path / 'money.mny.tmp').exists()
+    loaded = load_binary(str(path))
+    assert loaded.to_money() == amounts.to_money()
+    with MoneyFile(str(path)) as money_file:
+        assert money_file[2] == Money.from_minor(12345, 'KWD')
+        assert money_file[1:3].to_money() == amounts[1:3].to_money()
+
+
+def test_round_trip_empty_and_collection(tmp_path):
+    path = str(tmp_path / 'money.mny')
+    save_binary(path, [])
+    assert len(load_binary(path)) == 0
+    collection = MoneyCollection()
+    collection.add(Money(1.5, 'usd'))
+    collection.add(Money(7, 'JPY'))
+    collection.save_binary(path)
+    restored = MoneyCollection()
+    restored.load_binary(path)
+    assert [str(item) for item in restored] == ['1.50 USD', '7 JPY']
+
+
+def test_rejects_corrupted_records(tmp_path, amounts):
+    path = tmp_path / 'money.mny'
+    save_binary(str(path), amounts)
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match='Контрольная сумма'):
+        load_binary(str(path))
+
+
+def test_rejects_truncated_and_foreign_files(tmp_path, amounts):
+    path = tmp_path / 'money.mny'
+    save_binary(str(path), amounts)
+    path.write_bytes(path.read_bytes()[:-5])
+    with pytest.raises(ValueError, match='обрезан'):
+        load_binary(str(path))
+    path.write_bytes(b'{"amount": 1}')
+    with pytest.raises(ValueError, match='MNY1'):
+        load_binary(str(path))
+    path.write_bytes(b'')
+    with pytest.raises(ValueError, match='MNY1'):
+        load_binary(str(path))
+
+
+def test_rejects_negative_amounts(tmp_path, amounts):
+    path = tmp_path / 'money.mny'
+    save_binary(str(path), amounts)
+
+    def negate(records):
+        records['minor_units'][1] = -5
+
+    _rewrite(path, negate)
+    with pytest.raises(ValueError, match='отрицательную'):
+        load_binary(str(path))
+    with MoneyFile(str(path)) as money_file:
+        assert money_file[0] == Money.from_minor(0, 'USD')
+        with pytest.raises(ValueError):
+            money_file[1]
+
+
+@pytest.mark.parametrize('code', [b'U$D', b'usd', b'US\x00', b'\xff\xfe\xfd'])
+def test_rejects_invalid_currency_codes(tmp_path, amounts, code):
+    path = tmp_path / 'money.mny'
+    save_binary(str(path), amounts)
+
+    def corrupt(records):
+        records['currency'][3] = code
+
+    _rewrite(path, corrupt)
+    with pytest.raises(ValueError, match='код валюты'):
+        load_binary(str(path))
+    with MoneyFile(str(path)) as money_file:
+        with pytest.raises(ValueError, match='код валюты'):
+            money_file[3]
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from money import Money
+from money_parser import parse_file, parse_many
+
+
+@pytest.mark.parametrize('line', [
+    '100.00 USD', '.5 USD', '5. eur', '+7 JPY', '1e3 USD', '1_000.25 KWD',
+    '0.125 USD', '12 usd', '  3.5   GBP  ', '0000000000000000001 USD', '79278.225 USD',
+    '72813.775 USD', '1.015 USD', '.125e1 USD', '0.0000001 USD',
+])
+def test_parse_many_matches_from_string(line):
+    values, errors = parse_many([line])
+    assert errors == []
+    assert values.to_money() == [Money.from_string(line)]
+
+
+@pytest.mark.parametrize('line', [
+    '-1 USD', 'nan USD', 'abc USD', '1 US', '1 U$D', '1 USD extra', '1,5 USD', '1 ÄBC',
+])
+def test_parse_many_rejects_what_from_string_rejects(line):
+    values, errors = parse_many([line])
+    assert len(values) == 0
+    assert [error[0] for error in errors] == [1]
+    with pytest.raises(ValueError):
+        Money.from_string(line)
+
+
+def test_parse_many_reports_too_large_amounts():
+    _, errors = parse_many(['1' * 20 + ' USD', 'inf USD', '1e30 USD'])
+    assert [error[2] for error in errors] == ['Сумма слишком велика'] * 3
+
+
+def test_parse_file_numbers_lines_across_chunks(tmp_path):
+    path = tmp_path / 'amounts.txt'
+    path.write_text('1 USD\n\nbad\n.25 EUR\n2.505 USD\n', encoding='utf-8')
+    values, errors = parse_file(str(path), chunk_size=2)
+    assert [str(item) for item in values.to_money()] == ['1.00 USD', '0.25 EUR', '2.50 USD']
+    assert errors == [(3, 'bad', 'Некорректный формат строки')]
+
+
+def test_parse_many_rounds_like_from_string_on_half_way_cases():
+    rng = random.Random(0)
+    lines = []
+    for _ in range(20000):
+        currency, digits = rng.choice([('USD', 3), ('USD', 4), ('JPY', 1), ('KWD', 4)])
+        fraction = str(rng.randrange(10 ** (digits - 1))).zfill(digits - 1) + '5'
+        if rng.random() < 0.5:
+            fraction = fraction[:-1] + rng.choice('05') + '0' * rng.randrange(3)
+        lines.append(f"{rng.randrange(10 ** rng.randrange(1, 13))}.{fraction} {currency}")
+    values, errors = parse_many(lines)
+    assert errors == []
+    expected = [Money.from_string(line) for line in lines]
+    assert values.to_money() == expected
+    dotted, _ = parse_many(['.' + line.split('.', 1)[1] for line in lines])
+    assert dotted.to_money() == [Money.from_string('.' + line.split('.', 1)[1]) for line in lines]
+
+
+def test_leading_zeros_do_not_count_as_digits():
+    values, errors = parse_many(['0' * 30 + '5.5 USD'])
+    assert errors == [] and values.to_money() == [Money.from_minor(550)]